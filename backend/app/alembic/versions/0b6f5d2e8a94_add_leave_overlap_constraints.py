@@ -0,0 +1,76 @@
+"""Reject overlapping active leave requests and add wfh_requests
+
+Revision ID: 0b6f5d2e8a94
+Revises: e4a9c3b81f07
+Create Date: 2026-10-18 18:05:51.630472
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0b6f5d2e8a94"
+down_revision = "e4a9c3b81f07"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # btree_gist lets the GiST index take the plain integer user_id next to the date range
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    # Fails if overlapping active requests are already stored; withdraw or cancel those first
+    op.execute(
+        "ALTER TABLE leave_requests ADD CONSTRAINT excl_leave_requests_user_dates "
+        "EXCLUDE USING gist (user_id WITH =, daterange(start_date, end_date, '[]') WITH &&) "
+        "WHERE (status IN ('pending', 'approved'))"
+    )
+
+    op.create_table(
+        "wfh_requests",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("request_date", sa.Date(), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("supervisor_id", sa.Integer(), nullable=True),
+        sa.Column("approved_rejected_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("approved_rejected_by", sa.Integer(), nullable=True),
+        sa.Column("comments", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.CheckConstraint(
+            "status IN ('pending', 'approved', 'rejected', 'withdrawn', 'cancelled')",
+            name="check_wfh_request_status",
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["supervisor_id"], ["users.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(
+            ["approved_rejected_by"], ["users.id"], ondelete="SET NULL"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_wfh_requests_user_date_active",
+        "wfh_requests",
+        ["user_id", "request_date"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('pending', 'approved')"),
+    )
+
+
+def downgrade():
+    op.drop_index("uq_wfh_requests_user_date_active", table_name="wfh_requests")
+    op.drop_table("wfh_requests")
+    op.drop_constraint("excl_leave_requests_user_dates", "leave_requests")
+    # btree_gist is left installed, other objects may use it
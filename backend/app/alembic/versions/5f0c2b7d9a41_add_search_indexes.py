@@ -0,0 +1,67 @@
+"""Add trigram and full-text search indexes on users and departments
+
+Revision ID: 5f0c2b7d9a41
+Revises: 1a31ce608336
+Create Date: 2026-10-18 10:12:40.118203
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "5f0c2b7d9a41"
+down_revision = "1a31ce608336"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTORS = {
+    "users": "to_tsvector('simple', coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || coalesce(email, ''))",
+    "departments": "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(code, '') || ' ' || coalesce(description, ''))",
+}
+
+TRIGRAM_COLUMNS = {
+    "users": ["first_name", "last_name", "email"],
+    "departments": ["name", "code", "description"],
+}
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, expression in SEARCH_VECTORS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+            ),
+        )
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            ["search_vector"],
+            postgresql_using="gin",
+        )
+
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.create_index(
+                f"ix_{table}_{column}_trgm",
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+
+def downgrade():
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.drop_index(f"ix_{table}_{column}_trgm", table_name=table)
+
+    for table in SEARCH_VECTORS:
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,96 @@
+"""Add supervisors and partial indexes for the approval inbox
+
+Revision ID: 6d2a8f1c4b37
+Revises: 0b6f5d2e8a94
+Create Date: 2026-10-18 20:21:36.904512
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6d2a8f1c4b37"
+down_revision = "0b6f5d2e8a94"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("users", sa.Column("supervisor_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "users_supervisor_id_fkey",
+        "users",
+        "users",
+        ["supervisor_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index("ix_users_supervisor_id", "users", ["supervisor_id"])
+
+    op.add_column(
+        "leave_requests", sa.Column("supervisor_id", sa.Integer(), nullable=True)
+    )
+    op.create_foreign_key(
+        "leave_requests_supervisor_id_fkey",
+        "leave_requests",
+        "users",
+        ["supervisor_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+    # Keyset pagination orders by created_at, which has always been filled by its server default
+    op.alter_column(
+        "leave_requests",
+        "created_at",
+        existing_type=sa.DateTime(timezone=True),
+        nullable=False,
+    )
+    op.alter_column(
+        "wfh_requests",
+        "created_at",
+        existing_type=sa.DateTime(timezone=True),
+        nullable=False,
+    )
+
+    # Only pending rows are indexed: the inbox reads a supervisor's queue in created_at
+    # order, whatever the number of reports and however much history piles up
+    op.create_index(
+        "ix_leave_requests_pending_inbox",
+        "leave_requests",
+        ["supervisor_id", "created_at", "id"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_wfh_requests_pending_inbox",
+        "wfh_requests",
+        ["supervisor_id", "created_at", "id"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_wfh_requests_pending_inbox", table_name="wfh_requests")
+    op.drop_index("ix_leave_requests_pending_inbox", table_name="leave_requests")
+    op.alter_column(
+        "wfh_requests",
+        "created_at",
+        existing_type=sa.DateTime(timezone=True),
+        nullable=True,
+    )
+    op.alter_column(
+        "leave_requests",
+        "created_at",
+        existing_type=sa.DateTime(timezone=True),
+        nullable=True,
+    )
+
+    op.drop_constraint(
+        "leave_requests_supervisor_id_fkey", "leave_requests", type_="foreignkey"
+    )
+    op.drop_column("leave_requests", "supervisor_id")
+
+    op.drop_index("ix_users_supervisor_id", table_name="users")
+    op.drop_constraint("users_supervisor_id_fkey", "users", type_="foreignkey")
+    op.drop_column("users", "supervisor_id")
@@ -0,0 +1,41 @@
+"""Add rate_limit_buckets for the shared login rate limiter
+
+Revision ID: 8b3e41c6d0f2
+Revises: 5f0c2b7d9a41
+Create Date: 2026-10-18 14:03:27.540916
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8b3e41c6d0f2"
+down_revision = "5f0c2b7d9a41"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("key", sa.String(length=255), nullable=False),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("allowed", sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    # For pruning idle buckets
+    op.create_index(
+        "ix_rate_limit_buckets_updated_at", "rate_limit_buckets", ["updated_at"]
+    )
+
+
+def downgrade():
+    op.drop_index("ix_rate_limit_buckets_updated_at", table_name="rate_limit_buckets")
+    op.drop_table("rate_limit_buckets")
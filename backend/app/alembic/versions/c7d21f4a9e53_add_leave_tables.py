@@ -0,0 +1,136 @@
+"""Add leave_types, leave_requests and employee_leave_balance
+
+Revision ID: c7d21f4a9e53
+Revises: 8b3e41c6d0f2
+Create Date: 2026-10-18 15:12:44.208731
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c7d21f4a9e53"
+down_revision = "8b3e41c6d0f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "leave_types",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("code", sa.String(length=20), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("max_days_per_year", sa.Integer(), nullable=False),
+        sa.Column("can_carry_forward", sa.Boolean(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("code"),
+    )
+    op.create_table(
+        "leave_requests",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("leave_type_id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=True),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("number_of_days", sa.Numeric(precision=6, scale=1), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("comments", sa.Text(), nullable=True),
+        sa.Column("approved_rejected_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("approved_rejected_by", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.CheckConstraint(
+            "status IN ('pending', 'approved', 'rejected', 'withdrawn', 'cancelled')",
+            name="check_leave_request_status",
+        ),
+        sa.CheckConstraint("end_date >= start_date", name="check_leave_request_dates"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["leave_type_id"], ["leave_types.id"]),
+        sa.ForeignKeyConstraint(
+            ["approved_rejected_by"], ["users.id"], ondelete="SET NULL"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_leave_requests_user_id_start_date",
+        "leave_requests",
+        ["user_id", "start_date"],
+    )
+    op.create_table(
+        "employee_leave_balance",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("employee_id", sa.Integer(), nullable=False),
+        sa.Column("leave_type_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("total_days", sa.Numeric(precision=6, scale=1), nullable=False),
+        sa.Column(
+            "used_days",
+            sa.Numeric(precision=6, scale=1),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column(
+            "carried_forward_days",
+            sa.Numeric(precision=6, scale=1),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column("carry_forward_expiry_date", sa.Date(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["employee_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["leave_type_id"], ["leave_types.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        # Also the index behind balance lookups and the row lock taken on approval
+        sa.UniqueConstraint(
+            "employee_id",
+            "leave_type_id",
+            "year",
+            name="uq_employee_leave_balance_employee_type_year",
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("employee_leave_balance")
+    op.drop_index("ix_leave_requests_user_id_start_date", table_name="leave_requests")
+    op.drop_table("leave_requests")
+    op.drop_table("leave_types")
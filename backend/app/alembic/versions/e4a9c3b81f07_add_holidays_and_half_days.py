@@ -0,0 +1,88 @@
+"""Add holidays, users.department_id and half-day flags on leave_requests
+
+Revision ID: e4a9c3b81f07
+Revises: c7d21f4a9e53
+Create Date: 2026-10-18 16:40:09.118263
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e4a9c3b81f07"
+down_revision = "c7d21f4a9e53"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "holidays",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("department_id", sa.Integer(), nullable=True),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("is_half_day", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["department_id"], ["departments.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_holidays_department_date",
+        "holidays",
+        ["department_id", "date"],
+        unique=True,
+        postgresql_where=sa.text("department_id IS NOT NULL"),
+    )
+    op.create_index(
+        "uq_holidays_company_date",
+        "holidays",
+        ["date"],
+        unique=True,
+        postgresql_where=sa.text("department_id IS NULL"),
+    )
+
+    op.add_column("users", sa.Column("department_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "users_department_id_fkey",
+        "users",
+        "departments",
+        ["department_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index("ix_users_department_id", "users", ["department_id"])
+
+    op.add_column(
+        "leave_requests",
+        sa.Column(
+            "start_half_day", sa.Boolean(), server_default=sa.false(), nullable=False
+        ),
+    )
+    op.add_column(
+        "leave_requests",
+        sa.Column(
+            "end_half_day", sa.Boolean(), server_default=sa.false(), nullable=False
+        ),
+    )
+
+
+def downgrade():
+    op.drop_column("leave_requests", "end_half_day")
+    op.drop_column("leave_requests", "start_half_day")
+
+    op.drop_index("ix_users_department_id", table_name="users")
+    op.drop_constraint("users_department_id_fkey", "users", type_="foreignkey")
+    op.drop_column("users", "department_id")
+
+    op.drop_index("uq_holidays_company_date", table_name="holidays")
+    op.drop_index("uq_holidays_department_date", table_name="holidays")
+    op.drop_table("holidays")
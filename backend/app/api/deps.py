@@ -1,21 +1,26 @@
+import hashlib
+import time
 from collections.abc import AsyncGenerator, Generator
-from typing import Annotated
+from typing import Annotated, Any, Optional
 
-from app.repository.user_repository import UserRepository
-from app.services.user_service import UserService
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.core import security
+from app.core.cache import LRUCache
 from app.core.config import settings
-from app.core.db import engine
-from app.models import TokenPayload
+from app.core.db import database
+from app.core.exceptions import AuthError
 from app.model.user_model import User
-from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import TokenPayload
+from app.repository.user_repository import UserRepository, user_cache
+from app.services.user_service import UserService
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
@@ -23,34 +28,93 @@ reusable_oauth2 = OAuth2PasswordBearer(
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSession(engine) as session:
+    # Same engine as the repositories; inside a request this is the request's session
+    async with database.session() as session:
         yield session
 
-SessionDep = Annotated[Session, Depends(get_db)]
+SessionDep = Annotated[AsyncSession, Depends(get_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
+# Verified tokens, by sha256 digest: a client sends the same token with every request
+token_cache: LRUCache[bytes, tuple[TokenPayload, float | None]] = LRUCache(maxsize=settings.TOKEN_CACHE_SIZE)
+
+
+def decode_token(token: str) -> TokenPayload:
+    """Verify and decode an access token, reusing the result until the token expires"""
+    key = hashlib.sha256(token.encode()).digest()
+    cached = token_cache.get(key)
+    if cached is not None:
+        token_data, expires_at = cached
+        if expires_at is None or expires_at > time.time():
+            return token_data
+    payload = jwt.decode(
+        token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
+    )
+    token_data = TokenPayload(**payload)
+    expires_at = payload.get("exp")
+    ttl = settings.TOKEN_CACHE_TTL_SECONDS
+    if expires_at is not None:
+        ttl = min(ttl, expires_at - time.time())
+    token_cache.set(key, (token_data, expires_at), ttl=ttl)
+    return token_data
+
+
 async def get_current_user(session: SessionDep, token: TokenDep) -> User:
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
+        token_data = decode_token(token)
     except (InvalidTokenError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
+    snapshot = user_cache.get(token_data.sub)
+    if snapshot is not None:
+        return await _restore_user(session, snapshot)
     user = await session.get(User, token_data.sub)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+    user_cache.set(token_data.sub, _snapshot_user(user))
     return user
 
 
+def _snapshot_user(user: User) -> dict:
+    """The loaded column values of `user`; safe to share between requests"""
+    loaded = inspect(user).dict
+    return {attr.key: loaded[attr.key] for attr in inspect(User).column_attrs if attr.key in loaded}
+
+
+async def _restore_user(session: AsyncSession, snapshot: dict) -> User:
+    # A persistent, clean User in this request's session, as session.get would give, without the query
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return await session.merge(user, load=False)
+
+
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
 
+def is_admin(user: User) -> bool:
+    """Admins and superusers act on any employee's records"""
+    return user.is_superuser or user.role in ("admin", "superAdmin")
+
+
+def authorize_request_action(user: User, request: Any, action: str) -> None:
+    """
+    Approving and rejecting a leave or WFH request is for its supervisor and admins,
+    never for its owner; withdrawing and cancelling for them and the owner.
+    """
+    if action in ("approve", "reject"):
+        if request.user_id == user.id:
+            raise AuthError(detail=f"Cannot {action} your own request")
+        allowed = request.supervisor_id == user.id or is_admin(user)
+    else:
+        allowed = user.id in (request.user_id, request.supervisor_id) or is_admin(user)
+    if not allowed:
+        raise AuthError(detail="The user doesn't have enough privileges")
+
+
 async def get_current_active_superuser(current_user: CurrentUser) -> User:
     if not current_user.is_superuser:
         raise HTTPException(
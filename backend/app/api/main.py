@@ -1,7 +1,14 @@
-from app.api.routes.v1.endpoints import login, users, departments
 from fastapi import APIRouter
 
 from app.api.routes import items, private, utils
+from app.api.routes.v1.endpoints import (
+    approvals,
+    departments,
+    leaves,
+    login,
+    users,
+    wfh,
+)
 from app.core.config import settings
 
 api_router = APIRouter()
@@ -10,6 +17,9 @@ api_router.include_router(users.router)
 api_router.include_router(utils.router)
 api_router.include_router(items.router)
 api_router.include_router(departments.router)
+api_router.include_router(leaves.router)
+api_router.include_router(wfh.router)
+api_router.include_router(approvals.router)
 
 
 if settings.ENVIRONMENT == "local":
@@ -4,16 +4,15 @@ from fastapi import APIRouter
 from pydantic import BaseModel
 
 from app.api.deps import SessionDep
-from app.core.security import get_password_hash
+from app.core.security import password_hasher
+
 # from app.models import (
 #     User,
 #     UserPublic,
 # )
-
 from app.model.user_model import User
 from app.schema.user_schema import UserPublic
 
-
 router = APIRouter(tags=["private"], prefix="/private")
 
 
@@ -26,7 +25,7 @@ class PrivateUserCreate(BaseModel):
 
 
 @router.post("/users/", response_model=UserPublic)
-def create_user(user_in: PrivateUserCreate, session: SessionDep) -> Any:
+async def create_user(user_in: PrivateUserCreate, session: SessionDep) -> Any:
     """
     Create a new user.
     """
@@ -35,10 +34,12 @@ def create_user(user_in: PrivateUserCreate, session: SessionDep) -> Any:
         email=user_in.email,
         first_name=user_in.first_name,
         last_name=user_in.last_name,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await password_hasher.hash(user_in.password),
     )
 
     session.add(user)
-    session.commit()
+    # Committed with the rest of the request
+    await session.flush()
+    await session.refresh(user)
 
     return user
@@ -1,8 +1,17 @@
+from typing import Any
+
+from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends
 from pydantic.networks import EmailStr
 
-from app.api.deps import get_current_active_superuser
+from app.api.deps import get_current_active_superuser, token_cache
+from app.core.absence import absence_cache
+from app.core.container import Container
+from app.core.database import Database
+from app.core.security import password_hasher
 from app.models import Message
+from app.repository.base_repository import BaseRepository, count_cache
+from app.repository.user_repository import user_cache
 from app.utils import generate_test_email, send_email
 
 router = APIRouter(prefix="/utils", tags=["utils"])
@@ -29,3 +38,46 @@ def test_email(email_to: EmailStr) -> Message:
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
+
+
+@router.get(
+    "/cache-stats/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def cache_stats() -> dict[str, Any]:
+    """
+    Hit / miss / eviction counters of the in-process caches.
+    """
+    return {
+        "query_shapes": BaseRepository.query_shape_cache_stats(),
+        "counts": count_cache.stats(),
+        "users": user_cache.stats(),
+        "tokens": token_cache.stats(),
+        "absence": absence_cache.stats(),
+    }
+
+
+@router.get(
+    "/db-pool/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+@inject
+async def db_pool(
+    database: Database = Depends(Provide[Container.db]),
+) -> dict[str, Any]:
+    """
+    Checked-out, idle and overflow connections of this worker's pool, and how long
+    requests waited to acquire one.
+    """
+    return database.pool_status()
+
+
+@router.get(
+    "/password-hasher/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def password_hasher_stats() -> dict[str, Any]:
+    """
+    Queue depth and throughput of the bcrypt thread pool.
+    """
+    return password_hasher.stats()
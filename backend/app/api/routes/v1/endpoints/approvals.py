@@ -0,0 +1,44 @@
+from typing import Any
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query
+
+from app.api.deps import CurrentUser, is_admin
+from app.core.container import Container
+from app.core.exceptions import AuthError
+from app.core.serialization import json_response
+from app.schema.approval_schema import ApprovalInbox
+from app.services.approval_service import ApprovalService
+
+router = APIRouter(prefix="/approvals", tags=["approvals"])
+
+
+@router.get(
+    "/inbox",
+    response_model=ApprovalInbox,
+)
+@inject
+async def read_inbox(
+    current_user: CurrentUser,
+    supervisor_id: int | None = None,
+    after: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    ser: ApprovalService = Depends(Provide[Container.approval_service]),
+) -> Any:
+    """
+    Pending leave and WFH requests waiting for the current user (admins may pass
+    `supervisor_id`), oldest first.
+
+    Pass `after` with the `next_cursor` of a previous page for the next one.
+    """
+    supervisor_id = current_user.id if supervisor_id is None else supervisor_id
+    if supervisor_id != current_user.id and not is_admin(current_user):
+        raise AuthError(detail="The user doesn't have enough privileges")
+    inbox = await ser.get_inbox(supervisor_id, after, limit)
+    return json_response(
+        ApprovalInbox.model_construct(
+            data=inbox["items"],
+            has_next=inbox["has_next"],
+            next_cursor=inbox["next_cursor"],
+        )
+    )
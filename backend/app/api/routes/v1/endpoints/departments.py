@@ -1,10 +1,18 @@
-from typing import Annotated, Any
 import uuid
-from app.schema.department_schema import DepartmentsPublic
-from app.services.department_service import DepartmentService
-from fastapi import APIRouter, Depends
+from datetime import date
+from typing import Annotated, Any
+
 from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query
+
+from app.api.deps import CurrentUser, get_current_active_superuser, is_admin
 from app.core.container import Container
+from app.core.exceptions import AuthError
+from app.core.export import ExportFormat, export_response
+from app.core.pagination import CountMode
+from app.core.serialization import json_response
+from app.schema.department_schema import DepartmentCalendar, DepartmentsPublic
+from app.services.department_service import DepartmentService
 
 router = APIRouter(prefix="/departments", tags=["departments"])
 
@@ -14,26 +22,70 @@ router = APIRouter(prefix="/departments", tags=["departments"])
 )
 @inject
 async def read_departments(ser: DepartmentService = Depends(Provide[Container.department_service]),
-                            skip: int = 0, limit: int = 100) -> Any:
+                            skip: int = 0, limit: int = 100,
+                            after: str | None = None, before: str | None = None,
+                            count_mode: CountMode | None = None) -> Any:
     """
     Retrieve departments.
+
+    Pass `after` / `before` with the `next_cursor` / `prev_cursor` of a previous page
+    for keyset pagination; `skip` is ignored then.
+    `count_mode` is one of window (default) / exact / estimated / cached / none (no total, use `has_next`).
     """
-    departments = await ser.get_all_departments(skip, limit)
+    departments = await ser.get_all_departments(skip, limit, after, before, count_mode)
     
-    # count = len(users)
-    return DepartmentsPublic(data=departments, count=1)
+    return json_response(DepartmentsPublic.model_construct(data=departments["items"], count=departments["total"],
+                                                           has_next=departments["has_next"],
+                                                           next_cursor=departments["next_cursor"],
+                                                           prev_cursor=departments["prev_cursor"]))
+
+@router.get("/export", dependencies=[Depends(get_current_active_superuser)])
+@inject
+async def export_departments(ser: DepartmentService = Depends(Provide[Container.department_service]),
+                             format: ExportFormat = "ndjson") -> Any:
+    """
+    Stream every department (superusers only) as NDJSON (default) or CSV, read from a server-side cursor.
+    """
+    return export_response(ser.export_departments(), format, "departments")
+
+@router.get(
+    "/{department_id}/calendar",
+    response_model=DepartmentCalendar,
+)
+@inject
+async def read_department_calendar(department_id: int, current_user: CurrentUser,
+                                   start: date = Query(alias="from"), end: date = Query(alias="to"),
+                                   ser: DepartmentService = Depends(Provide[Container.department_service])) -> Any:
+    """
+    Who is off (or working from home) in the department, day by day, for up to 366 days.
+
+    Each member's `days` has one character per day from `from` to `to`: see `legend`.
+    Served from a per-department, per-year status matrix kept in memory and updated
+    as leave and WFH requests change.
+
+    For the department's members, their supervisors and admins.
+    """
+    if not (is_admin(current_user) or await ser.can_view_calendar(current_user, department_id)):
+        raise AuthError(detail="The user doesn't have enough privileges")
+    calendar = await ser.get_calendar(department_id, start, end)
+    return json_response(DepartmentCalendar.model_construct(**calendar))
 
 @router.get(
     "/admin",
     response_model=DepartmentsPublic,
 )
 @inject
-async def read_departments_by_admin(ser: DepartmentService = Depends(Provide[Container.department_service]),
-                                    userId: uuid.UUID = None,  skip: int = 0, limit: int = 100) -> Any:
+async def read_departments_by_admin(userId: uuid.UUID,
+                                    ser: DepartmentService = Depends(Provide[Container.department_service]),
+                                    skip: int = 0, limit: int = 100,
+                                    after: str | None = None, before: str | None = None,
+                                    count_mode: CountMode | None = None) -> Any:
     """
-    Retrieve departments.
+    Retrieve the departments `userId` administers.
     """
-    departments = await ser.get_departments_by_admin(userId, skip, limit)
+    departments = await ser.get_departments_by_admin(userId, skip, limit, after, before, count_mode)
     
-    # count = len(users)
-    return DepartmentsPublic(data=departments, count=1)
\ No newline at end of file
+    return json_response(DepartmentsPublic.model_construct(data=departments["items"], count=departments["total"],
+                                                           has_next=departments["has_next"],
+                                                           next_cursor=departments["next_cursor"],
+                                                           prev_cursor=departments["prev_cursor"]))
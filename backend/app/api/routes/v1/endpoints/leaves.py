@@ -0,0 +1,125 @@
+from datetime import date
+from typing import Any, Literal
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from app.api.deps import CurrentUser, authorize_request_action, is_admin
+from app.core.container import Container
+from app.core.exceptions import AuthError
+from app.schema.holiday_schema import HolidayCreate, LeaveDaysRecomputed
+from app.schema.leave_balance_schema import EmployeeLeaveBalancesPublic
+from app.schema.leave_request_schema import (
+    LeaveRequestApply,
+    LeaveRequestImport,
+    LeaveRequestRead,
+)
+from app.services.leave_service import LeaveService
+from app.services.user_service import UserService
+
+router = APIRouter(prefix="/leaves", tags=["leaves"])
+
+
+@router.post(
+    "/",
+    response_model=LeaveRequestRead,
+)
+@inject
+async def apply_leave(
+    leave_in: LeaveRequestApply,
+    current_user: CurrentUser,
+    ser: LeaveService = Depends(Provide[Container.leave_service]),
+) -> Any:
+    """
+    Request leave for the current user.
+
+    `number_of_days` is counted by the server: working days from `start_date` to `end_date`
+    on the user's department holiday calendar, less half a day for `start_half_day` / `end_half_day`.
+    Answers 409 when the range shares a day with another pending / approved leave or WFH request.
+    """
+    return await ser.apply(current_user.id, leave_in)
+
+
+@router.post("/import")
+@inject
+async def import_leaves(
+    leaves_in: list[LeaveRequestImport],
+    current_user: CurrentUser,
+    ser: LeaveService = Depends(Provide[Container.leave_service]),
+) -> Any:
+    """
+    Bulk import of pending leave requests. Rows overlapping stored requests or earlier rows
+    of the batch are reported as failed with the reason; the rest are inserted.
+    """
+    if not is_admin(current_user):
+        raise AuthError(detail="The user doesn't have enough privileges")
+    return await ser.import_leaves(leaves_in)
+
+
+@router.post(
+    "/holidays",
+    response_model=LeaveDaysRecomputed,
+)
+@inject
+async def add_holiday(
+    holiday_in: HolidayCreate,
+    current_user: CurrentUser,
+    ser: LeaveService = Depends(Provide[Container.leave_service]),
+) -> Any:
+    """
+    Add a holiday (company-wide without `department_id`) and recount the open leave
+    requests it falls into, including approved ones and their balances.
+    """
+    if not is_admin(current_user):
+        raise AuthError(detail="The user doesn't have enough privileges")
+    return await ser.add_holiday(holiday_in)
+
+
+@router.post(
+    "/{leave_id}/{action}",
+    response_model=LeaveRequestRead,
+)
+@inject
+async def transition_leave(
+    leave_id: int,
+    action: Literal["approve", "reject", "withdraw", "cancel"],
+    current_user: CurrentUser,
+    comments: str | None = None,
+    ser: LeaveService = Depends(Provide[Container.leave_service]),
+) -> Any:
+    """
+    Approve, reject, withdraw or cancel a leave request.
+
+    The employee's leave balance is updated in the same transaction: approving
+    books the request's days, withdrawing or cancelling an approved request gives them back.
+    Approving and rejecting are for the request's supervisor and admins, never for the
+    request's owner; withdrawing and cancelling for them and the owner.
+    """
+    authorize_request_action(current_user, await ser.get_by_id(leave_id), action)
+    return await ser.transition(leave_id, action, current_user.id, comments)
+
+
+@router.get(
+    "/balances",
+    response_model=EmployeeLeaveBalancesPublic,
+)
+@inject
+async def read_leave_balances(
+    current_user: CurrentUser,
+    employee_id: int | None = None,
+    year: int | None = None,
+    ser: LeaveService = Depends(Provide[Container.leave_service]),
+    users: UserService = Depends(Provide[Container.user_service]),
+) -> Any:
+    """
+    Leave balances of an employee (default: the current user) for a year (default: this year).
+
+    Other employees' balances are for their supervisor and admins.
+    """
+    employee_id = current_user.id if employee_id is None else employee_id
+    if employee_id != current_user.id and not is_admin(current_user):
+        employee = await users.get_by_id(employee_id)
+        if employee.supervisor_id != current_user.id:
+            raise AuthError(detail="The user doesn't have enough privileges")
+    balances = await ser.get_balances(employee_id, year or date.today().year)
+    return EmployeeLeaveBalancesPublic(data=balances, count=len(balances))
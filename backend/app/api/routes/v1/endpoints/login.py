@@ -2,15 +2,17 @@ from datetime import timedelta
 from http.client import HTTPException
 from typing import Annotated
 
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Request
+from fastapi.security import OAuth2PasswordRequestForm
+
 from app import crud
 from app.core import security
 from app.core.config import Settings
 from app.core.container import Container
+from app.core.rate_limit import LoginRateLimiter
 from app.models import Token
 from app.services.user_service import UserService
-from fastapi.security import OAuth2PasswordRequestForm
-from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
 
 router = APIRouter(tags=["login"])
 
@@ -18,11 +20,18 @@ router = APIRouter(tags=["login"])
 
 @inject
 async def login_access_token(
-    form_data: Annotated[OAuth2PasswordRequestForm, Depends()], userService: UserService = Depends(Provide[Container.user_service])
+    request: Request,
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()], userService: UserService = Depends(Provide[Container.user_service]),
+    limiter: LoginRateLimiter = Depends(Provide[Container.login_rate_limiter]),
 ) -> Token:
     """
     OAuth2 compatible token login, get an access token for future requests
+
+    Attempts are rate limited per client IP and per account (429 with Retry-After).
     """
+    # Before any bcrypt work, so a burst of attempts costs almost nothing
+    await limiter.check(form_data.username, request.client.host if request.client else "unknown")
+
     # SQLAlchemy version: replace session.exec with session.execute().scalars().first()
     # stmt = select(User).where(User.email == form_data.username)
     # user = (await session.execute(stmt)).scalars().first()
@@ -1,9 +1,17 @@
 from typing import Annotated, Any
-from app.schema.user_schema import UsersPublic
-from app.services.user_service import UserService
-from fastapi import APIRouter, Depends
+
 from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from app.api.deps import CurrentUser, get_current_active_superuser, is_admin
 from app.core.container import Container
+from app.core.exceptions import AuthError
+from app.core.export import ExportFormat, export_response
+from app.core.pagination import CountMode
+from app.core.serialization import json_response
+from app.schema.user_schema import UserPublic, UsersPublic, UserSupervisorUpdate
+from app.services.approval_service import ApprovalService
+from app.services.user_service import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -12,11 +20,45 @@ router = APIRouter(prefix="/users", tags=["users"])
     response_model=UsersPublic,
 )
 @inject
-async def read_users(ser: UserService = Depends(Provide[Container.user_service]), skip: int = 0, limit: int = 100) -> Any:
+async def read_users(ser: UserService = Depends(Provide[Container.user_service]), skip: int = 0, limit: int = 100,
+                     after: str | None = None, before: str | None = None,
+                     count_mode: CountMode | None = None, q: str | None = None) -> Any:
     """
     Retrieve users.
+
+    `q` narrows the list to users with a name or email word starting with it (type-ahead).
+
+    Pass `after` / `before` with the `next_cursor` / `prev_cursor` of a previous page
+    for keyset pagination; `skip` is ignored then.
+    `count_mode` is one of window (default) / exact / estimated / cached / none (no total, use `has_next`).
     """
-    users = await ser.get_all_users(skip, limit)
+    users = await ser.get_all_users(skip, limit, after, before, count_mode, q)
     
-    # count = len(users)
-    return UsersPublic(data=users, count=1)
\ No newline at end of file
+    return json_response(UsersPublic.model_construct(data=users["items"], count=users["total"], has_next=users["has_next"],
+                                                     next_cursor=users["next_cursor"], prev_cursor=users["prev_cursor"]))
+
+
+@router.get("/export", dependencies=[Depends(get_current_active_superuser)])
+@inject
+async def export_users(ser: UserService = Depends(Provide[Container.user_service]),
+                       format: ExportFormat = "ndjson") -> Any:
+    """
+    Stream every user (superusers only) as NDJSON (default) or CSV, read from a server-side cursor.
+    """
+    return export_response(ser.export_users(), format, "users")
+
+
+@router.put(
+    "/{user_id}/supervisor",
+    response_model=UserPublic,
+)
+@inject
+async def update_user_supervisor(user_id: int, supervisor_in: UserSupervisorUpdate, current_user: CurrentUser,
+                                 ser: ApprovalService = Depends(Provide[Container.approval_service])) -> Any:
+    """
+    Set who approves the user's leave and WFH requests (admins only). The user's
+    pending requests move to the new supervisor's inbox.
+    """
+    if not is_admin(current_user):
+        raise AuthError(detail="The user doesn't have enough privileges")
+    return await ser.assign_supervisor(user_id, supervisor_in.supervisor_id)
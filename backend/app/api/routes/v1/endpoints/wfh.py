@@ -0,0 +1,50 @@
+from typing import Any, Literal
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from app.api.deps import CurrentUser, authorize_request_action
+from app.core.container import Container
+from app.schema.wfh_request_schema import WfhRequestApply, WfhRequestRead
+from app.services.wfh_service import WfhService
+
+router = APIRouter(prefix="/wfh", tags=["wfh"])
+
+
+@router.post(
+    "/",
+    response_model=WfhRequestRead,
+)
+@inject
+async def apply_wfh(
+    wfh_in: WfhRequestApply,
+    current_user: CurrentUser,
+    ser: WfhService = Depends(Provide[Container.wfh_service]),
+) -> Any:
+    """
+    Request a WFH day for the current user. Answers 409 on a day already covered by
+    a pending / approved leave request or another WFH request.
+    """
+    return await ser.apply(current_user.id, wfh_in)
+
+
+@router.post(
+    "/{wfh_id}/{action}",
+    response_model=WfhRequestRead,
+)
+@inject
+async def transition_wfh(
+    wfh_id: int,
+    action: Literal["approve", "reject", "withdraw", "cancel"],
+    current_user: CurrentUser,
+    comments: str | None = None,
+    ser: WfhService = Depends(Provide[Container.wfh_service]),
+) -> Any:
+    """
+    Approve, reject, withdraw or cancel a WFH request.
+
+    Approving and rejecting are for the request's supervisor and admins, never for the
+    request's owner; withdrawing and cancelling for them and the owner.
+    """
+    authorize_request_action(current_user, await ser.get_by_id(wfh_id), action)
+    return await ser.transition(wfh_id, action, current_user.id, comments)
@@ -0,0 +1,169 @@
+from collections.abc import Iterable, Sequence
+from datetime import date
+
+import numpy as np
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+# Day status flags of one user. Active leave requests of a user never overlap
+# (excl_leave_requests_user_dates), nor do WFH requests and leave, so a day
+# carries at most one of them.
+LEAVE_APPROVED = 1
+LEAVE_PENDING = 2
+WFH_APPROVED = 4
+WFH_PENDING = 8
+
+_FLAGS = {
+    "leave": {"approved": LEAVE_APPROVED, "pending": LEAVE_PENDING},
+    "wfh": {"approved": WFH_APPROVED, "pending": WFH_PENDING},
+}
+_KIND_BITS = {
+    "leave": LEAVE_APPROVED | LEAVE_PENDING,
+    "wfh": WFH_APPROVED | WFH_PENDING,
+}
+
+# One character per day in the API: L / l approved / pending leave, W / w approved / pending WFH
+LEGEND = {
+    ".": "present",
+    "L": "leave",
+    "l": "leave (pending)",
+    "W": "wfh",
+    "w": "wfh (pending)",
+}
+_CHARS = np.full(16, ord("."), dtype=np.uint8)
+for _flag, _char in (
+    (WFH_PENDING, "w"),
+    (WFH_APPROVED, "W"),
+    (LEAVE_PENDING, "l"),
+    (LEAVE_APPROVED, "L"),
+):
+    _CHARS[[value for value in range(16) if value & _flag]] = ord(_char)
+
+# (user_id, first_name, last_name)
+Member = tuple[int, str, str]
+
+
+def _ordinal(day: date) -> int:
+    return day.toordinal()
+
+
+class AbsenceMatrix:
+    """
+    Status flags of every member of a department on every day of one year:
+    a (members x days) uint8 array, so a calendar window is a slice.
+    """
+
+    def __init__(
+        self,
+        year: int,
+        members: Sequence[Member],
+        leaves: Iterable[tuple[int, date, date, str]] = (),
+        wfh: Iterable[tuple[int, date, str]] = (),
+    ) -> None:
+        self.year = year
+        self.first = date(year, 1, 1)
+        self.days = (date(year + 1, 1, 1) - self.first).days
+        self.members = list(members)
+        self.rows = {member[0]: row for row, member in enumerate(self.members)}
+        self.flags = np.zeros((len(self.members), self.days), dtype=np.uint8)
+        self._fill_ranges(leaves, "leave")
+        self._fill_ranges(
+            ((user_id, day, day, status) for user_id, day, status in wfh), "wfh"
+        )
+
+    def _fill_ranges(
+        self, ranges: Iterable[tuple[int, date, date, str]], kind: str
+    ) -> None:
+        # Non-overlapping ranges: +flag on the first day and -flag after the last, then a running sum
+        rows, starts, stops, flags = [], [], [], []
+        for user_id, start, end, status in ranges:
+            row, span = self.rows.get(user_id), self._span(start, end)
+            if row is None or span is None or status not in _FLAGS[kind]:
+                continue
+            rows.append(row)
+            starts.append(span[0])
+            stops.append(span[1])
+            flags.append(_FLAGS[kind][status])
+        if not rows:
+            return
+        delta = np.zeros((len(self.members), self.days + 1), dtype=np.int16)
+        np.add.at(delta, (rows, starts), flags)
+        np.add.at(delta, (rows, stops), np.negative(flags))
+        self.flags |= np.cumsum(delta[:, :-1], axis=1).astype(np.uint8)
+
+    def _span(self, start: date, end: date) -> tuple[int, int] | None:
+        """[first, stop) day offsets of [start, end] inside the year, None when outside"""
+        first = max(_ordinal(start) - _ordinal(self.first), 0)
+        stop = min(_ordinal(end) - _ordinal(self.first) + 1, self.days)
+        return (first, stop) if first < stop else None
+
+    def mark(
+        self, user_id: int, kind: str, start: date, end: date, status: str
+    ) -> bool:
+        """
+        Set the user's `kind` ("leave" / "wfh") flags on [start, end] for a request now in
+        `status`; statuses other than pending / approved clear them. False when the user
+        or the range is not in this matrix.
+        """
+        row, span = self.rows.get(user_id), self._span(start, end)
+        if row is None or span is None:
+            return False
+        days = self.flags[row, span[0] : span[1]]
+        days &= ~np.uint8(_KIND_BITS[kind])
+        days |= _FLAGS[kind].get(status, 0)
+        return True
+
+    def window(
+        self, start: date, end: date, user_ids: Sequence[int] | None = None
+    ) -> np.ndarray:
+        """
+        Flags of [start, end] clipped to the year, one row per member, or per user of
+        `user_ids` in that order (zeros for users not in this matrix)
+        """
+        span = self._span(start, end) or (0, 0)
+        flags = self.flags[:, span[0] : span[1]]
+        if user_ids is None:
+            return flags
+        rows = np.array(
+            [self.rows.get(user_id, -1) for user_id in user_ids], dtype=np.intp
+        )
+        aligned = np.zeros((len(rows), flags.shape[1]), dtype=np.uint8)
+        found = rows >= 0
+        aligned[found] = flags[rows[found]]
+        return aligned
+
+
+def encode_rows(flags: np.ndarray) -> list[str]:
+    """One string per member, one LEGEND character per day"""
+    if not flags.shape[1]:
+        return [""] * flags.shape[0]
+    chars = np.ascontiguousarray(_CHARS[flags])
+    return [row.decode() for row in chars.view(f"S{flags.shape[1]}").ravel()]
+
+
+# Department absence matrices keyed by (department_id, year), see DepartmentService.get_calendar
+absence_cache: LRUCache[tuple[int, int], AbsenceMatrix] = LRUCache(
+    maxsize=settings.ABSENCE_CACHE_SIZE, ttl=settings.ABSENCE_CACHE_TTL_SECONDS
+)
+
+# Bumped on every recorded change; a matrix is only cached when none happened while it was loaded
+_generation = 0
+
+
+def absence_generation() -> int:
+    return _generation
+
+
+def record_absence_change(changes: Iterable[tuple[int, str, date, date, str]]) -> None:
+    """
+    Apply committed request changes, (user_id, kind, start, end, status) each, to the
+    cached matrices of this worker. Call it through app.core.database.after_commit.
+    """
+    global _generation
+    _generation += 1
+    matrices = absence_cache.values()
+    for user_id, kind, start, end, status in changes:
+        for matrix in matrices:
+            if start.year <= matrix.year <= end.year:
+                matrix.mark(user_id, kind, start, end, status)
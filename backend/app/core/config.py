@@ -37,6 +37,41 @@ class Settings(BaseSettings):
     FRONTEND_HOST: str = "http://localhost:5173"
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"
 
+    # Default list paging used by BaseRepository.read_by_options
+    PAGE: int = 1
+    PAGE_SIZE: int = 20
+    ORDERING: str = "-id"
+    COUNT_MODE: Literal["exact", "estimated", "cached", "window", "none"] = "window"
+    COUNT_CACHE_TTL_SECONDS: float = 30
+    COUNT_CACHE_SIZE: int = 1024
+    QUERY_SHAPE_CACHE_SIZE: int = 256
+    # Rows per INSERT/UPDATE statement in the bulk_* repository methods
+    BULK_BATCH_SIZE: int = 1000
+    # Rows fetched per round trip from the server-side cursor of stream_filter_data
+    STREAM_CHUNK_SIZE: int = 1000
+    # Working days for LeaveRequest.number_of_days, as a numpy weekmask Monday..Sunday
+    WORKWEEK: str = "1111100"
+    # Authenticated-user snapshots kept by get_current_user, per worker process.
+    # Other workers see a deactivation once their entry expires.
+    USER_CACHE_SIZE: int = 4096
+    USER_CACHE_TTL_SECONDS: float = 60
+    # Verified access tokens kept by get_current_user; an entry never outlives the token's exp
+    TOKEN_CACHE_SIZE: int = 10_000
+    TOKEN_CACHE_TTL_SECONDS: float = 300
+    # Department absence matrices (one per department and year) behind /departments/{id}/calendar.
+    # Kept current by this worker's own changes; other workers' show up once the entry expires.
+    ABSENCE_CACHE_SIZE: int = 256
+    ABSENCE_CACHE_TTL_SECONDS: float = 300
+    # Threads running bcrypt (login, user creation) off the event loop, per worker process
+    PASSWORD_HASH_WORKERS: int = 2
+    # Login attempts admitted per client IP and per account: a burst, then a steady rate.
+    # "postgres" shares the buckets between workers (rate_limit_buckets table).
+    LOGIN_RATE_LIMIT_BACKEND: Literal["memory", "postgres"] = "memory"
+    LOGIN_IP_BURST: int = 20
+    LOGIN_IP_PER_MINUTE: float = 60
+    LOGIN_ACCOUNT_BURST: int = 5
+    LOGIN_ACCOUNT_PER_MINUTE: float = 5
+
     BACKEND_CORS_ORIGINS: Annotated[
         list[AnyUrl] | str, BeforeValidator(parse_cors)
     ] = []
@@ -56,6 +91,19 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "app"
 
+    # Connection pool, per worker process
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+    # Log a warning when getting a pooled connection takes longer than this
+    DB_POOL_SLOW_ACQUIRE_MS: float = 100
+    # Read replicas (comma separated SQLAlchemy URLs) for read-only repository
+    # queries; empty sends everything to the primary
+    DB_REPLICA_URLS: Annotated[list[str] | str, BeforeValidator(parse_cors)] = []
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:
@@ -1,8 +1,17 @@
+import asyncio
+import itertools
+import logging
+import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from collections.abc import AsyncGenerator, Callable, Sequence
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_scoped_session, async_sessionmaker 
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
+from sqlalchemy.orm import Session
 
 
 @as_declarative()
@@ -16,26 +25,177 @@ class BaseModel:
         return cls.__name__.lower()
 
 
+class RequestScope:
+    """
+    Unit of work for one HTTP request: a single session, opened on first use and
+    shared by every repository and service that runs inside the request.
+    """
+
+    def __init__(self) -> None:
+        self.session: AsyncSession | None = None
+        # Read-only work goes here when replicas are configured, until the request writes
+        self.replica_session: AsyncSession | None = None
+        self.finished = False
+        # Per-request DataLoaders, see app.core.dataloader.request_loader
+        self.loaders: dict[Any, Any] = {}
+        self.loader_lock = asyncio.Lock()
+        # Callbacks to run once the request's work is committed, see after_commit
+        self.on_commit: list[Callable[[], None]] = []
+
+    @property
+    def wrote(self) -> bool:
+        """Whether the request has written through its (primary) session"""
+        return self.session is not None and bool(self.session.info.get("wrote"))
+
+    async def finish(self, commit: bool) -> None:
+        """Commit (or roll back) the request's work once; later calls are no-ops"""
+        if self.finished:
+            return
+        self.finished = True
+        if self.session is None:
+            return
+        if commit:
+            await self.session.commit()
+            for callback in self.on_commit:
+                callback()
+        else:
+            await self.session.rollback()
+
+
+_request_scope: ContextVar[RequestScope | None] = ContextVar("request_scope", default=None)
+
+
+def current_request_scope() -> RequestScope | None:
+    return _request_scope.get()
+
+
+def after_commit(callback: Callable[[], None]) -> None:
+    """
+    Run `callback` once the current request's work is committed (never if it is
+    rolled back). Outside a request the repository has committed already, so it
+    runs right away.
+    """
+    scope = _request_scope.get()
+    if scope is None:
+        callback()
+    else:
+        scope.on_commit.append(callback)
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """How long sessions waited to get a pooled connection"""
+
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.acquisitions += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> dict:
+        return {
+            "acquisitions": self.acquisitions,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": 1000 * self.total_wait / self.acquisitions if self.acquisitions else 0.0,
+            "max_wait_ms": 1000 * self.max_wait,
+        }
+
+
+class _PrimarySession(Session):
+    """Sync session class behind primary sessions; records in `info` once the session writes"""
+
+
+@event.listens_for(_PrimarySession, "do_orm_execute")
+def _record_dml(orm_execute_state: Any) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(_PrimarySession, "after_flush")
+def _record_flush(session: Session, _flush_context: Any) -> None:
+    session.info["wrote"] = True
+
+
 class Database:
-    def __init__(self, db_url: str) -> None:
-        self._engine = create_async_engine(db_url, echo=True)
-        self._session_factory = async_scoped_session(
-            async_sessionmaker(
-                autocommit=False,
-                autoflush=False,
-                bind=self._engine,
-                class_=AsyncSession,  # Explicitly specify AsyncSession
-            ),
-            scopefunc=lambda: None,  # You might want to set a proper scopefunc
+    def __init__(
+        self,
+        db_url: str,
+        replica_urls: Sequence[str] = (),
+        echo: bool = False,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        slow_acquire_ms: float = 100,
+    ) -> None:
+        engine_options = {
+            "echo": echo,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": pool_timeout,
+            "pool_recycle": pool_recycle,
+            "pool_pre_ping": pool_pre_ping,
+        }
+        self._engine = create_async_engine(db_url, **engine_options)
+        self._replica_engines = [create_async_engine(url, **engine_options) for url in replica_urls]
+        self._slow_acquire_ms = slow_acquire_ms
+        self.pool_metrics = PoolMetrics()
+        # No scoped registry: every session() call (or request scope) gets its own
+        # session, so concurrent requests on one worker never share one.
+        self._session_factory = async_sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=self._engine,
+            class_=AsyncSession,  # Explicitly specify AsyncSession
+            sync_session_class=_PrimarySession,
+            expire_on_commit=False,  # returned entities stay readable after commit/close
         )
+        self._replica_factories = [
+            async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+            for engine in self._replica_engines
+        ]
+        self._next_replica = itertools.count()
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._engine
 
     async def create_database(self) -> None:
         async with self._engine.begin() as conn:
             await conn.run_sync(BaseModel.metadata.create_all)
 
     @asynccontextmanager
-    async def session(self) -> AsyncGenerator[AsyncSession, None]:
-        session: AsyncSession = self._session_factory()
+    async def session(self, isolated: bool = False, read_only: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """
+        `isolated=True` always opens a session of its own, even inside a request scope,
+        e.g. for a streamed export that outlives the request's unit of work.
+
+        `read_only=True` marks a session that only reads: it goes to a replica when
+        replicas are configured, except in a request that has already written, which
+        keeps reading from the primary so that it sees its own writes.
+        """
+        scope = None if isolated else _request_scope.get()
+        replica = read_only and bool(self._replica_factories) and not (scope is not None and scope.wrote)
+        if scope is not None:
+            # Inside a request: share its session, the request scope commits at the end
+            if replica:
+                if scope.replica_session is None:
+                    scope.replica_session = await self._open_session(self._replica_factory())
+                yield scope.replica_session
+                return
+            if scope.session is None:
+                scope.session = await self._open_session()
+            yield scope.session
+            return
+
+        session: AsyncSession = await self._open_session(self._replica_factory() if replica else None)
         try:
             yield session
             await session.commit()  # Explicit commit for async
@@ -44,7 +204,62 @@ class Database:
             raise
         finally:
             await session.close()
-            await self._session_factory.remove()  # Clean up scoped session
+
+    def _replica_factory(self) -> async_sessionmaker:
+        """Replicas take turns"""
+        return self._replica_factories[next(self._next_replica) % len(self._replica_factories)]
+
+    async def _open_session(self, factory: async_sessionmaker | None = None) -> AsyncSession:
+        """New session with its connection already checked out, timing the wait for the pool"""
+        session: AsyncSession = (factory or self._session_factory)()
+        started = time.perf_counter()
+        try:
+            await session.connection()
+        except BaseException as e:
+            # Whatever failed (pool timeout, refused connection, cancellation), don't leak the session
+            if isinstance(e, PoolTimeoutError):
+                self.pool_metrics.timeouts += 1
+                logger.warning("Timed out waiting for a DB connection: %s", self.pool_status())
+            await session.close()
+            raise
+        wait = time.perf_counter() - started
+        self.pool_metrics.record(wait)
+        if wait * 1000 >= self._slow_acquire_ms:
+            logger.warning("Waited %.1f ms for a DB connection: %s", wait * 1000, self.pool_status())
+        return session
+
+    def pool_status(self) -> dict:
+        """Live connection counts of the engines' pools plus acquisition wait metrics"""
+        status = {**self._pool_counts(self._engine), **self.pool_metrics.as_dict()}
+        if self._replica_engines:
+            status["replicas"] = [self._pool_counts(engine) for engine in self._replica_engines]
+        return status
+
+    @staticmethod
+    def _pool_counts(engine: AsyncEngine) -> dict:
+        pool = engine.pool
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        }
+
+    @asynccontextmanager
+    async def request_scope(self) -> AsyncGenerator[RequestScope, None]:
+        """Make every `session()` opened inside the block share one session"""
+        scope = RequestScope()
+        token = _request_scope.set(scope)
+        try:
+            yield scope
+        except Exception:
+            await scope.finish(commit=False)
+            raise
+        finally:
+            _request_scope.reset(token)
+            for session in (scope.session, scope.replica_session):
+                if session is not None:
+                    await session.close()
 
 
 
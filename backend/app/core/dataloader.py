@@ -0,0 +1,118 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import (
+    Any,
+    Generic,
+    TypeVar,
+)
+
+from app.core.database import current_request_scope
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Coalesces the `load(key)` calls made in the same event-loop tick into one
+    `batch_load(keys)` call, with duplicate keys fetched once.
+
+    `batch_load` gets the distinct keys and returns a {key: value} mapping; keys
+    missing from it load as None. Results are kept for the loader's lifetime, so
+    use one loader per request (see `request_loader`).
+
+    Batches never overlap: the ones holding the same `lock` run one after another,
+    since an AsyncSession (shared by the whole request) runs one query at a time.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[dict[K, V]]],
+        max_batch_size: int | None = None,
+        lock: asyncio.Lock | None = None,
+    ) -> None:
+        self._batch_load = batch_load
+        self._max_batch_size = max_batch_size
+        self._lock = lock or asyncio.Lock()
+        self._cache: dict[K, asyncio.Future[V | None]] = {}
+        # Queued loads keep their own future, so that clear() cannot strand a waiter
+        self._queue: list[tuple[K, asyncio.Future[V | None]]] = []
+        # The loop only keeps weak references to tasks
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.batches = 0
+
+    def load(self, key: K) -> "asyncio.Future[V | None]":
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[key] = future
+            self._queue.append((key, future))
+            if len(self._queue) == 1:
+                # Run after every task that is ready in this tick has had the chance to queue its keys
+                loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def clear(self, key: K | None = None) -> None:
+        """
+        Forget cached results, so the next load fetches again. Loads already in flight
+        still get the result of their batch.
+        """
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        size = self._max_batch_size or len(queue)
+        task = asyncio.ensure_future(
+            self._run_all(
+                [queue[start : start + size] for start in range(0, len(queue), size)]
+            )
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_all(
+        self, batches: list[list[tuple[K, "asyncio.Future[V | None]"]]]
+    ) -> None:
+        for batch in batches:
+            async with self._lock:
+                await self._run(batch)
+
+    async def _run(self, batch: list[tuple[K, "asyncio.Future[V | None]"]]) -> None:
+        self.batches += 1
+        try:
+            values = await self._batch_load([key for key, _ in batch])
+        except Exception as e:
+            for key, future in batch:
+                # Errors are not cached; a load started after clear() has a future of its own
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch:
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+def request_loader(
+    key: Any, batch_load: Callable[[list[Any]], Awaitable[dict[Any, Any]]]
+) -> DataLoader[Any, Any]:
+    """
+    The request's loader for `key`, created on first use. Outside a request every
+    call gets a new loader, which still batches the loads of a single tick.
+    """
+    scope = current_request_scope()
+    if scope is None:
+        return DataLoader(batch_load)
+    loader = scope.loaders.get(key)
+    if loader is None:
+        # The request's loaders share its session, so they share one lock too
+        loader = scope.loaders[key] = DataLoader(batch_load, lock=scope.loader_lock)
+    return loader
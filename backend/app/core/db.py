@@ -1,15 +1,27 @@
-from sqlalchemy import create_engine, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app import crud
 from app.core.config import settings
-from app.models import User, UserCreate
+from app.core.database import Database
 from app.model.user_model import User
+from app.models import User, UserCreate
 from app.schema.user_schema import UserCreate
 
-from sqlalchemy.ext.asyncio import create_async_engine
-
-engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+# The one engine (and connection pool) of this process. deps, the DI container,
+# backend_pre_start and initial_data all go through it.
+database = Database(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    replica_urls=settings.DB_REPLICA_URLS,
+    echo=settings.DB_ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    slow_acquire_ms=settings.DB_POOL_SLOW_ACQUIRE_MS,
+)
+engine = database.engine
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
@@ -26,9 +38,11 @@ def init_db(session: Session) -> None:
     # This works because the models are already imported and registered from app.models
     # SQLModel.metadata.create_all(engine)
 
-    user = session.exec(
-        select(User).where(User.email == settings.FIRST_SUPERUSER)
-    ).first()
+    user = (
+        session.execute(select(User).where(User.email == settings.FIRST_SUPERUSER))
+        .scalars()
+        .first()
+    )
     if not user:
         user_in = UserCreate(
             email=settings.FIRST_SUPERUSER,
@@ -1,3 +1,4 @@
+import math
 from typing import Any, Dict, Optional
 
 from fastapi import HTTPException, status
@@ -20,4 +21,14 @@ class NotFoundError(HTTPException):
 
 class ValidationError(HTTPException):
     def __init__(self, detail: Any = None, headers: Optional[Dict[str, Any]] = None) -> None:
-        super().__init__(status.HTTP_422_UNPROCESSABLE_ENTITY, detail, headers)
\ No newline at end of file
+        super().__init__(status.HTTP_422_UNPROCESSABLE_ENTITY, detail, headers)
+
+class TooManyRequestsError(HTTPException):
+    def __init__(self, retry_after: float, detail: Any = None, headers: Optional[dict[str, Any]] = None) -> None:
+        headers = {"Retry-After": str(max(1, math.ceil(retry_after))), **(headers or {})}
+        super().__init__(status.HTTP_429_TOO_MANY_REQUESTS, detail, headers)
+
+
+class ConflictError(HTTPException):
+    def __init__(self, detail: Any = None, headers: Optional[dict[str, Any]] = None) -> None:
+        super().__init__(status.HTTP_409_CONFLICT, detail, headers)
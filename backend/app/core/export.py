@@ -0,0 +1,49 @@
+import csv
+import io
+from collections.abc import AsyncIterator
+from typing import Any, Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+ExportFormat = Literal["ndjson", "csv"]
+
+_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+async def ndjson_lines(
+    chunks: AsyncIterator[list[dict[str, Any]]],
+) -> AsyncIterator[bytes]:
+    """One JSON document per row, one write per chunk"""
+    async for chunk in chunks:
+        if chunk:
+            yield b"".join(to_json(row) + b"\n" for row in chunk)
+
+
+async def csv_lines(
+    chunks: AsyncIterator[list[dict[str, Any]]],
+) -> AsyncIterator[bytes]:
+    """CSV with a header taken from the columns of the first row"""
+    writer = None
+    buffer = io.StringIO()
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(chunk[0]))
+            writer.writeheader()
+        writer.writerows(chunk)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def export_response(
+    chunks: AsyncIterator[list[dict[str, Any]]], format: ExportFormat, filename: str
+) -> StreamingResponse:
+    body = ndjson_lines(chunks) if format == "ndjson" else csv_lines(chunks)
+    return StreamingResponse(
+        body,
+        media_type=_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'},
+    )
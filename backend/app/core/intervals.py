@@ -0,0 +1,63 @@
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+
+class IntervalIndex:
+    """
+    Closed, pairwise non-overlapping [start, end] intervals of one owner,
+    kept sorted by start.
+
+    Since accepted intervals never overlap, sorting by start also sorts
+    them by end, so the only candidates for overlapping a new interval are
+    its two neighbours, found by bisection: an O(log n) check per interval
+    without a full interval tree.
+    """
+
+    def __init__(self) -> None:
+        self._starts: list[Any] = []
+        self._ends: list[Any] = []
+        self._payloads: list[Any] = []
+
+    def conflict(self, start: Any, end: Any) -> Any | None:
+        """Payload of an interval overlapping [start, end], or None"""
+        i = bisect_right(self._starts, end)
+        # The last interval starting at or before `end` is the only one that can reach `start`
+        if i and self._ends[i - 1] >= start:
+            return self._payloads[i - 1]
+        return None
+
+    def add(self, start: Any, end: Any, payload: Any = None) -> Any | None:
+        """Insert [start, end] unless it overlaps; returns the payload it overlaps, None once added"""
+        conflict = self.conflict(start, end)
+        if conflict is not None:
+            return conflict
+        i = bisect_right(self._starts, start)
+        self._starts.insert(i, start)
+        self._ends.insert(i, end)
+        self._payloads.insert(i, payload)
+        return None
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+
+class IntervalValidator:
+    """
+    Overlap checks for a batch of intervals, one IntervalIndex per owner
+    (e.g. per user_id). Seed it with what is already stored, then `check`
+    each incoming interval in order: the first one of two overlapping
+    intervals wins.
+    """
+
+    def __init__(self, existing: Iterable[tuple[Hashable, Any, Any, Any]] = ()) -> None:
+        self._indexes: dict[Hashable, IntervalIndex] = defaultdict(IntervalIndex)
+        for owner, start, end, payload in existing:
+            self._indexes[owner].add(start, end, payload)
+
+    def check(
+        self, owner: Hashable, start: Any, end: Any, payload: Any = None
+    ) -> Any | None:
+        """None and remember the interval when it is free, otherwise the payload it overlaps"""
+        return self._indexes[owner].add(start, end, payload)
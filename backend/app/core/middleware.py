@@ -0,0 +1,32 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.database import Database
+
+
+class UnitOfWorkMiddleware:
+    """
+    Runs each HTTP request inside `Database.request_scope()`, so all repositories
+    share one session (one pooled connection) for the whole request.
+
+    The work is committed once, just before the response starts, when the status
+    is below 400 and rolled back otherwise, so clients never see a success that
+    was not persisted.
+    """
+
+    def __init__(self, app: ASGIApp, database: Database) -> None:
+        self.app = app
+        self.database = database
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with self.database.request_scope() as uow:
+
+            async def send_after_commit(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    await uow.finish(commit=message["status"] < 400)
+                await send(message)
+
+            await self.app(scope, receive, send_after_commit)
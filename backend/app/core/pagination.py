@@ -0,0 +1,62 @@
+import base64
+import json
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Literal
+
+from app.core.exceptions import ValidationError
+
+# How list queries report their total:
+#   exact     - COUNT(*) over the filtered query
+#   estimated - planner row estimate from EXPLAIN (no table scan)
+#   cached    - exact count memoised per filter spec for COUNT_CACHE_TTL_SECONDS
+#   window    - count(*) OVER () returned with the page rows, one round trip
+#   none      - no total, only has_next
+CountMode = Literal["exact", "estimated", "cached", "window", "none"]
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode the ordering values of a row into an opaque keyset cursor."""
+    payload = json.dumps([_to_json(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int | None = None) -> list[Any]:
+    """Decode a keyset cursor back into its raw (JSON) ordering values."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValidationError(detail="invalid cursor")
+    if not isinstance(values, list) or (size is not None and len(values) != size):
+        raise ValidationError(detail="invalid cursor")
+    return values
+
+
+def coerce_cursor_value(column: Any, value: Any) -> Any:
+    """Convert a decoded cursor value to the python type of the column it orders."""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        if python_type in (uuid.UUID, Decimal, int, float):
+            return python_type(value)
+    except (ValueError, TypeError, ArithmeticError):
+        raise ValidationError(detail="invalid cursor")
+    return value
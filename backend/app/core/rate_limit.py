@@ -0,0 +1,112 @@
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import NamedTuple, Protocol
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import LRUCache
+from app.core.exceptions import TooManyRequestsError
+
+
+class Bucket(NamedTuple):
+    """`capacity` tokens (the allowed burst), refilled at `rate` tokens per second"""
+
+    capacity: float
+    rate: float
+
+
+class RateLimitBackend(Protocol):
+    async def take(self, key: str, bucket: Bucket) -> float:
+        """
+        Take one token from the bucket at `key`. Returns 0 when a token was taken,
+        otherwise the seconds until one is available. Denied calls take nothing.
+        """
+        ...
+
+
+class InMemoryRateLimitBackend:
+    """Buckets in this process only: each worker limits on its own"""
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        # An evicted bucket comes back full, which only ever errs on the side of allowing
+        self._buckets: LRUCache[str, tuple[float, float]] = LRUCache(maxsize=max_keys)
+
+    async def take(self, key: str, bucket: Bucket) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (bucket.capacity, now))
+        tokens = min(bucket.capacity, tokens + (now - updated) * bucket.rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets.set(key, (tokens, now))
+        return 0.0 if allowed else (1 - tokens) / bucket.rate
+
+
+class PostgresRateLimitBackend:
+    """
+    Buckets in the rate_limit_buckets table, shared by every worker. One upsert
+    per check refills, decides and takes atomically under the row lock. A missing
+    row is a full bucket, so rows of idle keys can be deleted at any time.
+    """
+
+    _TAKE = text(
+        """
+        INSERT INTO rate_limit_buckets AS b (key, tokens, updated_at, allowed)
+        VALUES (:key, :capacity - 1, now(), true)
+        ON CONFLICT (key) DO UPDATE SET
+            allowed = LEAST(:capacity, b.tokens + EXTRACT(EPOCH FROM now() - b.updated_at) * :rate) >= 1,
+            tokens = LEAST(:capacity, b.tokens + EXTRACT(EPOCH FROM now() - b.updated_at) * :rate)
+                     - CASE WHEN LEAST(:capacity, b.tokens + EXTRACT(EPOCH FROM now() - b.updated_at) * :rate) >= 1
+                            THEN 1 ELSE 0 END,
+            updated_at = now()
+        RETURNING tokens, allowed
+        """
+    )
+
+    def __init__(
+        self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
+        self.session_factory = session_factory
+
+    async def take(self, key: str, bucket: Bucket) -> float:
+        # Own transaction: the decision must stick even when the login itself fails
+        async with self.session_factory(isolated=True) as session:
+            result = await session.execute(
+                self._TAKE,
+                {"key": key, "capacity": bucket.capacity, "rate": bucket.rate},
+            )
+            row = result.one()
+        return 0.0 if row.allowed else (1 - row.tokens) / bucket.rate
+
+
+class LoginRateLimiter:
+    """
+    Admission control for password logins, checked before any bcrypt work: one
+    bucket per client IP (credential stuffing from one source) and one per
+    account (guessing one user's password from many sources).
+
+    The client IP is `request.client.host`, so behind a reverse proxy the server
+    must apply the proxy's X-Forwarded-For (uvicorn: --proxy-headers with
+    --forwarded-allow-ips / FORWARDED_ALLOW_IPS naming the proxy), or every login
+    shares the proxy's bucket.
+    """
+
+    def __init__(
+        self, backend: RateLimitBackend, per_ip: Bucket, per_account: Bucket
+    ) -> None:
+        self.backend = backend
+        self.per_ip = per_ip
+        self.per_account = per_account
+
+    async def check(self, username: str, client_ip: str) -> None:
+        retry_after = await self.backend.take(f"login:ip:{client_ip}", self.per_ip)
+        if not retry_after:
+            retry_after = await self.backend.take(
+                f"login:account:{username.strip().lower()}", self.per_account
+            )
+        if retry_after:
+            raise TooManyRequestsError(
+                retry_after, detail="Too many login attempts, try again later"
+            )
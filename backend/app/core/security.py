@@ -1,5 +1,10 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, TypeVar
+from collections.abc import Callable
 
 import jwt
 from passlib.context import CryptContext
@@ -8,6 +13,8 @@ from app.core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+R = TypeVar("R")
+
 
 ALGORITHM = "HS256"
 
@@ -25,3 +32,66 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small thread pool so that a login (~250 ms of CPU) does not
+    block the event loop. bcrypt releases the GIL while hashing, so threads run
+    in parallel with the loop; `max_workers` bounds how many hashes run at once
+    and the rest wait in the executor's queue.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.total_wait = 0.0
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def _run(self, func: Callable[..., R], *args: Any) -> R:
+        submitted = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+        def work() -> R:
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.total_wait += time.perf_counter() - submitted
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, work)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "max_queued": self.max_queued,
+                "completed": self.completed,
+                "avg_queue_wait_ms": 1000 * self.total_wait / self.completed
+                if self.completed
+                else 0.0,
+            }
+
+
+password_hasher = PasswordHasher(max_workers=settings.PASSWORD_HASH_WORKERS)
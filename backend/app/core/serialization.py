@@ -0,0 +1,30 @@
+from collections.abc import Iterable
+from typing import Any, TypeVar
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def construct_rows(model: type[M], rows: Iterable[dict[str, Any]]) -> list[M]:
+    """
+    Build `model` instances from rows the database has already typed, without
+    validation. Only use it for rows read from our own tables: constraints the
+    schema would enforce (lengths, patterns) are not checked again.
+    """
+    construct = model.model_construct
+    return [construct(**row) for row in rows]
+
+
+def json_response(content: BaseModel, status_code: int = 200) -> Response:
+    """
+    Encode `content` straight to JSON. Returning a Response skips FastAPI's
+    validation of the endpoint result against its `response_model`, which would
+    otherwise validate every row a second time.
+    """
+    return Response(
+        content.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -1,21 +1,20 @@
+import asyncio
 import logging
 
-from sqlmodel import Session
-
-from app.core.db import engine, init_db
+from app.core.db import database, init_db
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def init() -> None:
-    with Session(engine) as session:
-        init_db(session)
+async def init() -> None:
+    async with database.session() as session:
+        await session.run_sync(init_db)
 
 
 def main() -> None:
     logger.info("Creating initial data")
-    init()
+    asyncio.run(init())
     logger.info("Initial data created")
 
 
@@ -1,4 +1,3 @@
-from app.core.container import Container
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
@@ -6,6 +5,8 @@ from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
 from app.core.config import settings
+from app.core.container import Container
+from app.core.middleware import UnitOfWorkMiddleware
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -33,6 +34,9 @@ if settings.all_cors_origins:
         allow_headers=["*"],
     )
 
+# One session per request, committed once at the end
+app.add_middleware(UnitOfWorkMiddleware, database=container.db())
+
 app.state.container = container
 app.dependency_overrides_provider = container
 app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -1,9 +1,21 @@
 # app/models/department.py
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, UniqueConstraint
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
+
 from app.model.base import Base
 
 if TYPE_CHECKING:
@@ -27,6 +39,15 @@ class Department(Base):
         server_default=func.now(), 
         onupdate=func.now()
     )
+    # Full-text document for the "search" / "prefix" filter operators, kept up to date by Postgres
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(code, '') || ' ' || coalesce(description, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     # Relationships
     admins: Mapped[list["DepartmentAdmin"]] = relationship(
@@ -35,6 +56,14 @@ class Department(Base):
         cascade="all, delete-orphan"
     )
 
+    # pg_trgm indexes, see alembic revision 5f0c2b7d9a41
+    __table_args__ = (
+        Index("ix_departments_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_departments_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_departments_code_trgm", "code", postgresql_using="gin", postgresql_ops={"code": "gin_trgm_ops"}),
+        Index("ix_departments_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
+    )
+
     def __repr__(self):
         return f"<Department(id={self.id}, name='{self.name}', code='{self.code}')>"
 
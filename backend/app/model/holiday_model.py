@@ -0,0 +1,55 @@
+# app/models/holiday_model.py
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func, text
+
+from app.model.base import Base
+
+if TYPE_CHECKING:
+    from app.model.department_model import Department
+
+
+class Holiday(Base):
+    """A day off in the working-day calendar, company-wide when department_id is NULL"""
+
+    __tablename__ = "holidays"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    department_id: Mapped[int | None] = mapped_column(
+        ForeignKey("departments.id", ondelete="CASCADE")
+    )
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    is_half_day: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    # Relationships
+    department: Mapped[Optional["Department"]] = relationship("Department")
+
+    __table_args__ = (
+        # One entry per day and calendar; company-wide days are unique on their own
+        Index(
+            "uq_holidays_department_date",
+            "department_id",
+            "date",
+            unique=True,
+            postgresql_where=text("department_id IS NOT NULL"),
+        ),
+        Index(
+            "uq_holidays_company_date",
+            "date",
+            unique=True,
+            postgresql_where=text("department_id IS NULL"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<Holiday(id={self.id}, department_id={self.department_id}, date={self.date})>"
+
+
+from app.model.department_model import Department  # noqa
@@ -1,23 +1,86 @@
 # app/models/employee_leave_balance_model.py
-from datetime import datetime, date
-from typing import Optional
-from sqlmodel import SQLModel, Field, Relationship
-from app.model.base_model import BaseModel
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, Numeric, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
 
-class EmployeeLeaveBalanceBase(SQLModel):
-    employee_id: int = Field(..., foreign_key='"user".id')
-    leave_type_id: int = Field(..., foreign_key="leave_types.id")
-    year: int
-    total_days: int
-    used_days: int = Field(default=0)
-    carried_forward_days: int = Field(default=0)
-    carry_forward_expiry_date: Optional[date] = None
+from app.model.base import Base
 
+if TYPE_CHECKING:
+    from app.model.leave_type_model import LeaveType
+    from app.model.user_model import User
+
+
+class EmployeeLeaveBalance(Base):
+    """
+    One row per (employee, leave type, year). `used_days` is maintained by
+    LeaveService as requests are approved / cancelled, so reading a balance
+    never has to sum leave_requests.
+    """
 
-class EmployeeLeaveBalance(EmployeeLeaveBalanceBase, BaseModel, table=True):
     __tablename__ = "employee_leave_balance"
 
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    employee_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    leave_type_id: Mapped[int] = mapped_column(
+        ForeignKey("leave_types.id"), nullable=False
+    )
+    year: Mapped[int] = mapped_column(Integer, nullable=False)
+    total_days: Mapped[Decimal] = mapped_column(Numeric(6, 1), nullable=False)
+    used_days: Mapped[Decimal] = mapped_column(
+        Numeric(6, 1), default=0, server_default="0", nullable=False
+    )
+    carried_forward_days: Mapped[Decimal] = mapped_column(
+        Numeric(6, 1), default=0, server_default="0", nullable=False
+    )
+    carry_forward_expiry_date: Mapped[date | None] = mapped_column(Date)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
     # Relationships
-    leave_type: "LeaveType" = Relationship(back_populates="employee_balances")
-    employee: "User" = Relationship()
+    leave_type: Mapped["LeaveType"] = relationship(
+        "LeaveType", back_populates="employee_balances"
+    )
+    employee: Mapped["User"] = relationship("User")
+
+    __table_args__ = (
+        # The key the balance engine locks with SELECT ... FOR UPDATE
+        UniqueConstraint(
+            "employee_id",
+            "leave_type_id",
+            "year",
+            name="uq_employee_leave_balance_employee_type_year",
+        ),
+    )
+
+    def available_days(self, on: date | None = None) -> Decimal:
+        """Days still bookable; carried-forward days stop counting after their expiry date"""
+        carried = self.carried_forward_days or 0
+        if (
+            on is not None
+            and self.carry_forward_expiry_date is not None
+            and on > self.carry_forward_expiry_date
+        ):
+            carried = 0
+        return (
+            Decimal(self.total_days) + Decimal(carried) - Decimal(self.used_days or 0)
+        )
+
+    def __repr__(self):
+        return (
+            f"<EmployeeLeaveBalance(employee_id={self.employee_id}, leave_type_id={self.leave_type_id}, "
+            f"year={self.year}, used_days={self.used_days})>"
+        )
+
+
+from app.model.leave_type_model import LeaveType  # noqa
+from app.model.user_model import User  # noqa
@@ -1,35 +1,93 @@
-from datetime import datetime, date
+# app/models/leave_request_model.py
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
-from sqlmodel import SQLModel, Field, Relationship
-from app.model.base_model import BaseModel
-
-
-class LeaveRequestBase(SQLModel):
-    user_id: int = Field(..., foreign_key='"user".id')
-    leave_type_id: int = Field(..., foreign_key="leave_types.id")
-    project_id: Optional[int] = Field(default=None, foreign_key="projects.id")
-    start_date: date
-    end_date: date
-    number_of_days: Decimal
-    reason: Optional[str] = None
-    status: Optional[str] = Field(
-        default="pending",
-        description="Leave status",
-        sa_column_kwargs={
-            "check_constraint": "status IN ('pending', 'approved', 'rejected', 'withdrawn', 'cancelled')"
-        }
-    )
-    comments: Optional[str] = None
-    approved_rejected_at: Optional[datetime] = None
-    approved_rejected_by: Optional[int] = Field(default=None, foreign_key='"user".id')
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func, literal_column, text
+
+from app.model.base import Base
+
+if TYPE_CHECKING:
+    from app.model.leave_type_model import LeaveType
+    from app.model.user_model import User
 
+LEAVE_STATUSES = ("pending", "approved", "rejected", "withdrawn", "cancelled")
 
-class LeaveRequest(LeaveRequestBase, BaseModel, table=True):
+
+class LeaveRequest(Base):
     __tablename__ = "leave_requests"
 
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    leave_type_id: Mapped[int] = mapped_column(ForeignKey("leave_types.id"), nullable=False)
+    # projects has no table yet (SQLModel model only), so no foreign key for now
+    project_id: Mapped[int | None] = mapped_column(nullable=True)
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    end_date: Mapped[date] = mapped_column(Date, nullable=False)
+    # Leave starts at midday / ends at midday
+    start_half_day: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false", nullable=False)
+    end_half_day: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false", nullable=False)
+    # Working days between start_date and end_date, computed by LeaveService (app.core.workdays)
+    number_of_days: Mapped[Decimal] = mapped_column(Numeric(6, 1), nullable=False)
+    reason: Mapped[str | None] = mapped_column(Text)
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)
+    comments: Mapped[str | None] = mapped_column(Text)
+    # The employee's supervisor when the request was filed; the approval inbox reads it
+    supervisor_id: Mapped[int | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"))
+    approved_rejected_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    approved_rejected_by: Mapped[int | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
+
     # Relationships
-    employee: "User" = Relationship(back_populates="leave_requests")
-    leave_type: "LeaveType" = Relationship(back_populates="leave_requests")
-    project: Optional["Project"] = Relationship()
-    approved_by_user: Optional["User"] = Relationship(sa_relationship_kwargs={"foreign_keys": "[LeaveRequest.approved_rejected_by]"})
+    employee: Mapped["User"] = relationship("User", foreign_keys=[user_id])
+    supervisor: Mapped[Optional["User"]] = relationship("User", foreign_keys=[supervisor_id])
+    leave_type: Mapped["LeaveType"] = relationship("LeaveType", back_populates="leave_requests")
+    approved_by_user: Mapped[Optional["User"]] = relationship("User", foreign_keys=[approved_rejected_by])
+
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'approved', 'rejected', 'withdrawn', 'cancelled')",
+            name="check_leave_request_status",
+        ),
+        CheckConstraint("end_date >= start_date", name="check_leave_request_dates"),
+        Index("ix_leave_requests_user_id_start_date", "user_id", "start_date"),
+        # No two active requests of a user may share a day (btree_gist), see alembic revision 0b6f5d2e8a94
+        ExcludeConstraint(
+            ("user_id", "="),
+            (literal_column("daterange(start_date, end_date, '[]')"), "&&"),
+            name="excl_leave_requests_user_dates",
+            using="gist",
+            where=text("status IN ('pending', 'approved')"),
+        ),
+        # Approval inbox, see alembic revision 6d2a8f1c4b37
+        Index("ix_leave_requests_pending_inbox", "supervisor_id", "created_at", "id",
+              postgresql_where=text("status = 'pending'")),
+    )
+
+    def __repr__(self):
+        return f"<LeaveRequest(id={self.id}, user_id={self.user_id}, status='{self.status}')>"
+
+
+from app.model.leave_type_model import LeaveType  # noqa
+from app.model.user_model import User  # noqa
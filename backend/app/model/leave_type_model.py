@@ -1,22 +1,48 @@
 # app/models/leave_type_model.py
 from datetime import datetime
-from typing import Optional, List
-from sqlmodel import SQLModel, Field, Relationship
-from app.model.base_model import BaseModel
+from typing import TYPE_CHECKING, List, Optional
 
+from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
 
-class LeaveTypeBase(SQLModel):
-    name: str = Field(..., max_length=50)
-    code: str = Field(..., max_length=20)
-    description: Optional[str] = None
-    max_days_per_year: int = Field(default=0)
-    can_carry_forward: bool = Field(default=False)
-    is_active: bool = Field(default=True)
+from app.model.base import Base
 
+if TYPE_CHECKING:
+    from app.model.leave_balance_model import EmployeeLeaveBalance
+    from app.model.leave_request_model import LeaveRequest
 
-class LeaveType(LeaveTypeBase, BaseModel, table=True):
+
+class LeaveType(Base):
     __tablename__ = "leave_types"
 
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(50), nullable=False)
+    code: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
+    description: Mapped[str | None] = mapped_column(Text)
+    max_days_per_year: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    can_carry_forward: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
+
     # Relationships
-    leave_requests: List["LeaveRequest"] = Relationship(back_populates="leave_type")
-    employee_balances: List["EmployeeLeaveBalance"] = Relationship(back_populates="leave_type")
+    leave_requests: Mapped[list["LeaveRequest"]] = relationship("LeaveRequest", back_populates="leave_type")
+    employee_balances: Mapped[list["EmployeeLeaveBalance"]] = relationship(
+        "EmployeeLeaveBalance",
+        back_populates="leave_type"
+    )
+
+    def __repr__(self):
+        return f"<LeaveType(id={self.id}, code='{self.code}')>"
+
+
+from app.model.leave_request_model import LeaveRequest  # noqa
+from app.model.leave_balance_model import EmployeeLeaveBalance  # noqa
@@ -1,12 +1,22 @@
 # app/models/user_model.py
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional, List, Literal
+from typing import TYPE_CHECKING, List, Literal, Optional
 from uuid import UUID
-from sqlalchemy import String, Boolean, DateTime
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import text
-from sqlalchemy import CheckConstraint
+
 from app.model.base import Base
 
 if TYPE_CHECKING:
@@ -35,6 +45,18 @@ class User(Base):
         default="user",
         nullable=False
     )
+    # Department the user works in; picks the holiday calendar for their leave
+    department_id: Mapped[int | None] = mapped_column(
+        ForeignKey("departments.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True
+    )
+    # Who approves the user's leave and WFH requests
+    supervisor_id: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -47,12 +69,27 @@ class User(Base):
         onupdate=text("NOW()")
     )
 
+    # Full-text document for the "search" / "prefix" filter operators, kept up to date by Postgres
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || coalesce(email, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     # Constraints
     __table_args__ = (
         CheckConstraint(
             "role IN ('user', 'supervisor', 'admin', 'superAdmin')",
             name="check_user_role",
         ),
+        # pg_trgm indexes, see alembic revision 5f0c2b7d9a41
+        Index("ix_users_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_users_first_name_trgm", "first_name", postgresql_using="gin", postgresql_ops={"first_name": "gin_trgm_ops"}),
+        Index("ix_users_last_name_trgm", "last_name", postgresql_using="gin", postgresql_ops={"last_name": "gin_trgm_ops"}),
+        Index("ix_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
     )
 
     # Relationships
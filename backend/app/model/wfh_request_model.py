@@ -1,35 +1,59 @@
 # app/models/wfh_request_model.py
-from datetime import datetime, date
-from typing import Optional
-from sqlmodel import SQLModel, Field, Relationship
-from app.model.base_model import BaseModel
-
-
-class WfhRequestBase(SQLModel):
-    user_id: int = Field(..., foreign_key='"user".id')
-    request_date: date
-    reason: Optional[str] = None
-    status: Optional[str] = Field(
-        default="pending",
-        description="WFH request status",
-        sa_column_kwargs={
-            "check_constraint": "status IN ('pending', 'approved', 'rejected', 'withdrawn', 'cancelled')"
-        }
-    )
-    supervisor_id: Optional[int] = Field(default=None, foreign_key='"user".id')
-    approved_rejected_at: Optional[datetime] = None
-    approved_rejected_by: Optional[int] = Field(default=None, foreign_key='"user".id')
-    comments: Optional[str] = None
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import CheckConstraint, Date, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func, text
+
+from app.model.base import Base
 
+if TYPE_CHECKING:
+    from app.model.user_model import User
 
-class WfhRequest(WfhRequestBase, BaseModel, table=True):
+
+class WfhRequest(Base):
     __tablename__ = "wfh_requests"
 
-    # Relationships
-    employee: "User" = Relationship(back_populates="wfh_requests")
-    supervisor: Optional["User"] = Relationship(
-        sa_relationship_kwargs={"foreign_keys": "[WfhRequest.supervisor_id]"}
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    request_date: Mapped[date] = mapped_column(Date, nullable=False)
+    reason: Mapped[str | None] = mapped_column(Text)
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)
+    supervisor_id: Mapped[int | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"))
+    approved_rejected_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    approved_rejected_by: Mapped[int | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"))
+    comments: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
     )
-    approved_rejected_by_user: Optional["User"] = Relationship(
-        sa_relationship_kwargs={"foreign_keys": "[WfhRequest.approved_rejected_by]"}
+
+    # Relationships
+    employee: Mapped["User"] = relationship("User", foreign_keys=[user_id])
+    supervisor: Mapped[Optional["User"]] = relationship("User", foreign_keys=[supervisor_id])
+    approved_rejected_by_user: Mapped[Optional["User"]] = relationship("User", foreign_keys=[approved_rejected_by])
+
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'approved', 'rejected', 'withdrawn', 'cancelled')",
+            name="check_wfh_request_status",
+        ),
+        # At most one active WFH request per user and day, see alembic revision 0b6f5d2e8a94
+        Index("uq_wfh_requests_user_date_active", "user_id", "request_date", unique=True,
+              postgresql_where=text("status IN ('pending', 'approved')")),
+        # Approval inbox, see alembic revision 6d2a8f1c4b37
+        Index("ix_wfh_requests_pending_inbox", "supervisor_id", "created_at", "id",
+              postgresql_where=text("status = 'pending'")),
     )
+
+    def __repr__(self):
+        return f"<WfhRequest(id={self.id}, user_id={self.user_id}, request_date={self.request_date})>"
+
+
+from app.model.user_model import User  # noqa
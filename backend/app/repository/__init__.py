@@ -2,5 +2,19 @@
 # from app.repository.tag_repository import TagRepository
 # from app.repository.user_repository import UserRepository
 
+from app.repository.department_repository import DepartmentRepository
+from app.repository.holiday_repository import HolidayRepository
+from app.repository.leave_balance_repository import LeaveBalanceRepository
+from app.repository.leave_repository import LeaveRepository
 from app.repository.user_repository import UserRepository
-from app.repository.department_repository import DepartmentRepository
\ No newline at end of file
+from app.repository.wfh_repository import WfhRepository
+
+__all__ = [
+    "DepartmentRepository",
+    "HolidayRepository",
+    "LeaveBalanceRepository",
+    "LeaveRepository",
+    "UserRepository",
+    "WfhRepository",
+]
+
@@ -1,42 +1,131 @@
+import itertools
+import json
 from contextlib import AbstractAsyncContextManager
-from typing import Any, Callable, Dict, Type, TypeVar, List, Optional
+from typing import Any, Dict, Generic, NamedTuple, Protocol, Type, TypeVar, List, Optional
+from collections.abc import AsyncIterator, Callable, Hashable
 
-from sqlalchemy.exc import IntegrityError
+import pydantic
+
+from sqlalchemy.dialects.postgresql import TSVECTOR, insert as pg_insert
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import Select, asc, desc, func, inspect, select, update, delete
-from sqlalchemy.orm import joinedload, aliased, InstrumentedAttribute
+from sqlalchemy import ARRAY, Select, and_, any_, asc, bindparam, desc, false, func, insert, inspect, literal_column, or_, select, update, delete
+from sqlalchemy.orm import joinedload, aliased, class_mapper, InstrumentedAttribute
 
+from app.core.cache import LRUCache
 from app.core.config import settings
-from app.core.exceptions import DuplicatedError, NotFoundError
-from app.model.base_model import BaseModel
+from app.core.dataloader import DataLoader, request_loader
+from app.core.exceptions import DuplicatedError, NotFoundError, ValidationError
+from app.core.pagination import CountMode, coerce_cursor_value, decode_cursor, encode_cursor
+
+
+class _Entity(Protocol):
+    # Either model family (declarative or SQLModel) keyed by an integer id
+    id: Any
+
+
+# The mapped model a repository reads and writes; schemas coming in are pydantic models
+T = TypeVar("T", bound=_Entity)
+
+# Totals for count_mode="cached", shared by every repository in the process
+count_cache: LRUCache[Hashable, int] = LRUCache(maxsize=settings.COUNT_CACHE_SIZE, ttl=settings.COUNT_CACHE_TTL_SECONDS)
+
+
+class QueryShape(NamedTuple):
+    query: Select
+    keys: list[tuple[Any, bool]]
 
-T = TypeVar("T", bound=BaseModel)
 
+# Resolved get_filter_data queries, see BaseRepository._query_shape
+query_shape_cache: LRUCache[Hashable, QueryShape] = LRUCache(maxsize=settings.QUERY_SHAPE_CACHE_SIZE)
 
-class BaseRepository:
+
+def _escape_like(value: Any):
+    for char in ("\\", "%", "_"):
+        value = func.replace(value, char, "\\" + char)
+    return value
+
+
+def _search_expression(field: Any, op: str, value: Any):
+    """
+    Index-backed text search (unlike like/ilike, whose leading % rules out any index):
+      tsvector column (e.g. User.search_vector), GIN index:
+        search - websearch_to_tsquery syntax ("ada lovelace", "-intern", "\"exact phrase\"")
+        prefix - every row with a word starting with the value, for type-ahead
+      text column, pg_trgm GIN index:
+        search - trigram similarity (typo tolerant)
+        prefix - case-insensitive starts-with
+    """
+    if isinstance(field.type, TSVECTOR):
+        if op == "search":
+            query = func.websearch_to_tsquery("simple", value)
+        else:
+            # quote_literal keeps tsquery syntax in the value from being interpreted
+            query = func.to_tsquery("simple", func.concat(func.quote_literal(value), ":*"))
+        return field.op("@@")(query)
+    if op == "search":
+        return field.op("%")(value)
+    return field.ilike(func.concat(_escape_like(value), "%"), escape="\\")
+
+
+def _overlaps(field: Any, bounds: tuple):
+    low, high = bounds
+    if isinstance(field, list):
+        # [start_field, end_field] pair, both ends inclusive (leave and attendance dates)
+        start, end = field
+        return and_(start <= high, end >= low)
+    return field.op("&&")(func.daterange(low, high, "[]"))
+
+
+# Filter operators: field (or field pair) and bind parameter(s) -> SQL expression.
+# Only the requested operator's expression is ever built.
+FILTER_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "=": lambda field, value: field == value,
+    "==": lambda field, value: field == value,
+    "!=": lambda field, value: field != value,
+    ">": lambda field, value: field > value,
+    "<": lambda field, value: field < value,
+    ">=": lambda field, value: field >= value,
+    "<=": lambda field, value: field <= value,
+    "in": lambda field, value: field.in_(value),
+    "not_in": lambda field, value: field.not_in(value),
+    "like": lambda field, value: field.contains(value),
+    "ilike": lambda field, value: field.icontains(value),
+    "search": lambda field, value: _search_expression(field, "search", value),
+    "prefix": lambda field, value: _search_expression(field, "prefix", value),
+    "between": lambda field, bounds: field.between(*bounds),
+    "is_null": lambda field, is_null: field.is_(None) if is_null else field.is_not(None),
+    "overlaps": _overlaps,
+}
+
+
+class BaseRepository(Generic[T]):
     def __init__(self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]], model: Type[T]) -> None:
         self.session_factory = session_factory
         self.model = model
 
-    async def read_by_options(self, schema: T, eager: bool = False) -> dict:
-        async with self.session_factory() as session:
+    async def read_by_options(self, schema: pydantic.BaseModel, eager: bool = False) -> dict:
+        async with self.session_factory(read_only=True) as session:
             schema_as_dict: dict = schema.dict(exclude_none=True)
             ordering: str = schema_as_dict.get("ordering", settings.ORDERING)
             
             # Handle ordering safely
             order_field = ordering[1:] if ordering.startswith("-") else ordering
             if hasattr(self.model, order_field):
-                order_query = (
-                    getattr(self.model, order_field).desc()
-                    if ordering.startswith("-")
-                    else getattr(self.model, order_field).asc()
-                )
+                keys = [(getattr(self.model, order_field), ordering.startswith("-"))]
             else:
                 # Fallback to ID ordering if specified field doesn't exist
-                order_query = self.model.id.asc()
+                keys = []
+            if not any(field.key == "id" for field, _ in keys):
+                # id breaks ties so that every row has a unique position for keyset paging
+                keys.append((self.model.id, False))
             
             page = schema_as_dict.get("page", settings.PAGE)
             page_size = schema_as_dict.get("page_size", settings.PAGE_SIZE)
+            after = schema_as_dict.get("after")
+            before = schema_as_dict.get("before")
+            cursor = before or after
+            backwards = before is not None
             
             # TODO: Implement proper filter options
             # filter_options = dict_to_sqlalchemy_filter_options(self.model, schema.dict(exclude_none=True))
@@ -51,24 +140,39 @@ class BaseRepository:
             
             if filter_options:
                 query = query.where(filter_options)
+
+            # Get total count (without pagination)
+            count_mode = schema_as_dict.get("count_mode", settings.COUNT_MODE)
+            total_count = await self._count_total(
+                session, query, count_mode, cache_key=self._count_cache_key("read_by_options")
+            )
+
+            if cursor is not None:
+                query = query.where(self._keyset_condition(keys, cursor, backwards))
                 
-            query = query.order_by(order_query)
-            
+            query = self._apply_ordering(query, keys, backwards)
+
             # Execute query for results
+            has_more = False
             if page_size == "all":
                 result = await session.execute(query)
                 results = result.scalars().all()
             else:
-                query = query.limit(page_size).offset((page - 1) * page_size)
+                if cursor is None:
+                    query = query.offset(max(page - 1, 0) * page_size)
+                # One extra row tells whether another page exists without counting
+                query = query.limit(page_size + 1)
                 result = await session.execute(query)
                 results = result.scalars().all()
-            
-            # Get total count (without pagination)
-            count_query = select(func.count()).select_from(self.model)
-            if filter_options:
-                count_query = count_query.where(filter_options)
-            total_count_result = await session.execute(count_query)
-            total_count = total_count_result.scalar_one()
+                has_more = len(results) > page_size
+                results = results[:page_size]
+            if backwards:
+                results = list(reversed(results))
+
+            next_cursor, prev_cursor = self._page_cursors(
+                [[getattr(entity, field.key) for field, _ in keys] for entity in results],
+                has_more, page, after, before,
+            )
             
             return {
                 "founds": results,
@@ -77,97 +181,230 @@ class BaseRepository:
                     "page_size": page_size,
                     "ordering": ordering,
                     "total_count": total_count,
+                    "has_next": has_more if not backwards else bool(results),
+                    "next_cursor": next_cursor,
+                    "prev_cursor": prev_cursor,
                 },
             }
 
     async def read_by_id(self, id: int, eager: bool = False) -> T:
-        async with self.session_factory() as session:
-            query = select(self.model).where(self.model.id == id)
-            
-            if eager:
-                for eager_relation in getattr(self.model, "eagers", []):
-                    query = query.options(joinedload(getattr(self.model, eager_relation)))
-            
-            result = await session.execute(query)
-            entity = result.scalar_one_or_none()
-            
-            if not entity:
-                raise NotFoundError(detail=f"not found id : {id}")
-            return entity
-
-    async def create(self, schema: T) -> T:
+        async with self.session_factory(read_only=True) as session:
+            return await self._get_by_id(session, id, eager)
+
+    async def _get_by_id(self, session: AsyncSession, id: int, eager: bool = False) -> T:
+        query = select(self.model).where(self.model.id == id)
+
+        if eager:
+            for eager_relation in getattr(self.model, "eagers", []):
+                query = query.options(joinedload(getattr(self.model, eager_relation)))
+
+        result = await session.execute(query)
+        entity = result.scalar_one_or_none()
+
+        if not entity:
+            raise NotFoundError(detail=f"not found id : {id}")
+        return entity
+
+    async def read_by_ids(self, ids: list[int]) -> dict[int, T]:
+        """Entities for `ids` in one query, keyed by id; unknown ids are left out"""
+        if not ids:
+            return {}
+        async with self.session_factory(read_only=True) as session:
+            # One array parameter, so the statement is the same for any number of ids
+            ids_param = bindparam("ids", list(ids), type_=ARRAY(self.model.id.type))
+            result = await session.execute(select(self.model).where(self.model.id == any_(ids_param)))
+            return {entity.id: entity for entity in result.scalars()}
+
+    def loader(self) -> DataLoader[int, T]:
+        """
+        The request's DataLoader over `read_by_ids`: `await repo.loader().load(id)`
+        calls made concurrently are answered by a single query.
+        """
+        return request_loader(self.model, self.read_by_ids)
+
+    async def create(self, schema: pydantic.BaseModel) -> T:
         async with self.session_factory() as session:
             query = self.model(**schema.dict())
             try:
-                session.add(query)
-                await session.commit()
-                await session.refresh(query)
+                # A savepoint, so that a duplicate only undoes this insert and not the
+                # rest of the request's unit of work
+                async with session.begin_nested():
+                    session.add(query)
+                    await session.flush()
             except IntegrityError as e:
-                await session.rollback()
                 raise DuplicatedError(detail=str(e.orig))
+            # The session's owner commits (the request's unit of work, or Database.session)
+            await session.refresh(query)
             return query
 
-    async def update(self, id: int, schema: T) -> T:
+    async def _update_returning(self, session: AsyncSession, id: int, values: dict[str, Any]) -> T:
+        # UPDATE ... RETURNING: one statement, the updated row comes back with it
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        result = await session.execute(stmt)
+        entity = result.scalar_one_or_none()
+
+        if entity is None:
+            raise NotFoundError(detail=f"not found id : {id}")
+        return entity
+
+    async def update(self, id: int, schema: pydantic.BaseModel) -> T:
         async with self.session_factory() as session:
-            # Use update statement
-            stmt = (
-                update(self.model)
-                .where(self.model.id == id)
-                .values(**schema.dict(exclude_none=True))
-            )
-            result = await session.execute(stmt)
-            
-            if result.rowcount == 0:
-                raise NotFoundError(detail=f"not found id : {id}")
-                
-            await session.commit()
-            return await self.read_by_id(id)
+            return await self._update_returning(session, id, schema.dict(exclude_none=True))
 
     async def update_attr(self, id: int, column: str, value: Any) -> T:
         async with self.session_factory() as session:
-            stmt = (
-                update(self.model)
-                .where(self.model.id == id)
-                .values({column: value})
-            )
-            result = await session.execute(stmt)
-            
-            if result.rowcount == 0:
-                raise NotFoundError(detail=f"not found id : {id}")
-                
-            await session.commit()
-            return await self.read_by_id(id)
+            return await self._update_returning(session, id, {column: value})
 
-    async def whole_update(self, id: int, schema: T) -> T:
+    async def whole_update(self, id: int, schema: pydantic.BaseModel) -> T:
         async with self.session_factory() as session:
-            stmt = (
-                update(self.model)
-                .where(self.model.id == id)
-                .values(**schema.dict())
-            )
-            result = await session.execute(stmt)
-            
-            if result.rowcount == 0:
-                raise NotFoundError(detail=f"not found id : {id}")
-                
-            await session.commit()
-            return await self.read_by_id(id)
+            return await self._update_returning(session, id, schema.dict())
 
     async def delete_by_id(self, id: int) -> None:
         async with self.session_factory() as session:
-            # First check if entity exists
-            query = select(self.model).where(self.model.id == id)
-            result = await session.execute(query)
-            entity = result.scalar_one_or_none()
-            
-            if not entity:
+            stmt = delete(self.model).where(self.model.id == id).returning(self.model.id)
+            result = await session.execute(stmt)
+
+            if result.scalar_one_or_none() is None:
                 raise NotFoundError(detail=f"not found id : {id}")
-            
-            # Delete the entity
-            stmt = delete(self.model).where(self.model.id == id)
-            await session.execute(stmt)
-            await session.commit()
-    
+
+    # ------------------------------------------------------------------
+    # Bulk writes
+    # ------------------------------------------------------------------
+    # Rows go out as multi-row INSERT/UPDATE statements of settings.BULK_BATCH_SIZE
+    # rows, each batch in its own savepoint. When a batch fails it is retried row
+    # by row so that the report can tell which rows were rejected and why; the
+    # rows that did go in stay in the caller's transaction.
+    #
+    # Every bulk method returns a report:
+    #   {"total": n, "inserted": .., "updated": .., "failed": ..,
+    #    "rows": [{"index": i, "status": "inserted" | "updated" | "not_found" | "failed",
+    #              "id": .., "error": ..}, ...]}
+
+    async def bulk_create(self, schemas: list[Any], batch_size: int | None = None) -> dict:
+        stmt = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+        return await self._bulk_insert(stmt, schemas, batch_size)
+
+    async def bulk_upsert(
+        self,
+        schemas: list[Any],
+        conflict_cols: list[str],
+        batch_size: int | None = None,
+    ) -> dict:
+        if not conflict_cols:
+            raise ValidationError(detail="bulk_upsert needs at least one conflict column")
+        rows = [self._bulk_values(schema) for schema in schemas]
+        stmt = pg_insert(self.model)
+        update_cols = {
+            key: stmt.excluded[key]
+            for key in (rows[0] if rows else {})
+            if key not in conflict_cols and key != "id"
+        }
+        # DO NOTHING would return no row for conflicts and break the row/result pairing,
+        # so a row with nothing else to update just rewrites its conflict column
+        upsert = stmt.on_conflict_do_update(
+            index_elements=conflict_cols,
+            set_=update_cols or {conflict_cols[0]: stmt.excluded[conflict_cols[0]]},
+        )
+        # xmax is 0 only for tuples created by this statement, so it tells inserts from updates
+        returning = upsert.returning(
+            self.model.id,
+            literal_column("xmax = 0").label("inserted"),
+            sort_by_parameter_order=True,
+        )
+        return await self._bulk_insert(returning, rows, batch_size)
+
+    async def bulk_update(self, rows: list[dict[str, Any]], batch_size: int | None = None) -> dict:
+        """Update rows by primary key; each row is a dict holding "id" and the new values."""
+        results: list[dict] = []
+        async with self.session_factory() as session:
+            for start, chunk in self._bulk_chunks(rows, batch_size):
+                ids = [row["id"] for row in chunk]
+                found = set(
+                    (await session.execute(select(self.model.id).where(self.model.id.in_(ids)))).scalars()
+                )
+                existing = [(start + i, row) for i, row in enumerate(chunk) if row["id"] in found]
+                results.extend(
+                    {"index": start + i, "status": "not_found", "id": row["id"]}
+                    for i, row in enumerate(chunk)
+                    if row["id"] not in found
+                )
+                if not existing:
+                    continue
+                try:
+                    async with session.begin_nested():
+                        # ORM bulk UPDATE by primary key: one executemany per batch
+                        await session.execute(update(self.model), [row for _, row in existing])
+                    results.extend({"index": index, "status": "updated", "id": row["id"]} for index, row in existing)
+                except (IntegrityError, DBAPIError):
+                    for index, row in existing:
+                        try:
+                            async with session.begin_nested():
+                                await session.execute(update(self.model), [row])
+                            results.append({"index": index, "status": "updated", "id": row["id"]})
+                        except (IntegrityError, DBAPIError) as e:
+                            results.append(self._bulk_failure(index, e, id=row["id"]))
+        return self._bulk_report(results)
+
+    async def _bulk_insert(self, stmt: Any, schemas: list[Any], batch_size: int | None) -> dict:
+        rows = [self._bulk_values(schema) for schema in schemas]
+        results: list[dict] = []
+        async with self.session_factory() as session:
+            for start, chunk in self._bulk_chunks(rows, batch_size):
+                try:
+                    async with session.begin_nested():
+                        returned = (await session.execute(stmt, chunk)).all()
+                    results.extend(self._bulk_outcome(start + i, row) for i, row in enumerate(returned))
+                except (IntegrityError, DBAPIError):
+                    for i, values in enumerate(chunk):
+                        try:
+                            async with session.begin_nested():
+                                returned = (await session.execute(stmt, [values])).all()
+                            results.append(self._bulk_outcome(start + i, returned[0]))
+                        except (IntegrityError, DBAPIError) as e:
+                            results.append(self._bulk_failure(start + i, e))
+        return self._bulk_report(results)
+
+    def _bulk_values(self, schema: Any) -> dict[str, Any]:
+        values = dict(schema) if isinstance(schema, dict) else schema.dict()
+        # A None primary key would be inserted as NULL instead of taking the column default
+        for column in class_mapper(self.model).primary_key:
+            if values.get(column.key, False) is None:
+                del values[column.key]
+        return values
+
+    @staticmethod
+    def _bulk_chunks(rows: list[Any], batch_size: int | None):
+        size = batch_size or settings.BULK_BATCH_SIZE
+        for start in range(0, len(rows), size):
+            yield start, rows[start:start + size]
+
+    @staticmethod
+    def _bulk_outcome(index: int, row: Any) -> dict:
+        inserted = row._mapping.get("inserted", True)
+        return {"index": index, "status": "inserted" if inserted else "updated", "id": row.id}
+
+    @staticmethod
+    def _bulk_failure(index: int, error: DBAPIError, **extra: Any) -> dict:
+        return {"index": index, "status": "failed", "error": str(error.orig), **extra}
+
+    @staticmethod
+    def _bulk_report(results: list[dict]) -> dict:
+        results.sort(key=lambda row: row["index"])
+        statuses = [row["status"] for row in results]
+        return {
+            "total": len(results),
+            "inserted": statuses.count("inserted"),
+            "updated": statuses.count("updated"),
+            "failed": statuses.count("failed"),
+            "rows": results,
+        }
+
     # ------------------------------------------------------------------
     # Include columns & joins dynamically
     # ------------------------------------------------------------------
@@ -227,61 +464,142 @@ class BaseRepository:
             
             q = q.with_only_columns(*select_columns)
          else:
-            q = q.with_only_columns([base_alias])
+            q = q.with_only_columns(base_alias)
 
          return q, model_aliases
 
     # ------------------------------------------------------------------
     # Apply filters
     # ------------------------------------------------------------------
+    # A filter spec is a list of nodes that are ANDed together. A node is either
+    #   a condition  {"field": "User.email", "op": "ilike", "value": "ada"}
+    #   or a group   {"and": [nodes]}, {"or": [nodes]}, {"not": node}
+    # Operators are listed in FILTER_OPERATORS. "between" and "overlaps" take a
+    # [low, high] value; "overlaps" takes either a range column or a
+    # [start_field, end_field] pair as its field. "is_null" takes true / false.
+    # Conditions whose value is None are left out, so optional request
+    # parameters can be passed straight through.
     def _apply_filters(
     self,
     query: Select,
     filter_spec: Optional[List[Dict[str, Any]]],
     model_aliases: Dict[str, Any],
 ) -> Select:
-        if not filter_spec:
-            return query
-
-        # Normalize filter_spec - handle different input formats
-        normalized_filters = self._normalize_filter_spec(filter_spec)
-        
-        for f in normalized_filters:
-            field_path = f.get("field")
-            op = f.get("op")
-            value = f.get("value")
-
-            if not all([field_path, op, value is not None]):
-                continue
+        """
+        Add the filter predicates with named bind parameters (f_0, f_1, ...) in place of
+        the values, so the resulting query can be cached and reused for any values;
+        `_filter_params` produces the matching parameters.
+        """
+        expr = self._filter_expression(self._filter_tree(filter_spec), model_aliases)
+        if expr is not None:
+            query = query.filter(expr)
+        return query
 
-            # Resolve field path to actual SQLAlchemy field
-            field = self._resolve_field_path(field_path, model_aliases)
-            if not field:
-                continue
+    def _filter_tree(self, filter_spec: Any) -> tuple | None:
+        """
+        Normalise a filter spec into ("and" | "or", [children]), ("not", child) and
+        ("cond", i, filter) nodes, numbering the conditions that will be applied
+        """
+        counter = itertools.count()
+
+        def build(node: Any) -> tuple | None:
+            if isinstance(node, (list, tuple)):
+                return group("and", node)
+            if not isinstance(node, dict):
+                return None
+            if "and" in node or "or" in node:
+                op = "and" if "and" in node else "or"
+                return group(op, node[op] or [])
+            if "not" in node:
+                child = build(node["not"])
+                return ("not", child) if child is not None else None
+            if node.get("field") and node.get("op") and node.get("value") is not None:
+                if node["op"] not in FILTER_OPERATORS:
+                    raise ValidationError(detail=f"unknown filter operator: {node['op']}")
+                return ("cond", next(counter), node)
+            return None
 
-            # Create filter expression
-            expr = self._create_filter_expression(field, op, value)
-            if expr:
-                query = query.filter(expr)
+        def group(op: str, nodes: Any) -> tuple | None:
+            children = [child for child in map(build, nodes) if child is not None]
+            if not children:
+                return None
+            return children[0] if len(children) == 1 else (op, children)
 
-        return query
+        return build(filter_spec) if filter_spec else None
 
-    def _normalize_filter_spec(self, filter_spec: Any) -> List[Dict[str, Any]]:
-        """Normalize filter spec to ensure it's a list of dictionaries"""
-        normalized = []
-        
-        if isinstance(filter_spec, list):
-            for item in filter_spec:
-                if isinstance(item, dict):
-                    normalized.append(item)
-                elif isinstance(item, list):
-                    # Flatten nested lists
-                    normalized.extend(self._normalize_filter_spec(item))
-        elif isinstance(filter_spec, dict):
-            # Single filter as dict
-            normalized.append(filter_spec)
-        
-        return normalized
+    def _filter_expression(self, node: tuple | None, model_aliases: dict[str, Any]):
+        if node is None:
+            return None
+        if node[0] in ("and", "or"):
+            exprs = [e for e in (self._filter_expression(child, model_aliases) for child in node[1]) if e is not None]
+            if not exprs:
+                return None
+            return and_(*exprs) if node[0] == "and" else or_(*exprs)
+        if node[0] == "not":
+            expr = self._filter_expression(node[1], model_aliases)
+            return None if expr is None else ~expr
+
+        _, i, f = node
+        field = (
+            [self._resolve_field_path(path, model_aliases) for path in f["field"]]
+            if isinstance(f["field"], (list, tuple))
+            else self._resolve_field_path(f["field"], model_aliases)
+        )
+        if field is None or (isinstance(field, list) and any(part is None for part in field)):
+            return None
+        return self._create_filter_expression(field, f["op"], self._filter_binds(i, f))
+
+    @staticmethod
+    def _filter_binds(i: int, f: dict[str, Any]) -> Any:
+        op = f["op"]
+        if op in ("between", "overlaps"):
+            return (bindparam(f"f_{i}_0"), bindparam(f"f_{i}_1"))
+        if op == "is_null":
+            # Part of the query shape, see _filter_signature
+            return bool(f["value"])
+        return bindparam(f"f_{i}", expanding=op in ("in", "not_in"))
+
+    def _filter_params(self, filter_spec: Any) -> dict[str, Any]:
+        """Bind parameter values for the placeholders added by `_apply_filters`"""
+        params = {}
+        for _, i, f in self._filter_conditions(self._filter_tree(filter_spec)):
+            op, value = f["op"], f["value"]
+            if op in ("between", "overlaps"):
+                if not isinstance(value, (list, tuple)) or len(value) != 2:
+                    raise ValidationError(detail=f"{op} needs a [low, high] value")
+                params[f"f_{i}_0"], params[f"f_{i}_1"] = value
+            elif op != "is_null":
+                if op in ("in", "not_in") and not isinstance(value, (list, tuple, set)):
+                    value = [value]
+                params[f"f_{i}"] = value
+        return params
+
+    def _filter_signature(self, filter_spec: Any) -> tuple | None:
+        """The shape of a filter spec: its groups, fields and operators, without the values"""
+
+        def signature(node: tuple | None) -> tuple | None:
+            if node is None:
+                return None
+            if node[0] == "cond":
+                f = node[2]
+                field = tuple(f["field"]) if isinstance(f["field"], (list, tuple)) else f["field"]
+                return (field, f["op"], bool(f["value"])) if f["op"] == "is_null" else (field, f["op"])
+            if node[0] == "not":
+                return ("not", signature(node[1]))
+            return (node[0], tuple(signature(child) for child in node[1]))
+
+        return signature(self._filter_tree(filter_spec))
+
+    def _filter_conditions(self, node: tuple | None):
+        if node is None:
+            return
+        if node[0] == "cond":
+            yield node
+        elif node[0] == "not":
+            yield from self._filter_conditions(node[1])
+        else:
+            for child in node[1]:
+                yield from self._filter_conditions(child)
 
     def _resolve_field_path(self, field_path: str, model_aliases: Dict[str, Any]) -> Optional[InstrumentedAttribute]:
         """Resolve field path like 'User.user_id' to SQLAlchemy field"""
@@ -297,36 +615,22 @@ class BaseRepository:
         
         return getattr(model_alias, field_name, None)
 
-    def _create_filter_expression(self, field: InstrumentedAttribute, op: str, value: Any):
-        """Create SQLAlchemy filter expression"""
-        operator_map = {
-            "=": field == value,
-            "==": field == value,
-            "!=": field != value,
-            ">": field > value,
-            "<": field < value,
-            ">=": field >= value,
-            "<=": field <= value,
-            "in": field.in_(value if isinstance(value, list) else [value]),
-            "like": field.like(f"%{value}%"),
-            "ilike": field.ilike(f"%{value}%"),
-        }
-        
-        return operator_map.get(op)
+    def _create_filter_expression(self, field: Any, op: str, value: Any):
+        """Create SQLAlchemy filter expression, building only the requested operator"""
+        build = FILTER_OPERATORS.get(op)
+        return build(field, value) if build is not None else None
+
     # ------------------------------------------------------------------
     # Apply order by
     # ------------------------------------------------------------------
-    def _apply_ordering(
+    def _resolve_order_keys(
         self,
-        query: Select,
         order_by: Optional[List[str]],
         model_aliases: Dict[str, Any],
-    ) -> Select:
-        if not order_by:
-            return query
-
-        order_clauses = []
-        for ob in order_by:
+    ) -> list[tuple[Any, bool]]:
+        """Resolve order_by entries to (field, descending) pairs, always ending with the base id"""
+        keys = []
+        for ob in order_by or []:
             ob = ob.strip()
 
             if ob.endswith(" desc"):
@@ -348,12 +652,130 @@ class BaseRepository:
 
             field = getattr(model_alias, field_name, None)
             if field is not None:
-                order_clauses.append(desc(field) if descending else asc(field))
+                keys.append((field, descending))
 
+        # id breaks ties so that every row has a unique position for keyset paging
+        base_id = model_aliases[self.model.__name__].id
+        if not any(field is base_id for field, _ in keys):
+            keys.append((base_id, False))
+        return keys
+
+    def _apply_ordering(
+        self,
+        query: Select,
+        keys: list[tuple[Any, bool]],
+        backwards: bool = False,
+    ) -> Select:
+        order_clauses = [
+            desc(field) if descending != backwards else asc(field)
+            for field, descending in keys
+        ]
         if order_clauses:
             query = query.order_by(*order_clauses)
         return query
 
+    # ------------------------------------------------------------------
+    # Keyset (cursor) pagination
+    # ------------------------------------------------------------------
+    def _keyset_condition(
+        self,
+        keys: list[tuple[Any, bool]],
+        cursor: str,
+        backwards: bool = False,
+    ):
+        """
+        Build the "row comes after the cursor" predicate for the given ordering.
+        Mirrors Postgres' default null placement (NULLS LAST for ASC, NULLS FIRST for DESC).
+        """
+        raw_values = decode_cursor(cursor, size=len(keys))
+        values = [coerce_cursor_value(field, v) for (field, _), v in zip(keys, raw_values, strict=True)]
+
+        clauses = []
+        equal_prefix = []
+        for (field, descending), value in zip(keys, values, strict=True):
+            ascending = descending == backwards
+            nullable = getattr(getattr(field, "expression", field), "nullable", True)
+            if value is None:
+                strict = None if ascending else field.is_not(None)
+            elif ascending:
+                strict = or_(field > value, field.is_(None)) if nullable else field > value
+            else:
+                strict = field < value
+
+            if strict is not None:
+                clauses.append(and_(*equal_prefix, strict))
+            equal_prefix.append(field.is_(None) if value is None else field == value)
+
+        return or_(*clauses) if clauses else false()
+
+    def _page_cursors(
+        self,
+        key_values: list[list[Any]],
+        has_more: bool,
+        page: int = 1,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> tuple[str | None, str | None]:
+        """
+        Return (next_cursor, prev_cursor) for a page whose rows are already in display order.
+        `has_more` tells whether rows exist beyond the page in the direction it was read.
+        """
+        if not key_values:
+            return None, None
+        if before is not None:
+            return encode_cursor(key_values[-1]), encode_cursor(key_values[0]) if has_more else None
+        next_cursor = encode_cursor(key_values[-1]) if has_more else None
+        prev_cursor = encode_cursor(key_values[0]) if after is not None or page > 1 else None
+        return next_cursor, prev_cursor
+
+    # ------------------------------------------------------------------
+    # Counting
+    # ------------------------------------------------------------------
+    async def _count_total(
+        self,
+        session: AsyncSession,
+        query: Select,
+        count_mode: CountMode = "exact",
+        cache_key: Any = None,
+        params: Optional[dict[str, Any]] = None,
+    ) -> int | None:
+        """
+        Total rows matched by `query` (before pagination), computed per `count_mode`.
+        "window" totals come back with the page itself, so here they fall back to an exact count.
+        """
+        query = query.order_by(None).limit(None).offset(None)
+
+        if count_mode == "none":
+            return None
+        if count_mode == "estimated":
+            return await self._estimate_count(session, query.params(params or {}))
+        if count_mode == "cached":
+            cached = count_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        count_query = select(func.count()).select_from(query.subquery())
+        total = (await session.execute(count_query, params or {})).scalar() or 0
+        if count_mode == "cached":
+            count_cache.set(cache_key, total)
+        return total
+
+    async def _estimate_count(self, session: AsyncSession, query: Select) -> int:
+        """Planner row estimate for `query`; no rows are read"""
+        conn = await session.connection()
+        compiled = query.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+        params: Any = compiled.params
+        if compiled.positiontup:
+            params = tuple(params[name] for name in compiled.positiontup)
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _count_cache_key(self, *parts: Any) -> str:
+        return json.dumps([self.model.__name__, *parts], sort_keys=True, default=str)
+
     # ------------------------------------------------------------------
     # Pagination helper
     # ------------------------------------------------------------------
@@ -363,13 +785,53 @@ class BaseRepository:
         query: Select,
         page: int = 1,
         per_page: int = 20,
+        count_mode: CountMode = "exact",
+        cache_key: Any = None,
+        params: Optional[dict[str, Any]] = None,
     ):
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await session.execute(count_query)
-        total = total_result.scalar() or 0
-        query = query.limit(per_page).offset((page - 1) * per_page)
+        total = None
+        if count_mode != "window":
+            total = await self._count_total(session, query, count_mode, cache_key, params)
+        # One extra row tells whether another page exists without counting
+        query = query.limit(per_page + 1).offset(max(page - 1, 0) * per_page)
         return query, total
 
+    # ------------------------------------------------------------------
+    # Query shape cache
+    # ------------------------------------------------------------------
+    def _query_shape(
+        self,
+        columns: Optional[list[str]] = None,
+        joins: Optional[list[dict]] = None,
+        filter_spec: Optional[list[dict[str, Any]]] = None,
+        order_by: Optional[list[str]] = None,
+    ) -> QueryShape:
+        """
+        The parameterised select (columns, joins, filters, cursor columns) and ordering keys
+        for a request. Shapes are cached per (model, columns, joins, filter fields, order fields),
+        so repeated requests only bind `_filter_params`.
+        """
+        key = (
+            self.model,
+            tuple(columns or ()),
+            tuple(joins or ()),
+            self._filter_signature(filter_spec),
+            tuple(order_by or ()),
+        )
+        shape = query_shape_cache.get(key)
+        if shape is None:
+            q, model_aliases = self._include_columns_and_joins(columns, joins)
+            q = self._apply_filters(q, filter_spec, model_aliases)
+            keys = self._resolve_order_keys(order_by, model_aliases)
+            q = q.add_columns(*(field.label(f"_cursor_{i}") for i, (field, _) in enumerate(keys)))
+            shape = QueryShape(q, keys)
+            query_shape_cache.set(key, shape)
+        return shape
+
+    @staticmethod
+    def query_shape_cache_stats() -> dict:
+        return query_shape_cache.stats()
+
     # ------------------------------------------------------------------
     # Main dynamic get_all method
     # ------------------------------------------------------------------
@@ -381,24 +843,106 @@ class BaseRepository:
         order_by: Optional[List[str]] = None,
         page: int = 1,
         per_page: int = 20,
+        after: str | None = None,
+        before: str | None = None,
+        count_mode: CountMode | None = None,
     ):
-        async with self.session_factory() as session:
-            q, model_aliases = self._include_columns_and_joins(columns, joins)
-            q = self._apply_filters(q, filter_spec, model_aliases)
-            q = self._apply_ordering(q, order_by, model_aliases)
-            q, total = await self._apply_pagination(session, q, page, per_page)
+        """
+        Offset pagination by default; pass the `after` / `before` cursor of a previous
+        page to switch to keyset pagination, which costs the same at any depth.
+        `count_mode` picks how `total` is produced (see app.core.pagination.CountMode).
+        """
+        count_mode = count_mode or settings.COUNT_MODE
+        cache_key = self._count_cache_key(columns, joins, filter_spec) if count_mode == "cached" else None
+
+        shape = self._query_shape(columns, joins, filter_spec, order_by)
+        params = self._filter_params(filter_spec)
+
+        async with self.session_factory(read_only=True) as session:
+            q, keys = shape
+            filtered_q = q
+
+            cursor = before or after
+            backwards = before is not None
+            window = count_mode == "window"
+            if window:
+                # Page rows and total in one statement. The keyset predicate would narrow
+                # count(*) OVER (), so cursor pages count the filtered set in an InitPlan instead.
+                if cursor is None:
+                    total_column = func.count().over()
+                else:
+                    total_column = select(func.count()).select_from(filtered_q.subquery()).scalar_subquery()
+                q = q.add_columns(total_column.label("_total"))
+
+            if cursor is None:
+                q = self._apply_ordering(q, keys)
+                q, total = await self._apply_pagination(session, q, page, per_page, count_mode, cache_key, params)
+            else:
+                total = None if window else await self._count_total(session, q, count_mode, cache_key, params)
+                q = q.where(self._keyset_condition(keys, cursor, backwards))
+                q = self._apply_ordering(q, keys, backwards).limit(per_page + 1)
 
-            result = await session.execute(q)
+            result = await session.execute(q, params)
             items = [dict(row._mapping) for row in result.all()]
+            if window:
+                totals = [item.pop("_total") for item in items]
+                if totals:
+                    total = totals[0]
+                elif cursor is None and page <= 1:
+                    total = 0
+                else:
+                    # Past the last row the window has nothing to report on
+                    total = await self._count_total(session, filtered_q, "exact", params=params)
+            has_more = len(items) > per_page
+            items = items[:per_page]
+            if backwards:
+                items.reverse()
+            key_values = [[item.pop(f"_cursor_{i}") for i in range(len(keys))] for item in items]
+            next_cursor, prev_cursor = self._page_cursors(key_values, has_more, page, after, before)
 
             return {
                 "items": items,
                 "total": total,
                 "page": page,
                 "per_page": per_page,
-                "total_pages": (total + per_page - 1) // per_page if per_page else 1,
+                "total_pages": (total + per_page - 1) // per_page if per_page and total is not None else None,
+                "has_next": has_more if not backwards else bool(items),
+                "next_cursor": next_cursor,
+                "prev_cursor": prev_cursor,
             }
 
+    async def stream_filter_data(
+        self,
+        columns: Optional[list[str]] = None,
+        joins: Optional[list[dict]] = None,
+        filter_spec: Optional[list[dict[str, Any]]] = None,
+        order_by: Optional[list[str]] = None,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Same query as `get_filter_data`, without paging, yielded in chunks of
+        `chunk_size` rows read from a server-side cursor, so memory use does not
+        grow with the size of the result.
+        """
+        q, keys = self._query_shape(columns, joins, filter_spec, order_by)
+        q = self._apply_ordering(q, keys)
+        params = self._filter_params(filter_spec)
+        cursor_labels = [f"_cursor_{i}" for i in range(len(keys))]
+
+        # A session of its own: the response is still streaming after the request's unit of work is done
+        async with self.session_factory(isolated=True, read_only=True) as session:
+            result = await session.stream(
+                q, params, execution_options={"yield_per": chunk_size or settings.STREAM_CHUNK_SIZE}
+            )
+            async for partition in result.partitions():
+                chunk = []
+                for row in partition:
+                    item = dict(row._mapping)
+                    for label in cursor_labels:
+                        item.pop(label, None)
+                    chunk.append(item)
+                yield chunk
+
     async def close_scoped_session(self) -> None:
         # In async context, session management is typically handled by the context manager
         # This method might not be needed anymore
@@ -1,63 +1,113 @@
 from contextlib import AbstractAsyncContextManager
-from typing import Any, Callable
+from typing import Any, List, Optional
+from collections.abc import AsyncIterator, Callable
+from app.core.pagination import CountMode
 import uuid
-from sqlalchemy import func, select
+from datetime import date
+from sqlalchemy import exists, func, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.exceptions import ValidationError
 from app.model.department_model import Department
+from app.model.leave_request_model import LeaveRequest
+from app.model.user_model import User
+from app.model.wfh_request_model import WfhRequest
 from app.repository.base_repository import BaseRepository
 
 
-class DepartmentRepository(BaseRepository):
+class DepartmentRepository(BaseRepository[Department]):
+    list_columns = [ "Department.id", "Department.name", "Department.code", "Department.description", "Department.created_at", "Department.updated_at" ]
+
     def __init__(self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]):
         super().__init__(session_factory, Department)
 
-    async def get_all_departments(self, skip: int = 0, limit: int = 100) -> Any:
-        async with self.session_factory() as session:
-            # Get total count - await the scalar result
+    async def get_all_departments(self, skip: int = 0, limit: int = 100,
+                                  after: str | None = None, before: str | None = None,
+                                  count_mode: CountMode | None = None) -> Any:
+        departments  = await super().get_filter_data(self.list_columns, None, None, None, page=skip, per_page=limit,
+                                                     after=after, before=before, count_mode=count_mode)
+
+        return departments
+
+    async def has_member_supervised_by(self, department_id: int, supervisor_id: int) -> bool:
+        """Whether some member of the department reports to `supervisor_id`"""
+        query = select(exists().where(User.department_id == department_id, User.supervisor_id == supervisor_id))
+        async with self.session_factory(read_only=True) as session:
+            return bool((await session.execute(query)).scalar())
 
-            columns = [ "Department.id", "Department.name", "Department.code", "Department.description", "Department.created_at", "Department.updated_at" ]
-         
-            departments  = await super().get_filter_data(columns, None, None, None, page=skip, per_page=limit)
+    async def get_absence_rows(self, department_id: int, year: int) -> tuple[list, list, list]:
+        """
+        Members of the department, with their active leave and WFH requests touching `year`:
+        ([(id, first_name, last_name)], [(user_id, start_date, end_date, status)], [(user_id, request_date, status)])
+        """
+        first, last = date(year, 1, 1), date(year, 12, 31)
+        async with self.session_factory(read_only=True) as session:
+            members = (
+                select(User.id, User.first_name, User.last_name)
+                .where(User.department_id == department_id, User.is_active)
+                .order_by(User.last_name, User.first_name, User.id)
+            )
+            leaves = (
+                select(LeaveRequest.user_id, LeaveRequest.start_date, LeaveRequest.end_date, LeaveRequest.status)
+                .join(User, User.id == LeaveRequest.user_id)
+                .where(
+                    User.department_id == department_id,
+                    LeaveRequest.status.in_(("pending", "approved")),
+                    func.daterange(LeaveRequest.start_date, LeaveRequest.end_date, literal_column("'[]'"))
+                    .op("&&")(func.daterange(first, last, literal_column("'[]'"))),
+                )
+            )
+            wfh = (
+                select(WfhRequest.user_id, WfhRequest.request_date, WfhRequest.status)
+                .join(User, User.id == WfhRequest.user_id)
+                .where(
+                    User.department_id == department_id,
+                    WfhRequest.status.in_(("pending", "approved")),
+                    WfhRequest.request_date.between(first, last),
+                )
+            )
+            return (
+                [tuple(row) for row in await session.execute(members)],
+                [tuple(row) for row in await session.execute(leaves)],
+                [tuple(row) for row in await session.execute(wfh)],
+            )
 
-            return departments
+    def stream_all_departments(self) -> AsyncIterator[list[dict]]:
+        return super().stream_filter_data(self.list_columns)
         
-    async def get_departments_by_admin(self,  userId: uuid.UUID, skip: int = 0, limit: int = 100) -> Any:
-        async with self.session_factory() as session:
-            # Get total count - await the scalar result
-
-            # columns = [ "Department.id", "Department.name", "Department.code", "Department.description", 
-            #            "DepartmentAdmin.User.first_name", "DepartmentAdmin.User.last_name" ]
-            
-            # joins = [ ("DepartmentAdmin", "Department.id == DepartmentAdmin.department_id"),
-            #             ("User", "DepartmentAdmin.user_id == User.id") ]
-            # filters = [ f"DepartmentAdmin.user_id == '{userId}'" ]
-
-            # columns = [ 
-            #         "Department.id", 
-            #         "Department.name", 
-            #         "User.first_name", 
-            #         "User.last_name" 
-            # ]
-
-            columns = [ "Department.id", "Department.name", "Department.code", "Department.description", 
-                        "Department.created_at", "Department.updated_at",
-                         "User.first_name", 
-                        "User.last_name"  ]
-         
-
-            joins = [
-                "admins",        # Department.adins relationship
-                "admins.user"    # DepartmentAdmin.user relationship
-            ]
-
-            # Single filter
-            filters = [{"field": "User.user_id", "op": "=", "value": "123"}]
-
-            # Multiple filters
-            # filters = [
-            #     {"field": "User.user_id", "op": "=", "value": "123"},
-            #     {"field": "Department.name", "op": "like", "value": "IT"}]
-
-            departments  = await super().get_filter_data(columns, joins, filters, None, page=skip, per_page=limit)
-
-            return departments
\ No newline at end of file
+    async def get_departments_by_admin(self,  userId: uuid.UUID, skip: int = 0, limit: int = 100,
+                                       after: str | None = None, before: str | None = None,
+                                       count_mode: CountMode | None = None) -> Any:
+        # columns = [ "Department.id", "Department.name", "Department.code", "Department.description",
+        #            "DepartmentAdmin.User.first_name", "DepartmentAdmin.User.last_name" ]
+
+        # joins = [ ("DepartmentAdmin", "Department.id == DepartmentAdmin.department_id"),
+        #             ("User", "DepartmentAdmin.user_id == User.id") ]
+        # filters = [ f"DepartmentAdmin.user_id == '{userId}'" ]
+
+        # columns = [
+        #         "Department.id",
+        #         "Department.name",
+        #         "User.first_name",
+        #         "User.last_name"
+        # ]
+
+        columns = [ "Department.id", "Department.name", "Department.code", "Department.description",
+                    "Department.created_at", "Department.updated_at",
+                     "User.first_name",
+                    "User.last_name"  ]
+
+
+        joins = [
+            "admins",        # Department.adins relationship
+            "admins.user"    # DepartmentAdmin.user relationship
+        ]
+
+        # The filter DSL drops conditions on None, which would list every department
+        if userId is None:
+            raise ValidationError(detail="userId is required")
+        filters = [{"field": "User.user_id", "op": "=", "value": userId}]
+
+        departments  = await super().get_filter_data(columns, joins, filters, None, page=skip, per_page=limit,
+                                                     after=after, before=before, count_mode=count_mode)
+
+        return departments
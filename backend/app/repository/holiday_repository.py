@@ -0,0 +1,28 @@
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.workdays import HolidayCalendars, HolidayRow
+from app.model.holiday_model import Holiday
+from app.repository.base_repository import BaseRepository
+
+
+class HolidayRepository(BaseRepository[Holiday]):
+    def __init__(
+        self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ):
+        super().__init__(session_factory, Holiday)
+
+    async def get_holiday_rows(self) -> list[HolidayRow]:
+        async with self.session_factory(read_only=True) as session:
+            query = select(Holiday.department_id, Holiday.date, Holiday.is_half_day)
+            return [
+                (row.department_id, row.date, row.is_half_day)
+                for row in await session.execute(query)
+            ]
+
+    async def get_calendars(self) -> HolidayCalendars:
+        """Every department's working-day calendar, from one query"""
+        return HolidayCalendars(await self.get_holiday_rows())
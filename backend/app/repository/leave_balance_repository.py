@@ -0,0 +1,100 @@
+from contextlib import AbstractAsyncContextManager
+from decimal import Decimal
+from typing import List
+from collections.abc import Callable
+from sqlalchemy import literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.exceptions import NotFoundError
+from app.model.leave_balance_model import EmployeeLeaveBalance
+from app.model.leave_type_model import LeaveType
+from app.repository.base_repository import BaseRepository
+
+
+class LeaveBalanceRepository(BaseRepository[EmployeeLeaveBalance]):
+    def __init__(
+        self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ):
+        super().__init__(session_factory, EmployeeLeaveBalance)
+
+    @staticmethod
+    def _key(employee_id: int, leave_type_id: int, year: int):
+        return (
+            EmployeeLeaveBalance.employee_id == employee_id,
+            EmployeeLeaveBalance.leave_type_id == leave_type_id,
+            EmployeeLeaveBalance.year == year,
+        )
+
+    async def get_balance(
+        self, employee_id: int, leave_type_id: int, year: int
+    ) -> EmployeeLeaveBalance:
+        """One row by its unique key, no aggregation over leave_requests"""
+        async with self.session_factory(read_only=True) as session:
+            query = select(EmployeeLeaveBalance).where(
+                *self._key(employee_id, leave_type_id, year)
+            )
+            balance = (await session.execute(query)).scalar_one_or_none()
+            if balance is None:
+                raise NotFoundError(
+                    detail=f"no leave balance for employee {employee_id}, "
+                    f"leave type {leave_type_id}, year {year}"
+                )
+            return balance
+
+    async def get_balances(
+        self, employee_id: int, year: int
+    ) -> list[EmployeeLeaveBalance]:
+        async with self.session_factory(read_only=True) as session:
+            query = (
+                select(EmployeeLeaveBalance)
+                .where(
+                    EmployeeLeaveBalance.employee_id == employee_id,
+                    EmployeeLeaveBalance.year == year,
+                )
+                .order_by(EmployeeLeaveBalance.leave_type_id)
+            )
+            return list((await session.execute(query)).scalars())
+
+    async def lock_balance(
+        self, session: AsyncSession, employee_id: int, leave_type_id: int, year: int
+    ) -> EmployeeLeaveBalance:
+        """
+        The balance row for the key, locked FOR UPDATE until the session's transaction
+        ends. A missing row is first created from the leave type's yearly allowance;
+        ON CONFLICT DO NOTHING lets two first approvals race without failing.
+        """
+        seed = (
+            pg_insert(EmployeeLeaveBalance)
+            .from_select(
+                ["employee_id", "leave_type_id", "year", "total_days"],
+                select(
+                    literal(employee_id),
+                    literal(leave_type_id),
+                    literal(year),
+                    LeaveType.max_days_per_year,
+                ).where(LeaveType.id == leave_type_id),
+            )
+            .on_conflict_do_nothing(
+                constraint="uq_employee_leave_balance_employee_type_year"
+            )
+        )
+        await session.execute(seed)
+
+        query = (
+            select(EmployeeLeaveBalance)
+            .where(*self._key(employee_id, leave_type_id, year))
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        balance = (await session.execute(query)).scalar_one_or_none()
+        if balance is None:
+            raise NotFoundError(detail=f"not found leave type id : {leave_type_id}")
+        return balance
+
+    async def add_used_days(
+        self, session: AsyncSession, id: int, delta: Decimal
+    ) -> EmployeeLeaveBalance:
+        """used_days += delta, computed by Postgres on the locked row"""
+        return await self._update_returning(
+            session, id, {"used_days": EmployeeLeaveBalance.used_days + delta}
+        )
@@ -0,0 +1,209 @@
+from contextlib import AbstractAsyncContextManager
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from collections.abc import Callable, Sequence
+from sqlalchemy import Row, func, insert, literal_column, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.exceptions import ConflictError, DuplicatedError, NotFoundError
+from app.model.leave_request_model import LeaveRequest
+from app.model.user_model import User
+from app.repository.base_repository import BaseRepository
+
+ACTIVE_STATUSES = ("pending", "approved")
+
+
+def _date_range(start: Any, end: Any) -> Any:
+    # Inclusive on both ends; spelled like the excl_leave_requests_user_dates index expression
+    return func.daterange(start, end, literal_column("'[]'"))
+
+
+class LeaveRepository(BaseRepository[LeaveRequest]):
+    def __init__(
+        self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ):
+        super().__init__(session_factory, LeaveRequest)
+
+    async def lock(self, session: AsyncSession, id: int) -> LeaveRequest:
+        """The leave request, row-locked (FOR UPDATE) until the session's transaction ends"""
+        query = (
+            select(LeaveRequest)
+            .where(LeaveRequest.id == id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        leave = (await session.execute(query)).scalar_one_or_none()
+        if leave is None:
+            raise NotFoundError(detail=f"not found id : {id}")
+        return leave
+
+    async def lock_employees(
+        self, session: AsyncSession, user_ids: Sequence[int]
+    ) -> dict[int, Row]:
+        """
+        Lock the users' rows (FOR NO KEY UPDATE, in id order) so that their leave and WFH
+        requests are checked and written one transaction at a time; returns each found
+        user's (department_id, supervisor_id) by id. Foreign key checks (KEY SHARE) are not blocked.
+        """
+        query = (
+            select(User.id, User.department_id, User.supervisor_id)
+            .where(User.id.in_(sorted(set(user_ids))))
+            .order_by(User.id)
+            .with_for_update(key_share=True)
+        )
+        return {row.id: row for row in await session.execute(query)}
+
+    async def find_overlap(
+        self, session: AsyncSession, user_id: int, start: date, end: date
+    ) -> int | None:
+        """Id of an active request of the user sharing a day with [start, end], by the GiST index"""
+        query = (
+            select(LeaveRequest.id)
+            .where(
+                LeaveRequest.user_id == user_id,
+                LeaveRequest.status.in_(ACTIVE_STATUSES),
+                _date_range(LeaveRequest.start_date, LeaveRequest.end_date).op("&&")(
+                    _date_range(start, end)
+                ),
+            )
+            .limit(1)
+        )
+        return (await session.execute(query)).scalar_one_or_none()
+
+    async def active_intervals(
+        self, session: AsyncSession, user_ids: Sequence[int], start: date, end: date
+    ) -> list[Row]:
+        """(user_id, start_date, end_date, id) of the users' active requests touching [start, end]"""
+        query = select(
+            LeaveRequest.user_id,
+            LeaveRequest.start_date,
+            LeaveRequest.end_date,
+            LeaveRequest.id,
+        ).where(
+            LeaveRequest.user_id.in_(list(user_ids)),
+            LeaveRequest.status.in_(ACTIVE_STATUSES),
+            _date_range(LeaveRequest.start_date, LeaveRequest.end_date).op("&&")(
+                _date_range(start, end)
+            ),
+        )
+        return list(await session.execute(query))
+
+    async def insert(
+        self, session: AsyncSession, values: dict[str, Any]
+    ) -> LeaveRequest:
+        leave = LeaveRequest(**values)
+        session.add(leave)
+        try:
+            await session.flush()
+        except IntegrityError as e:
+            raise self._integrity_error(e)
+        await session.refresh(leave)
+        return leave
+
+    async def insert_many(
+        self, session: AsyncSession, rows: list[dict[str, Any]]
+    ) -> list[int]:
+        """Insert already validated rows, one executemany per batch; ids in row order"""
+        stmt = insert(LeaveRequest).returning(
+            LeaveRequest.id, sort_by_parameter_order=True
+        )
+        ids: list[int] = []
+        try:
+            for _, chunk in self._bulk_chunks(rows, None):
+                ids.extend((await session.execute(stmt, chunk)).scalars())
+        except IntegrityError as e:
+            raise self._integrity_error(e)
+        return ids
+
+    @staticmethod
+    def _integrity_error(error: IntegrityError) -> Exception:
+        if "excl_leave_requests_user_dates" in str(error.orig):
+            return ConflictError(detail="overlaps another active leave request")
+        return DuplicatedError(detail=str(error.orig))
+
+    async def pending_for_supervisor(
+        self, supervisor_id: int, after: tuple[datetime, int] | None, limit: int
+    ) -> list[dict[str, Any]]:
+        """
+        The supervisor's pending requests in (created_at, id) order, past `after`; a range
+        scan of ix_leave_requests_pending_inbox that stops after `limit` rows.
+        """
+        query = (
+            select(
+                LeaveRequest.id,
+                LeaveRequest.user_id,
+                LeaveRequest.leave_type_id,
+                LeaveRequest.start_date,
+                LeaveRequest.end_date,
+                LeaveRequest.number_of_days,
+                LeaveRequest.reason,
+                LeaveRequest.created_at,
+            )
+            .where(
+                LeaveRequest.supervisor_id == supervisor_id,
+                LeaveRequest.status == "pending",
+            )
+            .order_by(LeaveRequest.created_at, LeaveRequest.id)
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(
+                tuple_(LeaveRequest.created_at, LeaveRequest.id) > tuple_(*after)
+            )
+        async with self.session_factory(read_only=True) as session:
+            return [dict(row) for row in (await session.execute(query)).mappings()]
+
+    async def set_status(
+        self, session: AsyncSession, id: int, values: dict[str, Any]
+    ) -> LeaveRequest:
+        return await self._update_returning(session, id, values)
+
+    async def reroute_pending(
+        self, session: AsyncSession, user_id: int, supervisor_id: int | None
+    ) -> int:
+        """Hand the user's pending requests to `supervisor_id`; returns how many moved"""
+        query = (
+            update(LeaveRequest)
+            .where(LeaveRequest.user_id == user_id, LeaveRequest.status == "pending")
+            .values(supervisor_id=supervisor_id)
+        )
+        return (await session.execute(query)).rowcount
+
+    async def lock_open_requests(
+        self,
+        session: AsyncSession,
+        since: date | None = None,
+        department_id: int | None = None,
+    ) -> list[Row]:
+        """
+        Pending and approved requests ending on or after `since` (of one department's
+        employees when given), with their employee's department, locked FOR UPDATE in id order.
+        """
+        query = (
+            select(
+                LeaveRequest.id,
+                LeaveRequest.user_id,
+                LeaveRequest.leave_type_id,
+                LeaveRequest.status,
+                LeaveRequest.start_date,
+                LeaveRequest.end_date,
+                LeaveRequest.start_half_day,
+                LeaveRequest.end_half_day,
+                LeaveRequest.number_of_days,
+                User.department_id,
+            )
+            .join(User, User.id == LeaveRequest.user_id)
+            .where(LeaveRequest.status.in_(("pending", "approved")))
+            .order_by(LeaveRequest.id)
+            .with_for_update(of=LeaveRequest)
+        )
+        if since is not None:
+            query = query.where(LeaveRequest.end_date >= since)
+        if department_id is not None:
+            query = query.where(User.department_id == department_id)
+        return list(await session.execute(query))
+
+    async def set_days(self, session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+        """ORM bulk UPDATE by primary key: rows are {"id": ..., "number_of_days": ...}"""
+        for _, chunk in self._bulk_chunks(rows, None):
+            await session.execute(update(LeaveRequest), chunk)
@@ -6,7 +6,7 @@ from app.schema.project_schema import UpsertPostWithTags
 from app.core.exceptions import NotFoundError
 
 
-class ProjectRepository(BaseRepository):
+class ProjectRepository(BaseRepository[Project]):
     def __init__(self):
         super().__init__(Project)
 
@@ -1,17 +1,68 @@
 from contextlib import AbstractAsyncContextManager
-from typing import Any, Callable, List
+from typing import Any, Dict, List, Optional
+from collections.abc import AsyncIterator, Callable, Hashable
+from app.core.pagination import CountMode
 from app.models import UserPublic
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 # from app.models import User
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.database import after_commit
 from app.model.user_model import User
 from app.repository.base_repository import BaseRepository
 
+# Active-user snapshots for deps.get_current_user, keyed by str(user id) (the token subject)
+user_cache: LRUCache[Hashable, dict[str, Any]] = LRUCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+
+class UserRepository(BaseRepository[User]):
+    list_columns = [ "User.id", "User.email", "User.first_name", "User.last_name", "User.user_id", "User.is_active", "User.supervisor_id" ]
 
-class UserRepository(BaseRepository):
     def __init__(self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]):
         super().__init__(session_factory, User)
 
+    # Writes drop the cached snapshot once they are committed, so a concurrent
+    # request cannot put the old row back in between
+    async def update(self, id: int, schema: Any) -> User:
+        user = await super().update(id, schema)
+        self._forget_cached(id)
+        return user
+
+    async def update_attr(self, id: int, column: str, value: Any) -> User:
+        user = await super().update_attr(id, column, value)
+        self._forget_cached(id)
+        return user
+
+    async def whole_update(self, id: int, schema: Any) -> User:
+        user = await super().whole_update(id, schema)
+        self._forget_cached(id)
+        return user
+
+    async def delete_by_id(self, id: int) -> None:
+        await super().delete_by_id(id)
+        self._forget_cached(id)
+
+    async def bulk_update(self, rows: list[dict], batch_size: int | None = None) -> dict:
+        report = await super().bulk_update(rows, batch_size)
+        self._forget_cached(*(row["id"] for row in report["rows"] if row["status"] == "updated"))
+        return report
+
+    async def bulk_upsert(self, schemas: list[Any], conflict_cols: list[str], batch_size: int | None = None) -> dict:
+        report = await super().bulk_upsert(schemas, conflict_cols, batch_size)
+        self._forget_cached(*(row["id"] for row in report["rows"] if row["status"] == "updated"))
+        return report
+
+    @staticmethod
+    def _forget_cached(*ids: Any) -> None:
+        keys = [str(id) for id in ids]
+
+        def forget() -> None:
+            for key in keys:
+                user_cache.invalidate(key)
+
+        after_commit(forget)
+
     # async def get_all_users(self, skip: int = 0, limit: int = 100) -> Any:
     #     async with self.session_factory() as session:
     #         # Get total count - await the scalar result
@@ -28,18 +79,22 @@ class UserRepository(BaseRepository):
 
     #         return users_public
         
-    async def get_all_users_new(self, skip: int = 0, limit: int = 100) -> Any:
-        async with self.session_factory() as session:
-            # Get total count - await the scalar result
+    async def get_all_users_new(self, skip: int = 0, limit: int = 100,
+                                after: str | None = None, before: str | None = None,
+                                count_mode: CountMode | None = None, q: str | None = None) -> Any:
+        # Type-ahead: word prefixes of name or email, served by the search_vector GIN index
+        filters = [{"field": "User.search_vector", "op": "prefix", "value": q}] if q else None
+
+        users_data  = await super().get_filter_data(self.list_columns, None, filters, None, page=skip, per_page=limit,
+                                                    after=after, before=before, count_mode=count_mode)
 
-            columns = [ "User.id", "User.email", "User.first_name", "User.last_name", "User.user_id", "User.is_active" ]
-         
-            users_data  = await super().get_filter_data(columns, None, None, None, page=skip, per_page=limit)
+        # Convert ORM/SQLModel User instances to the public pydantic schema
+        # users_public: List[UserPublic] = [UserPublic.model_validate(u) for u in users_data["items"]]
 
-            # Convert ORM/SQLModel User instances to the public pydantic schema
-            # users_public: List[UserPublic] = [UserPublic.model_validate(u) for u in users_data["items"]]
+        return users_data
 
-            return users_data
+    def stream_all_users(self) -> AsyncIterator[list[dict]]:
+        return super().stream_filter_data(self.list_columns)
         
     async def get_user_by_email(self, email: str) -> Any:
         async with self.session_factory() as session:
@@ -0,0 +1,118 @@
+from contextlib import AbstractAsyncContextManager
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from collections.abc import Callable, Sequence
+from sqlalchemy import Row, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.exceptions import ConflictError, DuplicatedError, NotFoundError
+from app.model.wfh_request_model import WfhRequest
+from app.repository.base_repository import BaseRepository
+from app.repository.leave_repository import ACTIVE_STATUSES
+
+
+class WfhRepository(BaseRepository[WfhRequest]):
+    def __init__(
+        self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ):
+        super().__init__(session_factory, WfhRequest)
+
+    async def lock(self, session: AsyncSession, id: int) -> WfhRequest:
+        """The WFH request, row-locked (FOR UPDATE) until the session's transaction ends"""
+        query = (
+            select(WfhRequest)
+            .where(WfhRequest.id == id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        wfh = (await session.execute(query)).scalar_one_or_none()
+        if wfh is None:
+            raise NotFoundError(detail=f"not found id : {id}")
+        return wfh
+
+    async def find_between(
+        self, session: AsyncSession, user_id: int, start: date, end: date
+    ) -> date | None:
+        """A day in [start, end] the user has an active WFH request for"""
+        query = (
+            select(WfhRequest.request_date)
+            .where(
+                WfhRequest.user_id == user_id,
+                WfhRequest.status.in_(ACTIVE_STATUSES),
+                WfhRequest.request_date.between(start, end),
+            )
+            .limit(1)
+        )
+        return (await session.execute(query)).scalar_one_or_none()
+
+    async def active_days(
+        self, session: AsyncSession, user_ids: Sequence[int], start: date, end: date
+    ) -> list[Row]:
+        """(user_id, request_date, id) of the users' active WFH requests in [start, end]"""
+        query = select(
+            WfhRequest.user_id, WfhRequest.request_date, WfhRequest.id
+        ).where(
+            WfhRequest.user_id.in_(list(user_ids)),
+            WfhRequest.status.in_(ACTIVE_STATUSES),
+            WfhRequest.request_date.between(start, end),
+        )
+        return list(await session.execute(query))
+
+    async def pending_for_supervisor(
+        self, supervisor_id: int, after: tuple[datetime, int] | None, limit: int
+    ) -> list[dict[str, Any]]:
+        """
+        The supervisor's pending requests in (created_at, id) order, past `after`; a range
+        scan of ix_wfh_requests_pending_inbox that stops after `limit` rows.
+        """
+        query = (
+            select(
+                WfhRequest.id,
+                WfhRequest.user_id,
+                WfhRequest.request_date,
+                WfhRequest.reason,
+                WfhRequest.created_at,
+            )
+            .where(
+                WfhRequest.supervisor_id == supervisor_id,
+                WfhRequest.status == "pending",
+            )
+            .order_by(WfhRequest.created_at, WfhRequest.id)
+            .limit(limit)
+        )
+        if after is not None:
+            query = query.where(
+                tuple_(WfhRequest.created_at, WfhRequest.id) > tuple_(*after)
+            )
+        async with self.session_factory(read_only=True) as session:
+            return [dict(row) for row in (await session.execute(query)).mappings()]
+
+    async def insert(self, session: AsyncSession, values: dict[str, Any]) -> WfhRequest:
+        wfh = WfhRequest(**values)
+        session.add(wfh)
+        try:
+            await session.flush()
+        except IntegrityError as e:
+            if "uq_wfh_requests_user_date_active" in str(e.orig):
+                raise ConflictError(
+                    detail="there is already a WFH request for this day"
+                )
+            raise DuplicatedError(detail=str(e.orig))
+        await session.refresh(wfh)
+        return wfh
+
+    async def set_status(
+        self, session: AsyncSession, id: int, values: dict[str, Any]
+    ) -> WfhRequest:
+        return await self._update_returning(session, id, values)
+
+    async def reroute_pending(
+        self, session: AsyncSession, user_id: int, supervisor_id: int | None
+    ) -> int:
+        """Hand the user's pending requests to `supervisor_id`; returns how many moved"""
+        query = (
+            update(WfhRequest)
+            .where(WfhRequest.user_id == user_id, WfhRequest.status == "pending")
+            .values(supervisor_id=supervisor_id)
+        )
+        return (await session.execute(query)).rowcount
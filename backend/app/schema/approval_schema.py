@@ -0,0 +1,28 @@
+# app/schemas/approval_schema.py
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class InboxItem(BaseModel):
+    """A pending leave or WFH request waiting for the supervisor"""
+
+    kind: Literal["leave", "wfh"]
+    id: int
+    user_id: int
+    first_name: str
+    last_name: str
+    start_date: date
+    end_date: date
+    number_of_days: Decimal | None = Field(None, description="Leave only")
+    leave_type_id: int | None = Field(None, description="Leave only")
+    reason: str | None = None
+    created_at: datetime
+
+
+class ApprovalInbox(BaseModel):
+    data: list[InboxItem]
+    has_next: bool = False
+    next_cursor: str | None = None
@@ -1,7 +1,9 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
+
 from pydantic import BaseModel, Field
 
+
 # -----------------------------------
 # Base Schema (shared attributes)
 # -----------------------------------
@@ -48,4 +50,25 @@ class DepartmentDelete(BaseModel):
 
 class DepartmentsPublic(BaseModel):
     data: list[DepartmentRead]
-    count: int
+    count: int | None           # None when listed with count_mode="none"
+    has_next: bool = False
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+# -----------------------------------
+# Absence calendar (GET /departments/{id}/calendar)
+# -----------------------------------
+class CalendarMember(BaseModel):
+    id: int
+    first_name: str
+    last_name: str
+    days: str = Field(..., description="One character per day from `from` to `to`, see `legend`")
+
+class DepartmentCalendar(BaseModel):
+    department_id: int
+    start: date
+    end: date
+    legend: dict[str, str]
+    off_per_day: list[int] = Field(..., description="Members on approved leave, per day")
+    members: list[CalendarMember]
@@ -0,0 +1,28 @@
+# app/schemas/holiday_schema.py
+from datetime import date, datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class HolidayBase(SQLModel):
+    department_id: int | None = Field(
+        default=None, description="NULL for a company-wide holiday"
+    )
+    date: date
+    name: str = Field(..., max_length=100)
+    is_half_day: bool = False
+
+
+class HolidayCreate(HolidayBase):
+    pass
+
+
+class HolidayRead(HolidayBase):
+    id: int
+    created_at: datetime
+
+
+class LeaveDaysRecomputed(SQLModel):
+    holiday: HolidayRead | None = None
+    total: int
+    changed: int
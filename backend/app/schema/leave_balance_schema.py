@@ -1,16 +1,18 @@
 # app/schemas/employee_leave_balance_schema.py
-from datetime import datetime, date
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Optional
-from sqlmodel import SQLModel, Field
+
+from sqlmodel import Field, SQLModel
 
 
 class EmployeeLeaveBalanceBase(SQLModel):
     employee_id: int
     leave_type_id: int
     year: int
-    total_days: int
-    used_days: int = 0
-    carried_forward_days: int = 0
+    total_days: Decimal
+    used_days: Decimal = Decimal(0)
+    carried_forward_days: Decimal = Decimal(0)
     carry_forward_expiry_date: Optional[date] = None
 
 
@@ -24,8 +26,13 @@ class EmployeeLeaveBalanceRead(EmployeeLeaveBalanceBase):
     updated_at: datetime
 
 
+class EmployeeLeaveBalancesPublic(SQLModel):
+    data: list[EmployeeLeaveBalanceRead]
+    count: int
+
+
 class EmployeeLeaveBalanceUpdate(SQLModel):
-    total_days: Optional[int] = None
-    used_days: Optional[int] = None
-    carried_forward_days: Optional[int] = None
+    total_days: Decimal | None = None
+    used_days: Decimal | None = None
+    carried_forward_days: Decimal | None = None
     carry_forward_expiry_date: Optional[date] = None
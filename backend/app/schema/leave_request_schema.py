@@ -14,6 +14,8 @@ class LeaveRequestBase(SQLModel):
     project_id: Optional[int] = Field(default=None, foreign_key="projects.id")
     start_date: date
     end_date: date
+    start_half_day: bool = False
+    end_half_day: bool = False
     number_of_days: Decimal
     reason: Optional[str] = None
     status: Optional[str] = Field(
@@ -22,6 +24,7 @@ class LeaveRequestBase(SQLModel):
         max_length=20
     )
     comments: Optional[str] = None
+    supervisor_id: int | None = None
     approved_rejected_at: Optional[datetime] = None
     approved_rejected_by: Optional[int] = Field(default=None, foreign_key='"user".id')
 
@@ -34,6 +37,25 @@ class LeaveRequestCreate(LeaveRequestBase):
     pass
 
 
+# --------------------------
+# Apply Schema
+# --------------------------
+class LeaveRequestApply(SQLModel):
+    """Schema for an employee's own leave request; number_of_days is computed by the server."""
+    leave_type_id: int
+    project_id: int | None = None
+    start_date: date
+    end_date: date
+    start_half_day: bool = False
+    end_half_day: bool = False
+    reason: str | None = None
+
+
+class LeaveRequestImport(LeaveRequestApply):
+    """Schema for one row of a bulk leave import."""
+    user_id: int
+
+
 # --------------------------
 # Update Schema
 # --------------------------
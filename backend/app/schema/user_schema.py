@@ -13,6 +13,7 @@ class UserBase(BaseModel):
     first_name: str = Field(..., max_length=255)
     last_name: str = Field(..., max_length=255)
     role: str = Field(default="user", pattern="^(user|supervisor|admin|superAdmin)$")
+    supervisor_id: int | None = Field(default=None, description="Who approves the user's leave and WFH requests")
 
 
 # ----------------------------------------------------
@@ -40,6 +41,10 @@ class UserUpdate(UserBase):
     role: str | None = Field(default=None, pattern="^(user|supervisor|admin|superAdmin)$")
 
 
+class UserSupervisorUpdate(BaseModel):
+    supervisor_id: int | None = Field(..., description="None leaves the user without a supervisor")
+
+
 class UserUpdateMe(BaseModel):
     first_name: str | None = Field(default=None, max_length=255)
     last_name: str | None = Field(default=None, max_length=255)
@@ -65,4 +70,7 @@ class UserPublic(UserBase):
 
 class UsersPublic(BaseModel):
     data: list[UserPublic]
-    count: int
+    count: int | None              # None when listed with count_mode="none"
+    has_next: bool = False
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
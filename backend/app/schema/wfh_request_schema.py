@@ -24,6 +24,12 @@ class WfhRequestCreate(WfhRequestBase):
     pass
 
 
+class WfhRequestApply(SQLModel):
+    """Schema for an employee's own WFH request."""
+    request_date: date
+    reason: str | None = None
+
+
 
 class WfhRequestUpdate(SQLModel):
 
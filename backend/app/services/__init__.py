@@ -1,2 +1,13 @@
+from app.services.approval_service import ApprovalService
+from app.services.department_service import DepartmentService
+from app.services.leave_service import LeaveService
 from app.services.user_service import UserService
-from app.services.department_service import DepartmentService
\ No newline at end of file
+from app.services.wfh_service import WfhService
+
+__all__ = [
+    "ApprovalService",
+    "DepartmentService",
+    "LeaveService",
+    "UserService",
+    "WfhService",
+]
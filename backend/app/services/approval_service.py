@@ -0,0 +1,143 @@
+import heapq
+from datetime import datetime
+from typing import Any
+
+from app.core.exceptions import ValidationError
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.serialization import construct_rows
+from app.model.user_model import User
+from app.repository.leave_repository import LeaveRepository
+from app.repository.user_repository import UserRepository
+from app.repository.wfh_repository import WfhRepository
+from app.schema.approval_schema import InboxItem
+
+# Tie-break between the two queues when created_at is equal: leave first
+INBOX_KINDS = ("leave", "wfh")
+_MAX_ID = 2**31 - 1
+
+
+class ApprovalService:
+    def __init__(
+        self,
+        leave_repository: LeaveRepository,
+        wfh_repository: WfhRepository,
+        user_repository: UserRepository,
+    ):
+        self.leave_repository = leave_repository
+        self.wfh_repository = wfh_repository
+        self.user_repository = user_repository
+
+    async def get_inbox(
+        self, supervisor_id: int, after: str | None = None, limit: int = 50
+    ) -> dict[str, Any]:
+        """
+        Pending leave and WFH requests routed to the supervisor, oldest first, merged
+        into one keyset-paginated list ordered by (created_at, kind, id).
+
+        Each page reads at most limit + 1 rows from each queue's partial index, so its
+        cost does not depend on the number of reports or of past requests.
+        """
+        cursor = self._decode(after) if after else None
+        leaves = await self.leave_repository.pending_for_supervisor(
+            supervisor_id, self._after(cursor, "leave"), limit + 1
+        )
+        wfh = await self.wfh_repository.pending_for_supervisor(
+            supervisor_id, self._after(cursor, "wfh"), limit + 1
+        )
+
+        items = list(
+            heapq.merge(
+                ({**row, "kind": "leave"} for row in leaves),
+                (
+                    {
+                        **row,
+                        "kind": "wfh",
+                        "start_date": row["request_date"],
+                        "end_date": row["request_date"],
+                    }
+                    for row in wfh
+                ),
+                key=lambda item: (
+                    item["created_at"],
+                    INBOX_KINDS.index(item["kind"]),
+                    item["id"],
+                ),
+            )
+        )
+        page = items[:limit]
+        has_next = len(items) > limit
+        # Employees of both queues in one batched query, each fetched once
+        employees = await self.user_repository.loader().load_many(
+            item["user_id"] for item in page
+        )
+        next_cursor = None
+        if has_next:
+            last = page[-1]
+            next_cursor = encode_cursor([last["created_at"], last["kind"], last["id"]])
+        return {
+            # Requests of since-deleted employees are left out rather than failing the page
+            "items": construct_rows(
+                InboxItem,
+                (
+                    {
+                        **{
+                            key: value
+                            for key, value in item.items()
+                            if key != "request_date"
+                        },
+                        "first_name": employee.first_name,
+                        "last_name": employee.last_name,
+                    }
+                    for item, employee in zip(page, employees, strict=True)
+                    if employee is not None
+                ),
+            ),
+            "has_next": has_next,
+            "next_cursor": next_cursor,
+        }
+
+    async def assign_supervisor(self, user_id: int, supervisor_id: int | None) -> User:
+        """
+        Make `supervisor_id` approve the user's requests from now on, pending ones included:
+        their inbox rows move along in the same transaction.
+        """
+        if supervisor_id == user_id:
+            raise ValidationError(detail="a user cannot supervise themselves")
+        if supervisor_id is not None:
+            await self.user_repository.read_by_id(
+                supervisor_id
+            )  # 404 for unknown supervisors
+        user = await self.user_repository.update_attr(
+            user_id, "supervisor_id", supervisor_id
+        )
+        async with self.leave_repository.session_factory() as session:
+            await self.leave_repository.reroute_pending(session, user_id, supervisor_id)
+            await self.wfh_repository.reroute_pending(session, user_id, supervisor_id)
+        return user
+
+    @staticmethod
+    def _decode(after: str) -> tuple[datetime, str, int]:
+        created_at, kind, id = decode_cursor(after, 3)
+        try:
+            cursor = (datetime.fromisoformat(created_at), kind, int(id))
+        except (TypeError, ValueError):
+            raise ValidationError(detail="invalid cursor")
+        if kind not in INBOX_KINDS:
+            raise ValidationError(detail="invalid cursor")
+        return cursor
+
+    @staticmethod
+    def _after(
+        cursor: tuple[datetime, str, int] | None, kind: str
+    ) -> tuple[datetime, int] | None:
+        """
+        The (created_at, id) bound one queue continues from: a queue ordered before the
+        cursor's kind resumes after its created_at, one ordered after it at that created_at
+        """
+        if cursor is None:
+            return None
+        created_at, cursor_kind, id = cursor
+        rank, cursor_rank = INBOX_KINDS.index(kind), INBOX_KINDS.index(cursor_kind)
+        if rank == cursor_rank:
+            return created_at, id
+        return created_at, (0 if rank > cursor_rank else _MAX_ID)
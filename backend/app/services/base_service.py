@@ -6,6 +6,8 @@ class RepositoryProtocol(Protocol):
 
     def read_by_id(self, id: int) -> Any: ...
 
+    def read_by_ids(self, ids: list[int]) -> Any: ...
+
     def create(self, schema: Any) -> Any: ...
 
     def update(self, id: int, schema: Any) -> Any: ...
@@ -30,6 +32,9 @@ class BaseService:
     def get_by_id(self, id: int) -> Any:
         return self._repository.read_by_id(id)
 
+    def get_by_ids(self, ids: list[int]) -> Any:
+        return self._repository.read_by_ids(ids)
+
     def add(self, schema: Any) -> Any:
         return self._repository.create(schema)
 
@@ -1,7 +1,15 @@
-from typing import Any, List
+from datetime import date
+from typing import Any, List, Optional
+from collections.abc import AsyncIterator
+import numpy as np
+from app.core.absence import (LEAVE_APPROVED, LEGEND, AbsenceMatrix, absence_cache, absence_generation,
+                              encode_rows)
+from app.core.exceptions import ValidationError
+from app.core.pagination import CountMode
+from app.core.serialization import construct_rows
 import uuid
 from app.repository.department_repository import DepartmentRepository
-from app.schema.department_schema import DepartmentRead
+from app.schema.department_schema import CalendarMember, DepartmentRead
 from app.services.base_service import BaseService
 from app.schema.user_schema import UserPublic
 
@@ -11,22 +19,74 @@ class DepartmentService(BaseService):
         self.department_repository = department_repository
         super().__init__(department_repository)
 
-    async def get_all_departments(self, skip: int = 1, limit: int = 100) -> Any:
+    async def get_all_departments(self, skip: int = 1, limit: int = 100,
+                                  after: str | None = None, before: str | None = None,
+                                  count_mode: CountMode | None = None) -> Any:
 
-         departments_data  = await self.department_repository.get_all_departments(skip, limit)
+         departments_data  = await self.department_repository.get_all_departments(skip, limit, after, before, count_mode)
 
             # Convert ORM/SQLModel User instances to the public pydantic schema
-         departments_public: List[DepartmentRead] = [DepartmentRead.model_validate(u) for u in departments_data["items"]]
+         departments_public: list[DepartmentRead] = construct_rows(DepartmentRead, departments_data["items"])
 
-         return departments_public
+         return {**departments_data, "items": departments_public}
         # return await self.user_repository.get_all_users_new(skip, limit)
 
-    async def get_departments_by_admin(self, userId: uuid.UUID, skip: int = 1, limit: int = 100) -> Any:
+    def export_departments(self) -> AsyncIterator[list[dict]]:
+         return self.department_repository.stream_all_departments()
 
-         departments_data  = await self.department_repository.get_departments_by_admin(userId, skip, limit)
+    async def get_departments_by_admin(self, userId: uuid.UUID, skip: int = 1, limit: int = 100,
+                                       after: str | None = None, before: str | None = None,
+                                       count_mode: CountMode | None = None) -> Any:
+
+         departments_data  = await self.department_repository.get_departments_by_admin(userId, skip, limit, after, before, count_mode)
 
             # Convert ORM/SQLModel User instances to the public pydantic schema
-         departments_public: List[DepartmentRead] = [DepartmentRead.model_validate(u) for u in departments_data["items"]]
+         departments_public: list[DepartmentRead] = construct_rows(DepartmentRead, departments_data["items"])
+
+         return {**departments_data, "items": departments_public}
+        # return await self.user_repository.get_all_users_new(skip, limit)
+
+    async def get_calendar(self, department_id: int, start: date, end: date) -> dict:
+        """
+        Day-by-day status of every member of the department from `start` to `end`,
+        sliced out of the cached per-year absence matrices.
+        """
+        if end < start:
+            raise ValidationError(detail="to is before from")
+        if (end - start).days >= 366:
+            raise ValidationError(detail="the calendar spans at most 366 days")
+
+        matrices = [await self._absence_matrix(department_id, year) for year in range(start.year, end.year + 1)]
+        members = matrices[-1].members
+        user_ids = [member[0] for member in members] if len(matrices) > 1 else None
+        flags = np.concatenate([matrix.window(start, end, user_ids) for matrix in matrices], axis=1)
+
+        return {
+            "department_id": department_id,
+            "start": start,
+            "end": end,
+            "legend": LEGEND,
+            "off_per_day": np.count_nonzero(flags & LEAVE_APPROVED, axis=0).tolist(),
+            "members": construct_rows(CalendarMember, (
+                {"id": id, "first_name": first_name, "last_name": last_name, "days": days}
+                for (id, first_name, last_name), days in zip(members, encode_rows(flags), strict=True)
+            )),
+        }
+
+    async def can_view_calendar(self, user: Any, department_id: int) -> bool:
+        """Members of the department and the supervisors of any of them see its calendar"""
+        if user.department_id == department_id:
+            return True
+        return await self.department_repository.has_member_supervised_by(department_id, user.id)
 
-         return departments_public
-        # return await self.user_repository.get_all_users_new(skip, limit)
\ No newline at end of file
+    async def _absence_matrix(self, department_id: int, year: int) -> AbsenceMatrix:
+        key = (department_id, year)
+        matrix = absence_cache.get(key)
+        if matrix is None:
+            await self.department_repository.read_by_id(department_id)  # 404 for unknown departments
+            generation = absence_generation()
+            matrix = AbsenceMatrix(year, *await self.department_repository.get_absence_rows(department_id, year))
+            # A change committed while loading may be missing from the matrix: use it once, don't keep it
+            if absence_generation() == generation:
+                absence_cache.set(key, matrix)
+        return matrix
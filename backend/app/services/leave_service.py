@@ -0,0 +1,379 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from functools import partial
+from typing import Any
+
+import numpy as np
+from sqlalchemy import func
+
+from app.core.absence import record_absence_change
+from app.core.database import after_commit
+from app.core.exceptions import ConflictError, NotFoundError, ValidationError
+from app.core.intervals import IntervalValidator
+from app.model.leave_request_model import LeaveRequest
+from app.repository.holiday_repository import HolidayRepository
+from app.repository.leave_balance_repository import LeaveBalanceRepository
+from app.repository.leave_repository import LeaveRepository
+from app.repository.wfh_repository import WfhRepository
+from app.schema.holiday_schema import HolidayCreate
+from app.schema.leave_balance_schema import EmployeeLeaveBalanceRead
+from app.schema.leave_request_schema import (
+    LeaveRequestApply,
+    LeaveRequestCreate,
+    LeaveRequestImport,
+)
+from app.services.base_service import BaseService
+
+# action -> (statuses it may start from, status it leads to)
+LEAVE_TRANSITIONS: dict[str, tuple[frozenset[str], str]] = {
+    "approve": (frozenset({"pending"}), "approved"),
+    "reject": (frozenset({"pending"}), "rejected"),
+    "withdraw": (frozenset({"pending", "approved"}), "withdrawn"),
+    "cancel": (frozenset({"pending", "approved"}), "cancelled"),
+}
+
+
+def used_days_delta(old_status: str, new_status: str, days: Decimal) -> Decimal:
+    """Change to the balance's used_days when a request moves from old_status to new_status"""
+    if new_status == "approved" and old_status != "approved":
+        return Decimal(days)
+    if old_status == "approved" and new_status != "approved":
+        return -Decimal(days)
+    return Decimal(0)
+
+
+class LeaveService(BaseService):
+    def __init__(
+        self,
+        leave_repository: LeaveRepository,
+        leave_balance_repository: LeaveBalanceRepository,
+        holiday_repository: HolidayRepository,
+        wfh_repository: WfhRepository,
+    ):
+        self.leave_repository = leave_repository
+        self.leave_balance_repository = leave_balance_repository
+        self.holiday_repository = holiday_repository
+        self.wfh_repository = wfh_repository
+        super().__init__(leave_repository)
+
+    async def apply(self, user_id: int, schema: LeaveRequestApply) -> LeaveRequest:
+        """
+        A pending leave request whose number_of_days is counted on the employee's department
+        calendar. It may not share a day with another active leave request or a WFH request.
+        """
+        if schema.end_date < schema.start_date:
+            raise ValidationError(detail="end_date is before start_date")
+        calendars = await self.holiday_repository.get_calendars()
+        async with self.leave_repository.session_factory() as session:
+            employee = (
+                await self.leave_repository.lock_employees(session, [user_id])
+            ).get(user_id)
+            if employee is None:
+                raise NotFoundError(detail=f"not found user id : {user_id}")
+            days = calendars.count(
+                employee.department_id,
+                schema.start_date,
+                schema.end_date,
+                schema.start_half_day,
+                schema.end_half_day,
+            )
+            if not days:
+                raise ValidationError(detail="the leave request has no working days")
+
+            overlap = await self.leave_repository.find_overlap(
+                session, user_id, schema.start_date, schema.end_date
+            )
+            if overlap is not None:
+                raise ConflictError(detail=f"overlaps leave request {overlap}")
+            wfh_day = await self.wfh_repository.find_between(
+                session, user_id, schema.start_date, schema.end_date
+            )
+            if wfh_day is not None:
+                raise ConflictError(detail=f"overlaps the WFH request on {wfh_day}")
+
+            create = LeaveRequestCreate(
+                **schema.model_dump(),
+                user_id=user_id,
+                number_of_days=days,
+                status="pending",
+                supervisor_id=employee.supervisor_id,
+            )
+            leave = await self.leave_repository.insert(session, create.model_dump())
+        after_commit(
+            partial(
+                record_absence_change,
+                [(user_id, "leave", leave.start_date, leave.end_date, "pending")],
+            )
+        )
+        return leave
+
+    async def import_leaves(self, schemas: list[LeaveRequestImport]) -> dict[str, Any]:
+        """
+        Insert a batch of pending leave requests, e.g. from another HR system, computing
+        their number_of_days. Rows overlapping a stored leave or WFH request, or an earlier
+        row of the batch, are reported as failed; the others go in.
+
+        Stored requests are fetched once for the whole batch and every row is checked
+        against per-user IntervalIndexes, O(log n) each.
+        """
+        calendars = await self.holiday_repository.get_calendars()
+        async with self.leave_repository.session_factory() as session:
+            if not schemas:
+                return {
+                    "total": 0,
+                    "inserted": 0,
+                    "updated": 0,
+                    "failed": 0,
+                    "rows": [],
+                }
+            user_ids = sorted({schema.user_id for schema in schemas})
+            employees = await self.leave_repository.lock_employees(session, user_ids)
+            first = min(schema.start_date for schema in schemas)
+            last = max(schema.end_date for schema in schemas)
+
+            validator = IntervalValidator(
+                [
+                    (user_id, start, end, f"leave request {id}")
+                    for user_id, start, end, id in await self.leave_repository.active_intervals(
+                        session, user_ids, first, last
+                    )
+                ]
+                + [
+                    (user_id, day, day, f"the WFH request on {day}")
+                    for user_id, day, _ in await self.wfh_repository.active_days(
+                        session, user_ids, first, last
+                    )
+                ]
+            )
+            days = calendars.count_many(
+                [
+                    employees[schema.user_id].department_id
+                    if schema.user_id in employees
+                    else None
+                    for schema in schemas
+                ],
+                [schema.start_date for schema in schemas],
+                [max(schema.start_date, schema.end_date) for schema in schemas],
+                [schema.start_half_day for schema in schemas],
+                [schema.end_half_day for schema in schemas],
+            )
+
+            results: list[dict[str, Any]] = []
+            accepted: list[tuple[int, dict[str, Any]]] = []
+            for index, schema in enumerate(schemas):
+                error = None
+                if schema.user_id not in employees:
+                    error = f"not found user id : {schema.user_id}"
+                elif schema.end_date < schema.start_date:
+                    error = "end_date is before start_date"
+                elif not days[index]:
+                    error = "the leave request has no working days"
+                else:
+                    overlap = validator.check(
+                        schema.user_id,
+                        schema.start_date,
+                        schema.end_date,
+                        f"row {index}",
+                    )
+                    if overlap is not None:
+                        error = f"overlaps {overlap}"
+                if error:
+                    results.append({"index": index, "status": "failed", "error": error})
+                    continue
+                values = LeaveRequestCreate(
+                    **schema.model_dump(),
+                    number_of_days=Decimal(str(days[index])),
+                    status="pending",
+                    supervisor_id=employees[schema.user_id].supervisor_id,
+                ).model_dump()
+                accepted.append((index, values))
+
+            ids = await self.leave_repository.insert_many(
+                session, [values for _, values in accepted]
+            )
+            results.extend(
+                {"index": index, "status": "inserted", "id": id}
+                for (index, _), id in zip(accepted, ids, strict=True)
+            )
+        after_commit(
+            partial(
+                record_absence_change,
+                [
+                    (
+                        values["user_id"],
+                        "leave",
+                        values["start_date"],
+                        values["end_date"],
+                        "pending",
+                    )
+                    for _, values in accepted
+                ],
+            )
+        )
+        # Same shape as the BaseRepository bulk_* reports
+        results.sort(key=lambda row: row["index"])
+        return {
+            "total": len(results),
+            "inserted": len(ids),
+            "updated": 0,
+            "failed": len(results) - len(ids),
+            "rows": results,
+        }
+
+    async def recompute_days(
+        self, since: date | None = None, department_id: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Recount number_of_days of the open (pending / approved) requests ending on or after
+        `since`, e.g. after a holiday was added retroactively. All requests are counted in
+        one vectorized pass per calendar; approved ones move their balance's used_days by
+        the difference, in the same transaction.
+        """
+        calendars = await self.holiday_repository.get_calendars()
+        async with self.leave_repository.session_factory() as session:
+            rows = await self.leave_repository.lock_open_requests(
+                session, since, department_id
+            )
+            if not rows:
+                return {"total": 0, "changed": 0}
+
+            (
+                ids,
+                user_ids,
+                leave_type_ids,
+                statuses,
+                starts,
+                ends,
+                start_halves,
+                end_halves,
+                old_days,
+                department_ids,
+            ) = zip(*rows, strict=True)
+            days = calendars.count_many(
+                department_ids, starts, ends, start_halves, end_halves
+            )
+            changed = np.flatnonzero(days != np.asarray(old_days, dtype=np.float64))
+
+            deltas: dict[tuple[int, int, int], Decimal] = defaultdict(Decimal)
+            updates = []
+            for i in changed.tolist():
+                new_days = Decimal(str(days[i]))
+                updates.append({"id": ids[i], "number_of_days": new_days})
+                if statuses[i] == "approved":
+                    deltas[(user_ids[i], leave_type_ids[i], starts[i].year)] += (
+                        new_days - old_days[i]
+                    )
+
+            # Balance rows are locked in key order, after the leave rows, like transition does
+            for key in sorted(deltas):
+                if deltas[key]:
+                    balance = await self.leave_balance_repository.lock_balance(
+                        session, *key
+                    )
+                    await self.leave_balance_repository.add_used_days(
+                        session, balance.id, deltas[key]
+                    )
+            await self.leave_repository.set_days(session, updates)
+            return {"total": len(rows), "changed": len(updates)}
+
+    async def add_holiday(self, schema: HolidayCreate) -> dict[str, Any]:
+        """Add a holiday and recount the open requests it can affect"""
+        holiday = await self.holiday_repository.create(schema)
+        report = await self.recompute_days(
+            since=holiday.date, department_id=holiday.department_id
+        )
+        return {"holiday": holiday, **report}
+
+    async def transition(
+        self, leave_id: int, action: str, actor_id: int, comments: str | None = None
+    ) -> LeaveRequest:
+        """
+        Move a leave request through `action` and apply the matching used_days delta
+        to its balance in the same transaction.
+
+        Locks are always taken leave request first, then balance row, so concurrent
+        transitions on the same employee cannot deadlock. Days are charged to the
+        year the leave starts in.
+        """
+        if action not in LEAVE_TRANSITIONS:
+            raise ValidationError(detail=f"unknown leave action: {action}")
+        allowed_from, new_status = LEAVE_TRANSITIONS[action]
+
+        async with self.leave_repository.session_factory() as session:
+            leave = await self.leave_repository.lock(session, leave_id)
+            if leave.status not in allowed_from:
+                raise ValidationError(
+                    detail=f"cannot {action} a {leave.status} leave request"
+                )
+
+            delta = used_days_delta(leave.status, new_status, leave.number_of_days)
+            if delta:
+                balance = await self.leave_balance_repository.lock_balance(
+                    session, leave.user_id, leave.leave_type_id, leave.start_date.year
+                )
+                if delta > balance.available_days(leave.start_date):
+                    raise ValidationError(detail="insufficient leave balance")
+                await self.leave_balance_repository.add_used_days(
+                    session, balance.id, delta
+                )
+
+            values: dict[str, Any] = {"status": new_status}
+            if comments is not None:
+                values["comments"] = comments
+            if action in ("approve", "reject"):
+                values["approved_rejected_at"] = func.now()
+                values["approved_rejected_by"] = actor_id
+            leave = await self.leave_repository.set_status(session, leave_id, values)
+        # Once committed, the department calendars of this worker follow the new status
+        after_commit(
+            partial(
+                record_absence_change,
+                [
+                    (
+                        leave.user_id,
+                        "leave",
+                        leave.start_date,
+                        leave.end_date,
+                        new_status,
+                    )
+                ],
+            )
+        )
+        return leave
+
+    async def approve(
+        self, leave_id: int, actor_id: int, comments: str | None = None
+    ) -> LeaveRequest:
+        return await self.transition(leave_id, "approve", actor_id, comments)
+
+    async def reject(
+        self, leave_id: int, actor_id: int, comments: str | None = None
+    ) -> LeaveRequest:
+        return await self.transition(leave_id, "reject", actor_id, comments)
+
+    async def withdraw(
+        self, leave_id: int, actor_id: int, comments: str | None = None
+    ) -> LeaveRequest:
+        return await self.transition(leave_id, "withdraw", actor_id, comments)
+
+    async def cancel(
+        self, leave_id: int, actor_id: int, comments: str | None = None
+    ) -> LeaveRequest:
+        return await self.transition(leave_id, "cancel", actor_id, comments)
+
+    async def get_balance(
+        self, employee_id: int, leave_type_id: int, year: int
+    ) -> EmployeeLeaveBalanceRead:
+        balance = await self.leave_balance_repository.get_balance(
+            employee_id, leave_type_id, year
+        )
+        return EmployeeLeaveBalanceRead.model_validate(balance)
+
+    async def get_balances(
+        self, employee_id: int, year: int
+    ) -> list[EmployeeLeaveBalanceRead]:
+        balances = await self.leave_balance_repository.get_balances(employee_id, year)
+        return [
+            EmployeeLeaveBalanceRead.model_validate(balance) for balance in balances
+        ]
@@ -1,25 +1,35 @@
-from typing import Any, List
+from typing import Any, AsyncIterator, List, Optional
+
+from fastapi import HTTPException
+
+from app.core.pagination import CountMode
+from app.core.security import password_hasher
+from app.core.serialization import construct_rows
 from app.repository.user_repository import UserRepository
-from app.services.base_service import BaseService
 from app.schema.user_schema import UserPublic
-from fastapi import HTTPException
-from app import crud
+from app.services.base_service import BaseService
+
 
 class UserService(BaseService):
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
         super().__init__(user_repository)
 
-    async def get_all_users(self, skip: int = 1, limit: int = 100) -> Any:
+    async def get_all_users(self, skip: int = 1, limit: int = 100,
+                            after: str | None = None, before: str | None = None,
+                            count_mode: CountMode | None = None, q: str | None = None) -> Any:
 
-         users_data  = await self.user_repository.get_all_users_new(skip, limit)
+         users_data  = await self.user_repository.get_all_users_new(skip, limit, after, before, count_mode, q)
 
             # Convert ORM/SQLModel User instances to the public pydantic schema
-         users_public: List[UserPublic] = [UserPublic.model_validate(u) for u in users_data["items"]]
+         users_public: list[UserPublic] = construct_rows(UserPublic, users_data["items"])
 
-         return users_public
+         return {**users_data, "items": users_public}
         # return await self.user_repository.get_all_users_new(skip, limit)
 
+    def export_users(self) -> AsyncIterator[list[dict]]:
+         return self.user_repository.stream_all_users()
+
     async def get_user_by_email(self, email: str) -> Any:
 
          user  = await self.user_repository.get_user_by_email(email)
@@ -35,7 +45,7 @@ class UserService(BaseService):
 
          user  = await self.user_repository.get_user_by_email(email)
 
-         if not user or not crud.verify_password(pwd, user.hashed_password):
+         if not user or not await password_hasher.verify(pwd, user.hashed_password):
             raise HTTPException(status_code=400, detail="Incorrect email or password")
          if not user.is_active:
             raise HTTPException(status_code=400, detail="Inactive user")
@@ -0,0 +1,81 @@
+from functools import partial
+from typing import Any
+
+from sqlalchemy import func
+
+from app.core.absence import record_absence_change
+from app.core.database import after_commit
+from app.core.exceptions import ConflictError, NotFoundError, ValidationError
+from app.model.wfh_request_model import WfhRequest
+from app.repository.leave_repository import LeaveRepository
+from app.repository.wfh_repository import WfhRepository
+from app.schema.wfh_request_schema import WfhRequestApply, WfhRequestCreate
+from app.services.base_service import BaseService
+from app.services.leave_service import LEAVE_TRANSITIONS
+
+
+class WfhService(BaseService):
+    def __init__(
+        self, wfh_repository: WfhRepository, leave_repository: LeaveRepository
+    ):
+        self.wfh_repository = wfh_repository
+        self.leave_repository = leave_repository
+        super().__init__(wfh_repository)
+
+    async def apply(self, user_id: int, schema: WfhRequestApply) -> WfhRequest:
+        """A pending WFH request, refused on a day the user has active leave for"""
+        async with self.wfh_repository.session_factory() as session:
+            # Same per-user lock as LeaveService.apply, so a leave request cannot slip in alongside
+            employee = (
+                await self.leave_repository.lock_employees(session, [user_id])
+            ).get(user_id)
+            if employee is None:
+                raise NotFoundError(detail=f"not found user id : {user_id}")
+            overlap = await self.leave_repository.find_overlap(
+                session, user_id, schema.request_date, schema.request_date
+            )
+            if overlap is not None:
+                raise ConflictError(detail=f"overlaps leave request {overlap}")
+            create = WfhRequestCreate(
+                **schema.model_dump(),
+                user_id=user_id,
+                status="pending",
+                supervisor_id=employee.supervisor_id,
+            )
+            wfh = await self.wfh_repository.insert(session, create.model_dump())
+        after_commit(
+            partial(
+                record_absence_change,
+                [(user_id, "wfh", wfh.request_date, wfh.request_date, "pending")],
+            )
+        )
+        return wfh
+
+    async def transition(
+        self, wfh_id: int, action: str, actor_id: int, comments: str | None = None
+    ) -> WfhRequest:
+        """Move a WFH request through `action`; WFH requests follow the leave request life cycle"""
+        if action not in LEAVE_TRANSITIONS:
+            raise ValidationError(detail=f"unknown WFH action: {action}")
+        allowed_from, new_status = LEAVE_TRANSITIONS[action]
+
+        async with self.wfh_repository.session_factory() as session:
+            wfh = await self.wfh_repository.lock(session, wfh_id)
+            if wfh.status not in allowed_from:
+                raise ValidationError(
+                    detail=f"cannot {action} a {wfh.status} WFH request"
+                )
+            values: dict[str, Any] = {"status": new_status}
+            if comments is not None:
+                values["comments"] = comments
+            if action in ("approve", "reject"):
+                values["approved_rejected_at"] = func.now()
+                values["approved_rejected_by"] = actor_id
+            wfh = await self.wfh_repository.set_status(session, wfh_id, values)
+        after_commit(
+            partial(
+                record_absence_change,
+                [(wfh.user_id, "wfh", wfh.request_date, wfh.request_date, new_status)],
+            )
+        )
+        return wfh
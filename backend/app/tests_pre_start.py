@@ -1,7 +1,8 @@
+import asyncio
 import logging
 
-from sqlalchemy import Engine
-from sqlmodel import Session, select
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
 from tenacity import after_log, before_log, retry, stop_after_attempt, wait_fixed
 
 from app.core.db import engine
@@ -19,11 +20,11 @@ wait_seconds = 1
     before=before_log(logger, logging.INFO),
     after=after_log(logger, logging.WARN),
 )
-def init(db_engine: Engine) -> None:
+async def init(db_engine: AsyncEngine) -> None:
     try:
-        # Try to create session to check if DB is awake
-        with Session(db_engine) as session:
-            session.exec(select(1))
+        # Try to open a connection to check if DB is awake
+        async with db_engine.connect() as conn:
+            await conn.execute(select(1))
     except Exception as e:
         logger.error(e)
         raise e
@@ -31,7 +32,7 @@ def init(db_engine: Engine) -> None:
 
 def main() -> None:
     logger.info("Initializing service")
-    init(engine)
+    asyncio.run(init(engine))
     logger.info("Service finished initializing")
 
 
@@ -0,0 +1,59 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+from app.main import app, container
+
+PARALLEL_REQUESTS = 300
+
+
+async def _fire(n: int) -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(
+            *(
+                client.get(f"{settings.API_V1_STR}/users/", params={"limit": 5})
+                for _ in range(n)
+            )
+        )
+
+
+def test_parallel_requests_never_share_a_session() -> None:
+    database = container.db()
+    real_session = database.session
+    sessions: list[Any] = []
+    tasks_per_session: dict[int, set[Any]] = defaultdict(set)
+
+    @asynccontextmanager
+    async def recording_session(*args: Any, **kwargs: Any) -> AsyncGenerator[Any, None]:
+        # Repositories pass read_only= / isolated=, which the real session handles
+        async with real_session(*args, **kwargs) as session:
+            if id(session) not in tasks_per_session:
+                sessions.append(session)  # keep a reference so ids are never recycled
+            tasks_per_session[id(session)].add(asyncio.current_task())
+            yield session
+
+    async def run() -> list[httpx.Response]:
+        # Pooled connections belong to the loop that opened them
+        await database._engine.dispose(close=False)
+        try:
+            return await _fire(PARALLEL_REQUESTS)
+        finally:
+            await database._engine.dispose()
+
+    # Repositories look up `db.session` every time they are built
+    database.session = recording_session
+    try:
+        responses = asyncio.run(run())
+    finally:
+        del database.session
+
+    assert all(r.status_code == 200 for r in responses)
+    # One session per request, and every use of a session comes from one request task
+    assert len(sessions) == PARALLEL_REQUESTS
+    assert all(len(tasks) == 1 for tasks in tasks_per_session.values())
@@ -0,0 +1,14 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes.v1.endpoints import departments, users
+
+
+def test_exports_reject_anonymous_requests() -> None:
+    app = FastAPI()
+    app.include_router(users.router)
+    app.include_router(departments.router)
+    client = TestClient(app)
+
+    assert client.get("/users/export").status_code == 401
+    assert client.get("/departments/export").status_code == 401
@@ -0,0 +1,66 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.routes.v1.endpoints.leaves import read_leave_balances, transition_leave
+from app.core.exceptions import AuthError
+
+
+def _user(id: int, role: str = "user") -> SimpleNamespace:
+    return SimpleNamespace(id=id, role=role, is_superuser=False)
+
+
+def _service(user_id: int = 3, supervisor_id: int = 1) -> MagicMock:
+    ser = MagicMock()
+    ser.get_by_id = AsyncMock(
+        return_value=SimpleNamespace(id=7, user_id=user_id, supervisor_id=supervisor_id)
+    )
+    ser.transition = AsyncMock(return_value="moved")
+    return ser
+
+
+def test_only_the_requests_supervisor_or_an_admin_approves() -> None:
+    ser = _service()
+
+    assert (
+        asyncio.run(transition_leave(7, "approve", _user(1, "supervisor"), ser=ser))
+        == "moved"
+    )
+    assert (
+        asyncio.run(transition_leave(7, "reject", _user(9, "admin"), ser=ser))
+        == "moved"
+    )
+    with pytest.raises(AuthError):
+        asyncio.run(transition_leave(7, "approve", _user(2, "supervisor"), ser=ser))
+
+
+def test_nobody_approves_their_own_request() -> None:
+    ser = _service(user_id=1, supervisor_id=1)
+
+    with pytest.raises(AuthError):
+        asyncio.run(transition_leave(7, "approve", _user(1, "admin"), ser=ser))
+    assert asyncio.run(transition_leave(7, "withdraw", _user(1), ser=ser)) == "moved"
+
+
+def test_other_employees_cancel_nothing() -> None:
+    with pytest.raises(AuthError):
+        asyncio.run(transition_leave(7, "cancel", _user(4), ser=_service()))
+
+
+def test_balances_are_for_the_employee_their_supervisor_and_admins() -> None:
+    ser = MagicMock()
+    ser.get_balances = AsyncMock(return_value=[])
+    users = MagicMock()
+    users.get_by_id = AsyncMock(return_value=SimpleNamespace(id=3, supervisor_id=1))
+
+    asyncio.run(read_leave_balances(_user(3), 3, 2026, ser=ser, users=users))
+    asyncio.run(
+        read_leave_balances(_user(1, "supervisor"), 3, 2026, ser=ser, users=users)
+    )
+    asyncio.run(read_leave_balances(_user(9, "admin"), 3, 2026, ser=ser, users=users))
+    with pytest.raises(AuthError):
+        asyncio.run(
+            read_leave_balances(_user(2, "supervisor"), 3, 2026, ser=ser, users=users)
+        )
@@ -0,0 +1,82 @@
+"""
+Compare BaseRepository.bulk_create with looping over create.
+
+Needs the database from .env; the departments it creates are deleted afterwards.
+
+    python -m tests.benchmarks.bulk_create --rows 20000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import delete
+
+from app.core.db import database
+from app.model.department_model import Department
+from app.repository.department_repository import DepartmentRepository
+from app.schema.department_schema import DepartmentCreate
+
+
+def _schemas(prefix: str, rows: int) -> list[DepartmentCreate]:
+    return [
+        DepartmentCreate(name=f"{prefix}-{i}", code=f"{prefix}-{i}")
+        for i in range(rows)
+    ]
+
+
+async def _timed(label: str, rows: int, func) -> float:
+    started = time.perf_counter()
+    await func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<12} {rows:>7} rows  {elapsed:8.3f}s  {rows / elapsed:10.0f} rows/s")
+    return elapsed
+
+
+async def main(rows: int, loop_rows: int, batch_size: int | None) -> None:
+    repository = DepartmentRepository(session_factory=database.session)
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    try:
+
+        async def loop_create() -> None:
+            for schema in _schemas(f"{prefix}-loop", loop_rows):
+                await repository.create(schema)
+
+        async def bulk_create() -> None:
+            report = await repository.bulk_create(
+                _schemas(f"{prefix}-bulk", rows), batch_size=batch_size
+            )
+            assert report["inserted"] == rows, report["failed"]
+
+        async def bulk_upsert() -> None:
+            report = await repository.bulk_upsert(
+                _schemas(f"{prefix}-bulk", rows),
+                conflict_cols=["code"],
+                batch_size=batch_size,
+            )
+            assert report["updated"] == rows, report["failed"]
+
+        loop = await _timed("create loop", loop_rows, loop_create)
+        bulk = await _timed("bulk_create", rows, bulk_create)
+        await _timed("bulk_upsert", rows, bulk_upsert)
+        print(
+            f"bulk_create is {(loop / loop_rows) / (bulk / rows):.1f}x faster per row"
+        )
+    finally:
+        async with database.session() as session:
+            await session.execute(
+                delete(Department).where(Department.code.startswith(prefix))
+            )
+        await database.engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument(
+        "--loop-rows", type=int, default=1000, help="rows for the create loop baseline"
+    )
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.loop_rows, args.batch_size))
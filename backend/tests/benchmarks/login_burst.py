@@ -0,0 +1,90 @@
+"""
+Load test: /users/ latency while a burst of logins runs on the same server.
+
+Start the API (a single worker shows the effect best), then
+
+    python -m tests.benchmarks.login_burst --url http://localhost:8000 --logins 50
+
+The users list is polled alone first (baseline) and then during the burst; with
+bcrypt off the event loop the two p99s should be close.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.core.config import settings
+
+
+async def _poll_users(
+    client: httpx.AsyncClient, stop: asyncio.Event, latencies: list[float]
+) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        r = await client.get(f"{settings.API_V1_STR}/users/", params={"limit": 20})
+        r.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+
+
+async def _login(client: httpx.AsyncClient) -> None:
+    r = await client.post(
+        f"{settings.API_V1_STR}/login/access-token",
+        data={
+            "username": settings.FIRST_SUPERUSER,
+            "password": settings.FIRST_SUPERUSER_PASSWORD,
+        },
+    )
+    r.raise_for_status()
+
+
+async def _measure(client: httpx.AsyncClient, pollers: int, during) -> list[float]:
+    latencies: list[float] = []
+    stop = asyncio.Event()
+    tasks = [
+        asyncio.create_task(_poll_users(client, stop, latencies))
+        for _ in range(pollers)
+    ]
+    await during()
+    stop.set()
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    ms = sorted(1000 * latency for latency in latencies)
+    p99 = ms[min(len(ms) - 1, int(len(ms) * 0.99))]
+    print(
+        f"{label:<14} n={len(ms):<5} p50={statistics.median(ms):7.1f} ms  p99={p99:7.1f} ms  max={ms[-1]:7.1f} ms"
+    )
+
+
+async def main(url: str, logins: int, pollers: int, baseline_seconds: float) -> None:
+    async with httpx.AsyncClient(base_url=url, timeout=60) as client:
+        baseline = await _measure(
+            client, pollers, lambda: asyncio.sleep(baseline_seconds)
+        )
+
+        async def burst() -> None:
+            started = time.perf_counter()
+            await asyncio.gather(*(_login(client) for _ in range(logins)))
+            print(f"{logins} logins took {time.perf_counter() - started:.2f}s")
+
+        during = await _measure(client, pollers, burst)
+
+    _report("baseline", baseline)
+    _report("during logins", during)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument(
+        "--pollers", type=int, default=4, help="concurrent /users/ clients"
+    )
+    parser.add_argument("--baseline-seconds", type=float, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.logins, args.pollers, args.baseline_seconds))
@@ -0,0 +1,76 @@
+"""
+Per-row CPU cost of turning a list page into a JSON body: validating every row
+(model_validate, then FastAPI validating the response_model again) against the
+trusted-row path (model_construct + model_dump_json). No database needed.
+
+    python -m tests.benchmarks.serialize_rows --rows 10000
+"""
+
+import argparse
+import time
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.serialization import construct_rows, json_response
+from app.schema.user_schema import UserPublic, UsersPublic
+
+
+def _rows(count: int) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": i,
+            "email": f"user{i}@example.com",
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+            "user_id": uuid.uuid4(),
+            "is_active": True,
+            "created_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+def validated(rows: list[dict]) -> bytes:
+    content = UsersPublic(
+        data=[UserPublic.model_validate(row) for row in rows], count=len(rows)
+    )
+    # What FastAPI does with a response_model: validate again, then jsonable_encoder
+    content = UsersPublic.model_validate(content.model_dump())
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def trusted(rows: list[dict]) -> bytes:
+    content = UsersPublic.model_construct(
+        data=construct_rows(UserPublic, rows), count=len(rows)
+    )
+    return json_response(content).body
+
+
+def _best_of(func, rows: list[dict], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(count: int, repeat: int) -> None:
+    rows = _rows(count)
+    for label, func in (("validated", validated), ("trusted", trusted)):
+        elapsed = _best_of(func, rows, repeat)
+        print(
+            f"{label:<10} {count:>6} rows  {elapsed * 1000:8.1f} ms  {elapsed / count * 1e6:6.2f} us/row"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
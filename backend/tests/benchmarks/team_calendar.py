@@ -0,0 +1,84 @@
+"""
+/departments/{id}/calendar served from a cached absence matrix: building a
+department-year matrix, answering a window from it and applying incremental
+changes. No database needed.
+
+    python -m tests.benchmarks.team_calendar --members 500 --days 90
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.absence import AbsenceMatrix, absence_cache, record_absence_change
+from app.services.department_service import DepartmentService
+
+
+def _rows(members: int, rng: random.Random) -> tuple[list, list, list]:
+    people = [(i, f"First{i}", f"Last{i}") for i in range(members)]
+    leaves, wfh = [], []
+    for user_id, _, _ in people:
+        day = date(2026, 1, 1)
+        while True:  # non-overlapping requests through the year
+            day += timedelta(days=rng.randrange(5, 40))
+            end = day + timedelta(days=rng.randrange(5))
+            if end.year > 2026:
+                break
+            leaves.append((user_id, day, end, rng.choice(("pending", "approved"))))
+            wfh.append((user_id, end + timedelta(days=1), "approved"))
+            day = end + timedelta(days=2)
+    return people, leaves, wfh
+
+
+def main(members: int, days: int, repeat: int) -> None:
+    rng = random.Random(0)
+    rows = _rows(members, rng)
+    repository = MagicMock()
+    repository.read_by_id = AsyncMock()
+    repository.get_absence_rows = AsyncMock(return_value=rows)
+    service = DepartmentService(repository)
+    start = date(2026, 3, 1)
+    end = start + timedelta(days=days - 1)
+
+    started = time.perf_counter()
+    AbsenceMatrix(2026, *rows)
+    print(
+        f"build     {members} members x 365 days, {len(rows[1])} leaves: {(time.perf_counter() - started) * 1000:7.2f} ms"
+    )
+
+    absence_cache.clear()
+    asyncio.run(service.get_calendar(1, start, end))  # warm the cache
+
+    async def windows() -> None:
+        for _ in range(repeat):
+            await service.get_calendar(1, start, end)
+
+    started = time.perf_counter()
+    asyncio.run(windows())
+    print(
+        f"calendar  {members} members x {days} days: {(time.perf_counter() - started) / repeat * 1000:7.2f} ms/request"
+    )
+
+    changes = [
+        (rng.randrange(members), "leave", start, start + timedelta(days=2), "approved")
+        for _ in range(repeat)
+    ]
+    started = time.perf_counter()
+    for change in changes:
+        record_absence_change([change])
+    print(
+        f"change    one request: {(time.perf_counter() - started) / repeat * 1e6:7.2f} us"
+    )
+    absence_cache.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    main(args.members, args.days, args.repeat)
@@ -0,0 +1,64 @@
+"""
+Recounting number_of_days for many leave requests after a holiday change:
+one vectorized HolidayCalendars.count_many call against a per-request python
+loop over the same calendars. No database needed.
+
+    python -m tests.benchmarks.working_days --requests 100000 --departments 20
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from app.core.workdays import HolidayCalendars
+
+
+def main(requests: int, departments: int) -> None:
+    rng = random.Random(0)
+    first = date(2026, 1, 1)
+    holidays = [
+        (None, first + timedelta(days=rng.randrange(365)), False) for _ in range(10)
+    ]
+    holidays += [
+        (
+            rng.randrange(departments),
+            first + timedelta(days=rng.randrange(365)),
+            rng.random() < 0.3,
+        )
+        for _ in range(5 * departments)
+    ]
+    calendars = HolidayCalendars(holidays)
+
+    department_ids = [rng.choice([None, *range(departments)]) for _ in range(requests)]
+    starts = [first + timedelta(days=rng.randrange(365)) for _ in range(requests)]
+    ends = [start + timedelta(days=rng.randrange(15)) for start in starts]
+    start_half = [rng.random() < 0.1 for _ in range(requests)]
+    end_half = [rng.random() < 0.1 for _ in range(requests)]
+
+    started = time.perf_counter()
+    vectorized = calendars.count_many(
+        department_ids, starts, ends, start_half, end_half
+    )
+    batch = time.perf_counter() - started
+
+    started = time.perf_counter()
+    looped = [
+        calendars.count(*row)
+        for row in zip(department_ids, starts, ends, start_half, end_half, strict=True)
+    ]
+    loop = time.perf_counter() - started
+
+    assert [float(days) for days in looped] == vectorized.tolist()
+    print(f"count_many {requests:>8} requests  {batch * 1000:8.1f} ms")
+    print(
+        f"count loop {requests:>8} requests  {loop * 1000:8.1f} ms  ({loop / batch:.0f}x slower)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--departments", type=int, default=20)
+    args = parser.parse_args()
+    main(args.requests, args.departments)
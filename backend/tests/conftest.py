@@ -1,11 +1,17 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import Session, delete
 
 from app.core.config import settings
-from app.core.db import engine, init_db
+from app.core.db import init_db
+from app.core.rate_limit import Bucket, InMemoryRateLimitBackend, LoginRateLimiter
 from app.main import app
 from app.models import Item, User
 from tests.utils.user import authentication_token_from_email
@@ -14,6 +20,9 @@ from tests.utils.utils import get_superuser_token_headers
 
 @pytest.fixture(scope="session", autouse=True)
 def db() -> Generator[Session, None, None]:
+    # The app's engine is async; tests seed and inspect rows through a sync engine
+    # of their own on the same database (psycopg drives both)
+    engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI), poolclass=NullPool)
     with Session(engine) as session:
         init_db(session)
         yield session
@@ -22,11 +31,17 @@ def db() -> Generator[Session, None, None]:
         statement = delete(User)
         session.execute(statement)
         session.commit()
+    engine.dispose()
 
 
 @pytest.fixture(scope="module")
 def client() -> Generator[TestClient, None, None]:
-    with TestClient(app) as c:
+    # The suite logs in far more often than the production login limits allow
+    unlimited = Bucket(capacity=1_000_000, rate=1_000_000)
+    limiter = LoginRateLimiter(
+        InMemoryRateLimitBackend(), per_ip=unlimited, per_account=unlimited
+    )
+    with app.state.container.login_rate_limiter.override(limiter), TestClient(app) as c:
         yield c
 
 
@@ -40,3 +55,22 @@ def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]
     return authentication_token_from_email(
         client=client, email=settings.EMAIL_TEST_USER, db=db
     )
+
+
+@pytest.fixture
+def session() -> AsyncMock:
+    """Stand-in AsyncSession for repository and service unit tests"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def session_factory(
+    session: AsyncMock,
+) -> Callable[..., AbstractAsyncContextManager[AsyncMock]]:
+    """A repository session_factory handing out `session`, whatever it is asked for"""
+
+    @asynccontextmanager
+    async def factory(*_args: Any, **_kwargs: Any) -> AsyncGenerator[AsyncMock, None]:
+        yield session
+
+    return factory
@@ -0,0 +1,90 @@
+from datetime import date
+
+import numpy as np
+
+from app.core.absence import (
+    LEAVE_APPROVED,
+    AbsenceMatrix,
+    absence_cache,
+    absence_generation,
+    encode_rows,
+    record_absence_change,
+)
+
+MEMBERS = [(1, "Ada", "Lovelace"), (2, "Alan", "Turing")]
+
+
+def test_requests_are_laid_out_per_member_and_day() -> None:
+    matrix = AbsenceMatrix(
+        2026,
+        MEMBERS,
+        leaves=[
+            (1, date(2026, 1, 2), date(2026, 1, 4), "approved"),
+            (2, date(2025, 12, 30), date(2026, 1, 1), "pending"),
+            (1, date(2026, 1, 6), date(2026, 1, 6), "pending"),
+            (3, date(2026, 1, 1), date(2026, 1, 9), "approved"),
+        ],  # not a member
+        wfh=[(2, date(2026, 1, 5), "approved")],
+    )
+
+    assert matrix.flags.shape == (2, 365)
+    assert encode_rows(matrix.window(date(2026, 1, 1), date(2026, 1, 8))) == [
+        ".LLL.l..",
+        "l...W...",
+    ]
+
+
+def test_mark_replaces_the_request_kind_only() -> None:
+    matrix = AbsenceMatrix(
+        2026,
+        MEMBERS,
+        leaves=[(1, date(2026, 1, 2), date(2026, 1, 4), "pending")],
+        wfh=[(1, date(2026, 1, 5), "pending")],
+    )
+
+    assert matrix.mark(1, "leave", date(2026, 1, 2), date(2026, 1, 4), "approved")
+    assert matrix.mark(1, "wfh", date(2026, 1, 5), date(2026, 1, 5), "approved")
+    assert encode_rows(matrix.window(date(2026, 1, 1), date(2026, 1, 6))) == [
+        ".LLLW.",
+        "......",
+    ]
+    assert matrix.mark(1, "leave", date(2026, 1, 2), date(2026, 1, 4), "withdrawn")
+    assert encode_rows(matrix.window(date(2026, 1, 1), date(2026, 1, 6))) == [
+        "....W.",
+        "......",
+    ]
+    assert not matrix.mark(3, "leave", date(2026, 1, 2), date(2026, 1, 4), "approved")
+    assert not matrix.mark(1, "leave", date(2027, 1, 2), date(2027, 1, 4), "approved")
+
+
+def test_window_aligns_to_other_members() -> None:
+    matrix = AbsenceMatrix(
+        2026, MEMBERS, leaves=[(2, date(2026, 1, 1), date(2026, 1, 2), "approved")]
+    )
+
+    window = matrix.window(date(2026, 1, 1), date(2026, 1, 3), user_ids=[2, 5])
+
+    assert window.tolist() == [[LEAVE_APPROVED, LEAVE_APPROVED, 0], [0, 0, 0]]
+
+
+def test_recorded_changes_reach_cached_matrices_of_every_year_they_touch() -> None:
+    absence_cache.clear()
+    matrices = {year: AbsenceMatrix(year, MEMBERS) for year in (2025, 2026)}
+    for year, matrix in matrices.items():
+        absence_cache.set((7, year), matrix)
+    generation = absence_generation()
+
+    record_absence_change(
+        [(1, "leave", date(2025, 12, 31), date(2026, 1, 1), "approved")]
+    )
+
+    assert absence_generation() != generation
+    assert (
+        np.count_nonzero(matrices[2025].flags) == 1
+        and matrices[2025].flags[0, -1] == LEAVE_APPROVED
+    )
+    assert (
+        np.count_nonzero(matrices[2026].flags) == 1
+        and matrices[2026].flags[0, 0] == LEAVE_APPROVED
+    )
+    absence_cache.clear()
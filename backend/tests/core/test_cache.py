@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+from app.core.cache import LRUCache
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl() -> None:
+    cache = LRUCache(maxsize=8, ttl=10)
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value")
+    with patch("app.core.cache.time.monotonic", return_value=105.0):
+        assert cache.get("key") == "value"
+    with patch("app.core.cache.time.monotonic", return_value=111.0):
+        assert cache.get("key") is None
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 0
+
+
+def test_values_skips_expired_entries_without_counting_lookups() -> None:
+    cache = LRUCache(maxsize=8, ttl=10)
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        cache.set("old", 1)
+    with patch("app.core.cache.time.monotonic", return_value=108.0):
+        cache.set("new", 2)
+    with patch("app.core.cache.time.monotonic", return_value=111.0):
+        assert cache.values() == [2]
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 0
@@ -0,0 +1,36 @@
+import asyncio
+from datetime import datetime, timezone
+
+from app.core.export import csv_lines, ndjson_lines
+
+ROWS = [
+    [{"id": 1, "name": "IT", "created_at": datetime(2024, 1, 2, tzinfo=timezone.utc)}],
+    [],
+    [{"id": 2, "name": "HR", "created_at": None}],
+]
+
+
+async def _chunks():
+    for chunk in ROWS:
+        yield chunk
+
+
+async def _collect(lines) -> bytes:
+    return b"".join([part async for part in lines])
+
+
+def test_ndjson_writes_one_document_per_row() -> None:
+    body = asyncio.run(_collect(ndjson_lines(_chunks())))
+    assert body.splitlines() == [
+        b'{"id":1,"name":"IT","created_at":"2024-01-02T00:00:00Z"}',
+        b'{"id":2,"name":"HR","created_at":null}',
+    ]
+
+
+def test_csv_writes_header_once() -> None:
+    body = asyncio.run(_collect(csv_lines(_chunks()))).decode()
+    assert body.splitlines() == [
+        "id,name,created_at",
+        "1,IT,2024-01-02 00:00:00+00:00",
+        "2,HR,",
+    ]
@@ -0,0 +1,49 @@
+import random
+from datetime import date, timedelta
+
+from app.core.intervals import IntervalIndex, IntervalValidator
+
+
+def test_neighbours_and_touching_days_conflict() -> None:
+    index = IntervalIndex()
+    assert index.add(date(2026, 3, 10), date(2026, 3, 12), "a") is None
+    assert index.add(date(2026, 3, 20), date(2026, 3, 20), "b") is None
+
+    assert (
+        index.conflict(date(2026, 3, 12), date(2026, 3, 15)) == "a"
+    )  # closed intervals share the 12th
+    assert index.conflict(date(2026, 3, 1), date(2026, 3, 31)) is not None
+    assert index.conflict(date(2026, 3, 19), date(2026, 3, 19)) is None
+    assert index.conflict(date(2026, 3, 13), date(2026, 3, 19)) is None
+    assert index.add(date(2026, 3, 11), date(2026, 3, 11), "c") == "a"
+    assert len(index) == 2
+
+
+def test_matches_a_pairwise_scan() -> None:
+    rng = random.Random(1)
+    index, accepted = IntervalIndex(), []
+    for i in range(2000):
+        start = rng.randrange(5000)
+        end = start + rng.randrange(10)
+        expected = any(s <= end and start <= e for s, e in accepted)
+        assert (index.add(start, end, i) is not None) == expected
+        if not expected:
+            accepted.append((start, end))
+
+
+def test_validator_keeps_owners_apart_and_seeds_stored_intervals() -> None:
+    validator = IntervalValidator(
+        [(1, date(2026, 3, 2), date(2026, 3, 6), "leave request 9")]
+    )
+
+    assert (
+        validator.check(1, date(2026, 3, 6), date(2026, 3, 9), "row 0")
+        == "leave request 9"
+    )
+    assert validator.check(2, date(2026, 3, 6), date(2026, 3, 9), "row 1") is None
+    assert (
+        validator.check(
+            2, date(2026, 3, 9), date(2026, 3, 9) + timedelta(days=1), "row 2"
+        )
+        == "row 1"
+    )
@@ -0,0 +1,99 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions import ValidationError
+from app.core.pagination import coerce_cursor_value, decode_cursor, encode_cursor
+from app.model.user_model import User
+from app.repository.user_repository import UserRepository
+
+# last_name ASC, id DESC
+MIXED = [(User.last_name, False), (User.id, True)]
+
+
+def _sql(condition: object) -> str:
+    return str(
+        condition.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def _after(keys: list, values: list, backwards: bool = False) -> str:
+    return _sql(
+        UserRepository(None)._keyset_condition(keys, encode_cursor(values), backwards)
+    )
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    user_id = uuid.uuid4()
+    cursor = encode_cursor([created_at, user_id, 42])
+    raw = decode_cursor(cursor, size=3)
+    assert coerce_cursor_value(User.created_at, raw[0]) == created_at
+    assert coerce_cursor_value(User.user_id, raw[1]) == user_id
+    assert coerce_cursor_value(User.id, raw[2]) == 42
+
+
+def test_cursor_keeps_nulls() -> None:
+    raw = decode_cursor(encode_cursor([None, 7]), size=2)
+    assert coerce_cursor_value(User.created_at, raw[0]) is None
+    assert raw[1] == 7
+
+
+def test_cursor_rejects_garbage() -> None:
+    with pytest.raises(ValidationError):
+        decode_cursor("not-a-cursor")
+
+
+def test_cursor_rejects_other_ordering() -> None:
+    with pytest.raises(ValidationError):
+        decode_cursor(encode_cursor([1, 2]), size=3)
+
+
+def test_keyset_condition_breaks_ties_in_each_keys_direction() -> None:
+    assert _after(MIXED, ["Lovelace", 7]) == (
+        "users.last_name > 'Lovelace' OR users.last_name = 'Lovelace' AND users.id < 7"
+    )
+
+
+def test_keyset_condition_reads_backwards_for_before() -> None:
+    assert _after(MIXED, ["Lovelace", 7], backwards=True) == (
+        "users.last_name < 'Lovelace' OR users.last_name = 'Lovelace' AND users.id > 7"
+    )
+
+
+def test_keyset_condition_places_nulls_like_postgres() -> None:
+    ascending = [(User.department_id, False), (User.id, False)]
+    descending = [(User.department_id, True), (User.id, False)]
+
+    # ASC sorts NULLS LAST: they follow every value, and only other NULLs follow a NULL
+    assert _after(ascending, [3, 7]) == (
+        "users.department_id > 3 OR users.department_id IS NULL OR users.department_id = 3 AND users.id > 7"
+    )
+    assert (
+        _after(ascending, [None, 7]) == "users.department_id IS NULL AND users.id > 7"
+    )
+    # DESC sorts NULLS FIRST: every value follows a NULL
+    assert _after(descending, [None, 7]) == (
+        "users.department_id IS NOT NULL OR users.department_id IS NULL AND users.id > 7"
+    )
+
+
+def test_page_cursors_follow_the_direction_the_page_was_read() -> None:
+    repository = UserRepository(None)
+    rows = [["Ada", 1], ["Alan", 2]]
+    first, last = encode_cursor(rows[0]), encode_cursor(rows[-1])
+
+    assert repository._page_cursors([], True) == (None, None)
+    # First page: no way back
+    assert repository._page_cursors(rows, has_more=True) == (last, None)
+    assert repository._page_cursors(rows, has_more=False) == (None, None)
+    # Offset pages past the first and pages read after a cursor can go back
+    assert repository._page_cursors(rows, has_more=False, page=2) == (None, first)
+    assert repository._page_cursors(rows, has_more=True, after="c") == (last, first)
+    # Read before a cursor: the rows after it exist, has_more is about the ones before
+    assert repository._page_cursors(rows, has_more=False, before="c") == (last, None)
+    assert repository._page_cursors(rows, has_more=True, before="c") == (last, first)
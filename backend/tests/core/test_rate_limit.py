@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from app.core.exceptions import TooManyRequestsError
+from app.core.rate_limit import Bucket, InMemoryRateLimitBackend, LoginRateLimiter
+
+
+def test_bucket_allows_a_burst_then_reports_retry_after() -> None:
+    backend = InMemoryRateLimitBackend()
+    bucket = Bucket(capacity=3, rate=0.5)
+
+    async def take_four() -> list[float]:
+        return [await backend.take("k", bucket) for _ in range(4)]
+
+    waits = asyncio.run(take_four())
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert 1.9 < waits[3] <= 2.0
+
+
+def test_limiter_rejects_with_429_and_retry_after() -> None:
+    limiter = LoginRateLimiter(
+        InMemoryRateLimitBackend(), per_ip=Bucket(10, 1), per_account=Bucket(2, 1 / 60)
+    )
+
+    async def attempts() -> None:
+        await limiter.check("ada@example.com", "10.0.0.1")
+        # accounts are matched case-insensitively, from any address
+        await limiter.check("ADA@example.com ", "10.0.0.2")
+        await limiter.check("bob@example.com", "10.0.0.1")
+        await limiter.check("ada@example.com", "10.0.0.3")
+
+    with pytest.raises(TooManyRequestsError) as exc:
+        asyncio.run(attempts())
+
+    assert exc.value.status_code == 429
+    assert 59 <= int(exc.value.headers["Retry-After"]) <= 60
@@ -0,0 +1,42 @@
+import asyncio
+import time
+
+from app.core.security import PasswordHasher, get_password_hash
+
+
+def test_password_work_runs_off_the_event_loop() -> None:
+    hasher = PasswordHasher(max_workers=2)
+    hashed = get_password_hash("changethis")
+
+    async def main() -> list[bool]:
+        ticks = 0
+        done = False
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                hasher.verify(pwd, hashed)
+                for pwd in ["changethis", "wrong", "changethis"]
+            )
+        )
+        elapsed = time.perf_counter() - started
+        done = True
+        await task
+        # the loop kept ticking at roughly its own pace while bcrypt ran
+        assert ticks >= elapsed / 0.005 / 3
+        return results
+
+    results = asyncio.run(main())
+
+    assert results == [True, False, True]
+    stats = hasher.stats()
+    assert stats["completed"] == 3
+    assert stats["queued"] == stats["running"] == 0
+    assert stats["max_queued"] >= 1
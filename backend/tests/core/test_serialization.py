@@ -0,0 +1,32 @@
+import uuid
+from datetime import datetime, timezone
+
+from app.core.serialization import construct_rows, json_response
+from app.schema.user_schema import UserPublic, UsersPublic
+
+ROWS = [
+    {
+        "id": i,
+        "email": f"user{i}@example.com",
+        "first_name": "Ada",
+        "last_name": "Lovelace",
+        "user_id": uuid.UUID(int=i),
+        "is_active": True,
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+    }
+    for i in range(3)
+]
+
+
+def test_trusted_rows_serialize_like_validated_rows() -> None:
+    validated = UsersPublic(
+        data=[UserPublic.model_validate(row) for row in ROWS], count=3
+    )
+    trusted = UsersPublic.model_construct(
+        data=construct_rows(UserPublic, ROWS), count=3
+    )
+
+    response = json_response(trusted)
+
+    assert response.media_type == "application/json"
+    assert response.body == validated.model_dump_json().encode()
@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from app.core.workdays import HolidayCalendars, WorkdayCalendar
+
+# Mon 2026-03-02 .. Sun 2026-03-08
+MON, TUE, WED, FRI, SAT, SUN = (date(2026, 3, d) for d in (2, 3, 4, 6, 7, 8))
+
+
+def test_weekends_and_holidays_are_not_counted() -> None:
+    calendar = WorkdayCalendar(holidays=[WED], weekmask="1111100")
+
+    assert calendar.count(MON, SUN) == Decimal(4)
+    assert calendar.count(SAT, SUN) == 0
+    assert calendar.count(WED, WED) == 0
+
+
+def test_half_days() -> None:
+    calendar = WorkdayCalendar(half_holidays=[FRI, SAT], weekmask="1111100")
+
+    assert calendar.count(MON, SUN) == Decimal(
+        "4.5"
+    )  # a half holiday on a weekend changes nothing
+    assert calendar.count(MON, TUE, start_half=True) == Decimal("1.5")
+    assert calendar.count(MON, TUE, start_half=True, end_half=True) == Decimal(1)
+    assert calendar.count(MON, MON, end_half=True) == Decimal("0.5")
+    assert calendar.count(FRI, FRI, start_half=True) == Decimal("0.5")
+    assert calendar.count(MON, SAT, end_half=True) == Decimal(
+        "4.5"
+    )  # ends on a weekend day
+
+
+def test_department_calendars_add_to_the_company_one() -> None:
+    calendars = HolidayCalendars(
+        [(None, MON, False), (7, TUE, False), (7, WED, True)], weekmask="1111100"
+    )
+
+    assert calendars.count(None, MON, SUN) == Decimal(4)
+    assert calendars.count(7, MON, SUN) == Decimal("2.5")
+    assert calendars.count(99, MON, SUN) == Decimal(4)  # no holidays of its own
+
+
+def test_count_many_matches_count() -> None:
+    calendars = HolidayCalendars(
+        [(None, MON, False), (7, TUE, False), (8, WED, True)], weekmask="1111100"
+    )
+    rows = [
+        (
+            department_id,
+            MON + timedelta(days=offset),
+            MON + timedelta(days=offset + length),
+            start_half,
+            end_half,
+        )
+        for department_id in (None, 7, 8, 9)
+        for offset in range(7)
+        for length in range(9)
+        for start_half in (False, True)
+        for end_half in (False, True)
+    ]
+
+    counted = calendars.count_many(*zip(*rows, strict=True))
+
+    assert counted.tolist() == [float(calendars.count(*row)) for row in rows]
@@ -0,0 +1,80 @@
+import asyncio
+from collections.abc import Callable
+from contextlib import nullcontext
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core.exceptions import ValidationError
+from app.repository.department_repository import DepartmentRepository
+
+
+def _repository(
+    session: AsyncMock, session_factory: Callable[..., Any], execute: Callable[..., Any]
+) -> DepartmentRepository:
+    session.execute.side_effect = execute
+    session.begin_nested = MagicMock(side_effect=lambda: nullcontext())
+    return DepartmentRepository(session_factory=session_factory)
+
+
+def _returned(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def test_bulk_create_falls_back_to_single_rows_when_a_batch_fails(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    def execute(_stmt, params):
+        if any(row["name"] == "dup" for row in params):
+            raise IntegrityError("INSERT", params, Exception("duplicate key"))
+        return _returned([SimpleNamespace(id=row["id"], _mapping={}) for row in params])
+
+    rows = [{"id": 1, "name": "a"}, {"id": 2, "name": "dup"}, {"id": 3, "name": "c"}]
+    report = asyncio.run(
+        _repository(session, session_factory, execute).bulk_create(rows, batch_size=2)
+    )
+
+    assert (report["total"], report["inserted"], report["failed"]) == (3, 2, 1)
+    assert [row["status"] for row in report["rows"]] == [
+        "inserted",
+        "failed",
+        "inserted",
+    ]
+    assert report["rows"][1]["error"] == "duplicate key"
+
+
+def test_bulk_writes_leave_a_missing_id_to_the_database(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    sent = []
+
+    def execute(_stmt, params):
+        sent.extend(params)
+        return _returned(
+            [
+                SimpleNamespace(id=index + 10, _mapping={})
+                for index, _ in enumerate(params)
+            ]
+        )
+
+    repository = _repository(session, session_factory, execute)
+    asyncio.run(repository.bulk_create([{"id": None, "name": "a"}]))
+    asyncio.run(
+        repository.bulk_upsert([{"id": None, "name": "b"}], conflict_cols=["name"])
+    )
+
+    assert sent == [{"name": "a"}, {"name": "b"}]
+
+
+def test_bulk_upsert_needs_a_conflict_column(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    repository = _repository(session, session_factory, lambda stmt, params: None)
+
+    with pytest.raises(ValidationError):
+        asyncio.run(repository.bulk_upsert([{"name": "a"}], conflict_cols=[]))
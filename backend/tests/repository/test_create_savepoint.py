@@ -0,0 +1,33 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from app.core.exceptions import DuplicatedError
+from app.main import container
+from app.repository.holiday_repository import HolidayRepository
+from app.schema.holiday_schema import HolidayCreate
+
+
+def test_a_duplicate_keeps_the_requests_earlier_writes() -> None:
+    database = container.db()
+    holidays = HolidayRepository(database.session)
+    day = date(2099, 12, 24)
+
+    async def run() -> str:
+        # Pooled connections belong to the loop that opened them
+        await database._engine.dispose(close=False)
+        try:
+            async with database.request_scope() as scope:
+                kept = await holidays.create(HolidayCreate(date=day, name="Kept"))
+                with pytest.raises(DuplicatedError):
+                    await holidays.create(HolidayCreate(date=day, name="Duplicate"))
+                await scope.finish(commit=True)
+            try:
+                return (await holidays.read_by_id(kept.id)).name
+            finally:
+                await holidays.delete_by_id(kept.id)
+        finally:
+            await database._engine.dispose()
+
+    assert asyncio.run(run()) == "Kept"
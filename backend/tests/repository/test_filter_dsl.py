@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions import ValidationError
+from app.repository.department_repository import DepartmentRepository
+
+COLUMNS = ["Department.id", "Department.name"]
+
+SPEC = [
+    {"field": "Department.is_active", "op": "=", "value": True},
+    {
+        "or": [
+            {"field": "Department.name", "op": "ilike", "value": "it"},
+            {"not": {"field": "Department.code", "op": "in", "value": ["HR", "OPS"]}},
+        ]
+    },
+    {
+        "field": "Department.created_at",
+        "op": "between",
+        "value": ["2024-01-01", "2024-12-31"],
+    },
+    {"field": "Department.description", "op": "is_null", "value": False},
+    {"field": "Department.name", "op": "=", "value": None},
+]
+
+
+def _sql(spec) -> str:
+    repository = DepartmentRepository(session_factory=None)
+    query, _ = repository._query_shape(COLUMNS, None, spec)
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_nested_groups_compile_to_one_predicate() -> None:
+    where = _sql(SPEC).split("WHERE", 1)[1]
+
+    assert "departments_1.is_active = %(f_0)s" in where
+    assert " OR " in where and "NOT IN (__[POSTCOMPILE_f_2])" in where
+    assert "created_at BETWEEN %(f_3_0)s" in where and "AND %(f_3_1)s" in where
+    assert "departments_1.description IS NOT NULL" in where
+    # the None-valued condition is left out
+    assert "f_5" not in where
+
+
+def test_params_follow_condition_numbering() -> None:
+    repository = DepartmentRepository(session_factory=None)
+
+    assert repository._filter_params(SPEC) == {
+        "f_0": True,
+        "f_1": "it",
+        "f_2": ["HR", "OPS"],
+        "f_3_0": "2024-01-01",
+        "f_3_1": "2024-12-31",
+    }
+
+
+def test_signature_keeps_structure_and_is_null_flag() -> None:
+    repository = DepartmentRepository(session_factory=None)
+    flipped = [dict(f) for f in SPEC]
+    flipped[3]["value"] = True
+
+    assert repository._filter_signature(SPEC) != repository._filter_signature(flipped)
+    assert repository._filter_signature(SPEC) == repository._filter_signature(
+        [dict(SPEC[0], value=False), *SPEC[1:]]
+    )
+
+
+def test_overlaps_on_a_field_pair() -> None:
+    spec = [
+        {
+            "field": ["Department.created_at", "Department.updated_at"],
+            "op": "overlaps",
+            "value": ["a", "b"],
+        }
+    ]
+    where = _sql(spec).split("WHERE", 1)[1]
+
+    assert "departments_1.created_at <= %(f_0_1)s" in where
+    assert "departments_1.updated_at >= %(f_0_0)s" in where
+
+
+def test_unknown_operator_is_rejected() -> None:
+    repository = DepartmentRepository(session_factory=None)
+
+    with pytest.raises(ValidationError):
+        repository._filter_params(
+            [{"field": "Department.name", "op": "~=", "value": "x"}]
+        )
+
+
+def test_departments_by_admin_require_the_admin() -> None:
+    with pytest.raises(ValidationError):
+        asyncio.run(DepartmentRepository(None).get_departments_by_admin(None))
@@ -0,0 +1,63 @@
+import asyncio
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.repository.leave_balance_repository import LeaveBalanceRepository
+
+
+def _sql(stmt: object) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _repository(
+    session: AsyncMock, session_factory: Callable[..., Any], returned: object
+) -> LeaveBalanceRepository:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = returned
+    session.execute.return_value = result
+    return LeaveBalanceRepository(session_factory=session_factory)
+
+
+def test_lock_balance_seeds_then_locks_the_row(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    balance = object()
+    repository = _repository(session, session_factory, balance)
+
+    assert asyncio.run(repository.lock_balance(session, 3, 2, 2026)) is balance
+
+    seed, lock = (call.args[0] for call in session.execute.await_args_list)
+    assert (
+        "ON CONFLICT ON CONSTRAINT uq_employee_leave_balance_employee_type_year DO NOTHING"
+        in _sql(seed)
+    )
+    assert "FOR UPDATE" in _sql(lock)
+
+
+def test_add_used_days_is_computed_by_the_database(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    balance = object()
+    repository = _repository(session, session_factory, balance)
+
+    assert asyncio.run(repository.add_used_days(session, 11, Decimal("1.5"))) is balance
+
+    sql = _sql(session.execute.await_args.args[0])
+    assert "used_days=(employee_leave_balance.used_days +" in sql
+    assert "RETURNING" in sql
+
+
+def test_get_balance_is_a_single_keyed_lookup(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    balance = object()
+    repository = _repository(session, session_factory, balance)
+
+    assert asyncio.run(repository.get_balance(3, 2, 2026)) is balance
+    sql = _sql(session.execute.await_args.args[0])
+    assert session.execute.await_count == 1
+    assert "sum(" not in sql.lower()
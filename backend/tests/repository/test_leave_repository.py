@@ -0,0 +1,71 @@
+import asyncio
+from collections.abc import Callable
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.repository.leave_repository import LeaveRepository
+
+
+def _sql(stmt: object) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _session(returned: object) -> AsyncMock:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = returned
+    session = AsyncMock()
+    session.execute.return_value = result
+    return session
+
+
+def test_overlap_query_matches_the_exclusion_index_expression() -> None:
+    session = _session(None)
+
+    assert (
+        asyncio.run(
+            LeaveRepository(None).find_overlap(
+                session, 3, date(2026, 3, 2), date(2026, 3, 6)
+            )
+        )
+        is None
+    )
+
+    sql = _sql(session.execute.await_args.args[0])
+    assert (
+        "daterange(leave_requests.start_date, leave_requests.end_date, '[]') &&" in sql
+    )
+    assert "leave_requests.status IN" in sql
+
+
+def test_employees_are_locked_without_blocking_foreign_key_checks() -> None:
+    session = AsyncMock()
+    session.execute.return_value = [
+        SimpleNamespace(id=3, department_id=None, supervisor_id=1),
+        SimpleNamespace(id=4, department_id=5, supervisor_id=1),
+    ]
+
+    employees = asyncio.run(LeaveRepository(None).lock_employees(session, [4, 3, 4]))
+
+    assert {id: row.department_id for id, row in employees.items()} == {3: None, 4: 5}
+    assert "FOR NO KEY UPDATE" in _sql(session.execute.await_args.args[0])
+
+
+def test_inbox_query_seeks_the_partial_index_past_the_cursor(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    session.execute.return_value = MagicMock()
+    asyncio.run(
+        LeaveRepository(session_factory).pending_for_supervisor(
+            1, (datetime(2026, 3, 2, 9), 40), 21
+        )
+    )
+
+    sql = _sql(session.execute.await_args.args[0])
+    assert "leave_requests.supervisor_id = %(supervisor_id_1)s" in sql
+    assert "leave_requests.status = %(status_1)s" in sql
+    assert "(leave_requests.created_at, leave_requests.id) > (" in sql
+    assert "ORDER BY leave_requests.created_at, leave_requests.id \n LIMIT" in sql
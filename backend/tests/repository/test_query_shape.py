@@ -0,0 +1,37 @@
+from app.repository.base_repository import query_shape_cache
+from app.repository.department_repository import DepartmentRepository
+
+COLUMNS = ["Department.id", "Department.name", "User.first_name"]
+JOINS = ["admins", "admins.user"]
+
+
+def test_same_shape_is_reused_across_values() -> None:
+    repository = DepartmentRepository(session_factory=None)
+    query_shape_cache.clear()
+    hits = query_shape_cache.hits
+
+    first = repository._query_shape(
+        COLUMNS, JOINS, [{"field": "Department.name", "op": "ilike", "value": "IT"}]
+    )
+    second = repository._query_shape(
+        COLUMNS, JOINS, [{"field": "Department.name", "op": "ilike", "value": "HR"}]
+    )
+
+    assert first is second
+    assert query_shape_cache.hits == hits + 1
+    assert repository._filter_params(
+        [{"field": "Department.name", "op": "ilike", "value": "HR"}]
+    ) == {"f_0": "HR"}
+
+
+def test_different_filter_fields_get_their_own_shape() -> None:
+    repository = DepartmentRepository(session_factory=None)
+
+    by_name = repository._query_shape(
+        COLUMNS, JOINS, [{"field": "Department.name", "op": "=", "value": "IT"}]
+    )
+    by_code = repository._query_shape(
+        COLUMNS, JOINS, [{"field": "Department.code", "op": "=", "value": "IT"}]
+    )
+
+    assert by_name is not by_code
@@ -0,0 +1,41 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.exceptions import NotFoundError
+from app.repository.user_repository import UserRepository
+
+
+def _returns(session: AsyncMock, returned: object) -> None:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = returned
+    session.execute.return_value = result
+
+
+def test_update_attr_is_a_single_returning_statement(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    user = object()
+    _returns(session, user)
+    repository = UserRepository(session_factory=session_factory)
+
+    assert asyncio.run(repository.update_attr(1, "first_name", "Ada")) is user
+    assert session.execute.await_count == 1
+    stmt = session.execute.await_args.args[0]
+    assert "RETURNING" in str(stmt)
+
+
+def test_update_and_delete_raise_not_found_on_miss(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    _returns(session, None)
+    repository = UserRepository(session_factory=session_factory)
+
+    with pytest.raises(NotFoundError):
+        asyncio.run(repository.update_attr(404, "first_name", "Ada"))
+    with pytest.raises(NotFoundError):
+        asyncio.run(repository.delete_by_id(404))
+    assert session.execute.await_count == 2
@@ -0,0 +1,28 @@
+from sqlalchemy.dialects import postgresql
+
+from app.repository.user_repository import UserRepository
+
+COLUMNS = ["User.id", "User.email"]
+
+
+def _where(field: str, op: str) -> str:
+    repository = UserRepository(session_factory=None)
+    query, _ = repository._query_shape(
+        COLUMNS, None, [{"field": field, "op": op, "value": "ada"}]
+    )
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    return sql.split("WHERE", 1)[1].split("ORDER BY", 1)[0]
+
+
+def test_tsvector_operators_use_text_search_match() -> None:
+    assert "search_vector @@ websearch_to_tsquery(" in _where(
+        "User.search_vector", "search"
+    )
+    assert "search_vector @@ to_tsquery(" in _where("User.search_vector", "prefix")
+
+
+def test_text_operators_use_trigram_friendly_predicates() -> None:
+    assert "email %% " in _where("User.email", "search")
+    prefix = _where("User.email", "prefix")
+    assert "email ILIKE concat(replace(" in prefix
+    assert "ESCAPE" in prefix
@@ -1,6 +1,5 @@
-from unittest.mock import MagicMock, patch
-
-from sqlmodel import select
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.tests_pre_start import init, logger
 
@@ -8,18 +7,16 @@ from app.tests_pre_start import init, logger
 def test_init_successful_connection() -> None:
     engine_mock = MagicMock()
 
-    session_mock = MagicMock()
-    exec_mock = MagicMock(return_value=True)
-    session_mock.configure_mock(**{"exec.return_value": exec_mock})
+    conn_mock = AsyncMock()
+    engine_mock.connect.return_value.__aenter__.return_value = conn_mock
 
     with (
-        patch("sqlmodel.Session", return_value=session_mock),
         patch.object(logger, "info"),
         patch.object(logger, "error"),
         patch.object(logger, "warn"),
     ):
         try:
-            init(engine_mock)
+            asyncio.run(init(engine_mock))
             connection_successful = True
         except Exception:
             connection_successful = False
@@ -28,6 +25,6 @@ def test_init_successful_connection() -> None:
             connection_successful
         ), "The database connection should be successful and not raise an exception."
 
-        assert session_mock.exec.called_once_with(
-            select(1)
-        ), "The session should execute a select statement once."
+        assert (
+            conn_mock.execute.await_count == 1
+        ), "The connection should execute a select statement once."
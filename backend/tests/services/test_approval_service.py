@@ -0,0 +1,164 @@
+import asyncio
+from collections.abc import Callable
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.dataloader import DataLoader
+from app.core.exceptions import ValidationError
+from app.core.pagination import encode_cursor
+from app.services.approval_service import ApprovalService
+
+
+class _Queue:
+    """Pending requests of one kind, paged the way the partial-index query does"""
+
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = sorted(rows, key=lambda row: (row["created_at"], row["id"]))
+
+    async def pending_for_supervisor(
+        self, supervisor_id: int, after: tuple[datetime, int] | None, limit: int
+    ) -> list[dict]:
+        return [
+            row
+            for row in self.rows
+            if after is None or (row["created_at"], row["id"]) > after
+        ][:limit]
+
+
+class _Users:
+    """User lookups through a DataLoader, recording each batch"""
+
+    def __init__(self) -> None:
+        self.batches: list[list[int]] = []
+
+    async def _read_by_ids(self, ids: list[int]) -> dict:
+        self.batches.append(ids)
+        names = {3: ("Ada", "Lovelace"), 4: ("Alan", "Turing")}
+        return {
+            id: SimpleNamespace(first_name=names[id][0], last_name=names[id][1])
+            for id in ids
+            if id in names
+        }
+
+    def loader(self) -> DataLoader:
+        return DataLoader(self._read_by_ids)
+
+
+def _leave(id: int, hour: int, user_id: int = 3) -> dict:
+    return {
+        "id": id,
+        "user_id": user_id,
+        "leave_type_id": 2,
+        "start_date": date(2026, 3, 2),
+        "end_date": date(2026, 3, 3),
+        "number_of_days": 2,
+        "reason": None,
+        "created_at": datetime(2026, 3, 1, hour),
+    }
+
+
+def _wfh(id: int, hour: int) -> dict:
+    return {
+        "id": id,
+        "user_id": 4,
+        "request_date": date(2026, 3, 4),
+        "reason": None,
+        "created_at": datetime(2026, 3, 1, hour),
+    }
+
+
+def test_inbox_pages_through_both_queues_in_created_order() -> None:
+    # Equal created_at values across and within the queues exercise every cursor case
+    service = ApprovalService(
+        _Queue([_leave(1, 8), _leave(2, 9), _leave(3, 9), _leave(4, 11)]),
+        _Queue([_wfh(1, 9), _wfh(2, 9), _wfh(3, 10)]),
+        _Users(),
+    )
+
+    seen, after = [], None
+    while True:
+        page = asyncio.run(service.get_inbox(1, after, limit=2))
+        assert len(page["items"]) <= 2
+        seen += [(item.kind, item.id) for item in page["items"]]
+        if not page["has_next"]:
+            break
+        after = page["next_cursor"]
+
+    assert seen == [
+        ("leave", 1),
+        ("leave", 2),
+        ("leave", 3),
+        ("wfh", 1),
+        ("wfh", 2),
+        ("wfh", 3),
+        ("leave", 4),
+    ]
+
+
+def test_employees_of_a_page_are_loaded_in_one_batch() -> None:
+    users = _Users()
+    service = ApprovalService(
+        _Queue([_leave(1, 8), _leave(2, 9)]), _Queue([_wfh(1, 9)]), users
+    )
+
+    page = asyncio.run(service.get_inbox(1))
+
+    assert [(item.first_name, item.last_name) for item in page["items"]] == [
+        ("Ada", "Lovelace"),
+        ("Ada", "Lovelace"),
+        ("Alan", "Turing"),
+    ]
+    assert users.batches == [[3, 4]]
+
+
+def test_wfh_items_span_their_request_date() -> None:
+    service = ApprovalService(_Queue([]), _Queue([_wfh(1, 9)]), _Users())
+
+    page = asyncio.run(service.get_inbox(1))
+
+    assert page["items"][0].start_date == page["items"][0].end_date == date(2026, 3, 4)
+    assert page["has_next"] is False and page["next_cursor"] is None
+
+
+def test_requests_of_deleted_employees_are_left_out() -> None:
+    service = ApprovalService(
+        _Queue([_leave(1, 8), _leave(2, 9, user_id=5)]), _Queue([]), _Users()
+    )
+
+    page = asyncio.run(service.get_inbox(1))
+
+    assert [item.id for item in page["items"]] == [1]
+
+
+def test_malformed_cursor_is_rejected() -> None:
+    service = ApprovalService(_Queue([]), _Queue([]), _Users())
+
+    with pytest.raises(ValidationError):
+        asyncio.run(
+            service.get_inbox(1, encode_cursor([datetime(2026, 3, 1), "overtime", 1]))
+        )
+    with pytest.raises(ValidationError):
+        asyncio.run(service.get_inbox(1, encode_cursor(["yesterday", "leave", 1])))
+
+
+def test_assigning_a_supervisor_moves_the_pending_requests_along(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    leaves, wfh, users = _Queue([]), _Queue([]), _Users()
+    for repository in (leaves, wfh):
+        repository.session_factory = session_factory
+        repository.reroute_pending = AsyncMock(return_value=1)
+    users.read_by_id = AsyncMock()
+    users.update_attr = AsyncMock(return_value="user")
+    service = ApprovalService(leaves, wfh, users)
+
+    assert asyncio.run(service.assign_supervisor(3, 1)) == "user"
+    users.update_attr.assert_awaited_once_with(3, "supervisor_id", 1)
+    leaves.reroute_pending.assert_awaited_once_with(session, 3, 1)
+    wfh.reroute_pending.assert_awaited_once_with(session, 3, 1)
+    with pytest.raises(ValidationError):
+        asyncio.run(service.assign_supervisor(3, 3))
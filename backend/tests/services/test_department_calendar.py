@@ -0,0 +1,86 @@
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.absence import absence_cache, record_absence_change
+from app.core.exceptions import ValidationError
+from app.services.department_service import DepartmentService
+
+MEMBERS = [(1, "Ada", "Lovelace"), (2, "Alan", "Turing")]
+
+
+def _service() -> tuple[DepartmentService, MagicMock]:
+    repository = MagicMock()
+    repository.read_by_id = AsyncMock()
+    repository.get_absence_rows = AsyncMock(
+        side_effect=lambda department_id, year: (
+            MEMBERS,
+            [(1, date(2025, 12, 31), date(2026, 1, 2), "approved")],
+            [(2, date(2026, 1, 2), "pending")],
+        )
+    )
+    return DepartmentService(repository), repository
+
+
+def test_calendar_spans_years_and_is_served_from_the_cache() -> None:
+    absence_cache.clear()
+    service, repository = _service()
+
+    calendar = asyncio.run(
+        service.get_calendar(7, date(2025, 12, 30), date(2026, 1, 3))
+    )
+
+    assert [member.days for member in calendar["members"]] == [".LLL.", "...w."]
+    assert calendar["off_per_day"] == [0, 1, 1, 1, 0]
+    assert repository.get_absence_rows.await_count == 2
+
+    asyncio.run(service.get_calendar(7, date(2026, 1, 1), date(2026, 1, 31)))
+    assert repository.get_absence_rows.await_count == 2
+    absence_cache.clear()
+
+
+def test_changes_are_applied_to_the_cached_calendar() -> None:
+    absence_cache.clear()
+    service, repository = _service()
+    asyncio.run(service.get_calendar(7, date(2026, 1, 1), date(2026, 1, 5)))
+
+    record_absence_change(
+        [
+            (2, "leave", date(2026, 1, 5), date(2026, 1, 5), "pending"),
+            (1, "leave", date(2025, 12, 31), date(2026, 1, 2), "cancelled"),
+        ]
+    )
+    calendar = asyncio.run(service.get_calendar(7, date(2026, 1, 1), date(2026, 1, 5)))
+
+    assert [member.days for member in calendar["members"]] == [".....", ".w..l"]
+    assert repository.get_absence_rows.await_count == 1
+    absence_cache.clear()
+
+
+def test_calendar_window_is_validated() -> None:
+    service, _ = _service()
+
+    with pytest.raises(ValidationError):
+        asyncio.run(service.get_calendar(7, date(2026, 2, 1), date(2026, 1, 1)))
+    with pytest.raises(ValidationError):
+        asyncio.run(service.get_calendar(7, date(2026, 1, 1), date(2027, 1, 2)))
+
+
+def test_calendar_is_for_members_and_their_supervisors() -> None:
+    service, repository = _service()
+    repository.has_member_supervised_by = AsyncMock(
+        side_effect=lambda department_id, supervisor_id: supervisor_id == 1
+    )
+
+    assert asyncio.run(
+        service.can_view_calendar(SimpleNamespace(id=5, department_id=7), 7)
+    )
+    assert asyncio.run(
+        service.can_view_calendar(SimpleNamespace(id=1, department_id=3), 7)
+    )
+    assert not asyncio.run(
+        service.can_view_calendar(SimpleNamespace(id=5, department_id=3), 7)
+    )
@@ -0,0 +1,286 @@
+import asyncio
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.exceptions import ConflictError, ValidationError
+from app.core.workdays import HolidayCalendars
+from app.model.leave_balance_model import EmployeeLeaveBalance
+from app.schema.leave_request_schema import LeaveRequestApply, LeaveRequestImport
+from app.services.leave_service import LeaveService, used_days_delta
+
+
+def _service(
+    session_factory: Callable[..., Any], status: str, available: str = "10"
+) -> tuple[LeaveService, MagicMock, MagicMock]:
+    leave = SimpleNamespace(
+        id=7,
+        user_id=3,
+        leave_type_id=2,
+        status=status,
+        number_of_days=Decimal("2.5"),
+        start_date=date(2026, 3, 2),
+        end_date=date(2026, 3, 4),
+    )
+    balance = EmployeeLeaveBalance(
+        id=11,
+        employee_id=3,
+        leave_type_id=2,
+        year=2026,
+        total_days=Decimal(available),
+        used_days=Decimal(0),
+        carried_forward_days=Decimal(0),
+    )
+
+    leaves = MagicMock(session_factory=session_factory)
+    leaves.lock = AsyncMock(return_value=leave)
+    leaves.set_status = AsyncMock(
+        side_effect=lambda session, id, values: SimpleNamespace(
+            **{**vars(leave), **values}
+        )
+    )
+    leaves.lock_employees = AsyncMock(
+        return_value={
+            3: SimpleNamespace(id=3, department_id=None, supervisor_id=1),
+            4: SimpleNamespace(id=4, department_id=5, supervisor_id=1),
+        }
+    )
+    leaves.find_overlap = AsyncMock(return_value=None)
+    leaves.insert = AsyncMock(
+        side_effect=lambda session, values: SimpleNamespace(**values)
+    )
+    balances = MagicMock()
+    balances.lock_balance = AsyncMock(return_value=balance)
+    balances.add_used_days = AsyncMock()
+    holidays = MagicMock()
+    # Friday 2026-03-06 is a company holiday
+    holidays.get_calendars = AsyncMock(
+        return_value=HolidayCalendars([(None, date(2026, 3, 6), False)])
+    )
+    wfh = MagicMock()
+    wfh.find_between = AsyncMock(return_value=None)
+    return LeaveService(leaves, balances, holidays, wfh), leaves, balances
+
+
+def test_used_days_delta() -> None:
+    assert used_days_delta("pending", "approved", Decimal("1.5")) == Decimal("1.5")
+    assert used_days_delta("approved", "cancelled", Decimal("1.5")) == Decimal("-1.5")
+    assert used_days_delta("approved", "withdrawn", Decimal("1.5")) == Decimal("-1.5")
+    assert used_days_delta("pending", "rejected", Decimal("1.5")) == 0
+
+
+def test_approve_locks_and_books_days_in_one_session(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    service, leaves, balances = _service(session_factory, "pending")
+
+    approved = asyncio.run(service.approve(7, actor_id=1))
+
+    assert approved.status == "approved" and approved.approved_rejected_by == 1
+    leaves.lock.assert_awaited_once_with(session, 7)
+    balances.lock_balance.assert_awaited_once_with(session, 3, 2, 2026)
+    balances.add_used_days.assert_awaited_once_with(session, 11, Decimal("2.5"))
+
+
+def test_cancel_of_approved_request_gives_days_back(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    service, _, balances = _service(session_factory, "approved")
+
+    asyncio.run(service.cancel(7, actor_id=3))
+
+    balances.add_used_days.assert_awaited_once_with(session, 11, Decimal("-2.5"))
+
+
+def test_reject_and_pending_withdraw_leave_the_balance_alone(
+    session_factory: Callable[..., Any],
+) -> None:
+    service, _, balances = _service(session_factory, "pending")
+
+    asyncio.run(service.reject(7, actor_id=1))
+    asyncio.run(service.withdraw(7, actor_id=3))
+
+    balances.lock_balance.assert_not_awaited()
+    balances.add_used_days.assert_not_awaited()
+
+
+def test_approve_fails_without_enough_balance(
+    session_factory: Callable[..., Any],
+) -> None:
+    service, leaves, balances = _service(session_factory, "pending", available="2")
+
+    with pytest.raises(ValidationError):
+        asyncio.run(service.approve(7, actor_id=1))
+    balances.add_used_days.assert_not_awaited()
+    leaves.set_status.assert_not_awaited()
+
+
+def test_transition_from_a_closed_status_is_rejected(
+    session_factory: Callable[..., Any],
+) -> None:
+    service, leaves, _ = _service(session_factory, "rejected")
+
+    with pytest.raises(ValidationError):
+        asyncio.run(service.approve(7, actor_id=1))
+    leaves.set_status.assert_not_awaited()
+
+
+def test_expired_carry_forward_does_not_count() -> None:
+    balance = EmployeeLeaveBalance(
+        total_days=Decimal(10),
+        used_days=Decimal(4),
+        carried_forward_days=Decimal(3),
+        carry_forward_expiry_date=date(2026, 3, 31),
+    )
+
+    assert balance.available_days(date(2026, 3, 1)) == Decimal(9)
+    assert balance.available_days(date(2026, 4, 1)) == Decimal(6)
+
+
+def test_apply_counts_the_working_days(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    service, leaves, _ = _service(session_factory, "pending")
+    schema = LeaveRequestApply(
+        leave_type_id=2,
+        start_date=date(2026, 3, 2),
+        end_date=date(2026, 3, 9),
+        end_half_day=True,
+    )
+
+    created = asyncio.run(service.apply(3, schema))
+
+    assert created.number_of_days == Decimal("4.5")
+    assert created.user_id == 3 and created.status == "pending"
+    assert created.supervisor_id == 1
+    leaves.lock_employees.assert_awaited_once_with(session, [3])
+
+
+def test_apply_refuses_overlapping_leave_and_wfh_days(
+    session_factory: Callable[..., Any],
+) -> None:
+    service, leaves, _ = _service(session_factory, "pending")
+    schema = LeaveRequestApply(
+        leave_type_id=2, start_date=date(2026, 3, 2), end_date=date(2026, 3, 3)
+    )
+
+    leaves.find_overlap.return_value = 12
+    with pytest.raises(ConflictError):
+        asyncio.run(service.apply(3, schema))
+
+    leaves.find_overlap.return_value = None
+    service.wfh_repository.find_between.return_value = date(2026, 3, 3)
+    with pytest.raises(ConflictError):
+        asyncio.run(service.apply(3, schema))
+    leaves.insert.assert_not_awaited()
+
+
+def test_import_reports_overlaps_within_the_batch_and_with_stored_requests(
+    session_factory: Callable[..., Any],
+) -> None:
+    service, leaves, _ = _service(session_factory, "pending")
+    leaves.active_intervals = AsyncMock(
+        return_value=[(3, date(2026, 3, 2), date(2026, 3, 3), 40)]
+    )
+    leaves.insert_many = AsyncMock(
+        side_effect=lambda session, rows: [100 + i for i in range(len(rows))]
+    )
+    service.wfh_repository.active_days = AsyncMock(
+        return_value=[(4, date(2026, 3, 12), 8)]
+    )
+    rows = [
+        LeaveRequestImport(
+            user_id=3,
+            leave_type_id=2,
+            start_date=date(2026, 3, 3),
+            end_date=date(2026, 3, 4),
+        ),
+        LeaveRequestImport(
+            user_id=4,
+            leave_type_id=2,
+            start_date=date(2026, 3, 9),
+            end_date=date(2026, 3, 10),
+        ),
+        LeaveRequestImport(
+            user_id=4,
+            leave_type_id=2,
+            start_date=date(2026, 3, 10),
+            end_date=date(2026, 3, 11),
+        ),
+        LeaveRequestImport(
+            user_id=4,
+            leave_type_id=2,
+            start_date=date(2026, 3, 12),
+            end_date=date(2026, 3, 12),
+        ),
+        LeaveRequestImport(
+            user_id=9,
+            leave_type_id=2,
+            start_date=date(2026, 3, 9),
+            end_date=date(2026, 3, 9),
+        ),
+        LeaveRequestImport(
+            user_id=3,
+            leave_type_id=2,
+            start_date=date(2026, 3, 7),
+            end_date=date(2026, 3, 8),
+        ),
+    ]
+
+    report = asyncio.run(service.import_leaves(rows))
+
+    assert (report["total"], report["inserted"], report["failed"]) == (6, 1, 5)
+    errors = [row.get("error") for row in report["rows"]]
+    assert errors[0] == "overlaps leave request 40"
+    assert errors[1] is None and report["rows"][1]["id"] == 100
+    assert errors[2] == "overlaps row 1"
+    assert errors[3] == "overlaps the WFH request on 2026-03-12"
+    assert errors[4] == "not found user id : 9"
+    assert errors[5] == "the leave request has no working days"  # a weekend
+    (inserted,) = leaves.insert_many.await_args.args[1]
+    assert inserted["number_of_days"] == Decimal(2) and inserted["user_id"] == 4
+
+
+def test_recompute_updates_changed_days_and_approved_balances(
+    session: AsyncMock, session_factory: Callable[..., Any]
+) -> None:
+    service, leaves, balances = _service(session_factory, "pending")
+    monday, friday, next_monday = date(2026, 3, 2), date(2026, 3, 6), date(2026, 3, 9)
+    leaves.lock_open_requests = AsyncMock(
+        return_value=[
+            # id, user_id, leave_type_id, status, start, end, start_half, end_half, days, department_id
+            (1, 3, 2, "approved", monday, friday, False, False, Decimal(5), None),
+            (
+                2,
+                3,
+                2,
+                "approved",
+                next_monday,
+                next_monday,
+                False,
+                False,
+                Decimal(1),
+                None,
+            ),
+            (3, 4, 2, "pending", friday, next_monday, False, False, Decimal(2), 5),
+        ]
+    )
+    leaves.set_days = AsyncMock()
+
+    report = asyncio.run(service.recompute_days(since=friday))
+
+    assert report == {"total": 3, "changed": 2}
+    leaves.set_days.assert_awaited_once_with(
+        session,
+        [
+            {"id": 1, "number_of_days": Decimal(4)},
+            {"id": 3, "number_of_days": Decimal(1)},
+        ],
+    )
+    balances.lock_balance.assert_awaited_once_with(session, 3, 2, 2026)
+    balances.add_used_days.assert_awaited_once_with(session, 11, Decimal(-1))
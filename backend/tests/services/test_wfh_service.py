@@ -0,0 +1,69 @@
+import asyncio
+from collections.abc import Callable
+from datetime import date
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.schema.wfh_request_schema import WfhRequestApply
+from app.services.wfh_service import WfhService
+
+
+def _service(
+    session_factory: Callable[..., Any], status: str = "pending"
+) -> tuple[WfhService, MagicMock]:
+    request = SimpleNamespace(
+        id=9, user_id=3, supervisor_id=1, status=status, request_date=date(2026, 3, 4)
+    )
+    wfh = MagicMock()
+    wfh.session_factory = session_factory
+    wfh.insert = AsyncMock(
+        side_effect=lambda session, values: SimpleNamespace(**values)
+    )
+    wfh.lock = AsyncMock(return_value=request)
+    wfh.set_status = AsyncMock(
+        side_effect=lambda session, id, values: SimpleNamespace(
+            **{**vars(request), **values}
+        )
+    )
+    leaves = MagicMock()
+    leaves.lock_employees = AsyncMock(
+        return_value={3: SimpleNamespace(id=3, department_id=None, supervisor_id=1)}
+    )
+    leaves.find_overlap = AsyncMock(return_value=None)
+    return WfhService(wfh, leaves), wfh
+
+
+def test_apply_routes_the_request_to_the_employees_supervisor(
+    session_factory: Callable[..., Any],
+) -> None:
+    service, _ = _service(session_factory)
+
+    # The employee does not get to pick their approver
+    schema = WfhRequestApply.model_validate(
+        {"request_date": "2026-03-04", "supervisor_id": 3}
+    )
+    created = asyncio.run(service.apply(3, schema))
+
+    assert created.supervisor_id == 1
+    assert created.request_date == date(2026, 3, 4) and created.status == "pending"
+
+
+def test_approve_records_the_approver(session_factory: Callable[..., Any]) -> None:
+    service, wfh = _service(session_factory)
+
+    approved = asyncio.run(service.transition(9, "approve", 1, "enjoy"))
+
+    assert approved.status == "approved" and approved.approved_rejected_by == 1
+    assert approved.comments == "enjoy"
+    wfh.lock.assert_awaited_once()
+
+
+def test_closed_wfh_requests_stay_closed(session_factory: Callable[..., Any]) -> None:
+    service, _ = _service(session_factory, "rejected")
+
+    with pytest.raises(ValidationError):
+        asyncio.run(service.transition(9, "approve", 1))